@@ -19,6 +19,12 @@ from . import operators
 from . import menus
 from . import panels
 from . import icons
+from . import mesh_analysis
+from . import spatial
+from . import dashboard
+from . import inspector
+from . import sweep
+from . import api
 
 def register():
     # Register modules in the correct order
@@ -27,6 +33,12 @@ def register():
     menus.register()
     panels.register()
     
+    # Keep the spatial selection tree in sync with the scene
+    spatial.register()
+    dashboard.register()
+    inspector.register()
+    sweep.register()
+    
     # Load custom icons
     icons.load_icons()
     
@@ -37,9 +49,17 @@ def unregister():
     # Unregister modules in the reverse order
     menus.unregister_keymaps()
     
+    sweep.unregister()
+    inspector.unregister()
+    dashboard.unregister()
+    spatial.unregister()
+    
     # Unload custom icons
     icons.unload_icons()
     
+    # Stop the mesh analysis worker threads
+    mesh_analysis.shutdown()
+    
     panels.unregister()
     menus.unregister()
     operators.unregister()
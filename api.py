@@ -0,0 +1,162 @@
+# Functions for scripts that set up rigid bodies in bulk. They take object
+# lists and never change the selection or the active object:
+#
+#   from quick_rigid import api
+#   api.add_bodies(objects, 'ACTIVE', collision_shape='CONVEX_HULL', friction=0.8)
+#   api.compute_mass(objects, density=2700.0)
+#   api.bake((1, 250))
+import bpy
+import numpy as np
+
+from . import bake as bake_module
+from . import bake_store
+from . import batch
+from . import cache_manager
+from . import incremental
+from . import mesh_analysis
+from . import quality
+from .presets import RigidBodyPresetManager
+
+def _bodies(objs):
+    return [obj for obj in objs if obj.rigid_body is not None]
+
+def _check_settings(settings):
+    """Raise TypeError for names that aren't rigid body settings"""
+    known = bpy.types.RigidBodyObject.bl_rna.properties.keys()
+    unknown = [name for name in settings if name not in known]
+    if unknown:
+        raise TypeError(f"Unknown rigid body settings: {', '.join(unknown)}")
+
+def set_settings(objs, **settings):
+    """Set rigid body settings on every object that has a rigid body, returns the count"""
+    _check_settings(settings)
+    bodies = _bodies(objs)
+    # The margin only counts once it is enabled
+    if 'collision_margin' in settings:
+        settings.setdefault('use_margin', True)
+    for obj in bodies:
+        rb = obj.rigid_body
+        for name, value in settings.items():
+            setattr(rb, name, value)
+    return len(bodies)
+
+def add_bodies(objs, type='ACTIVE', **settings):
+    """Give mesh objects a rigid body of the given type and settings, returns the bodies"""
+    _check_settings(settings)
+    objs = [obj for obj in objs if obj.type == 'MESH']
+    batch.add_rigid_bodies(bpy.context, objs, type)
+    set_settings(objs, type=type, **settings)
+    return _bodies(objs)
+
+def remove_bodies(objs):
+    """Remove the rigid bodies of many objects, returns the count"""
+    return batch.remove_rigid_bodies(bpy.context, objs)
+
+def apply_preset(objs, name, scene=None):
+    """Apply a stored preset to every object with a rigid body, returns the count"""
+    scene = scene or bpy.context.scene
+    if name not in scene.rigid_body_presets:
+        raise KeyError(f"No preset named '{name}'")
+    return sum(1 for obj in _bodies(objs) if RigidBodyPresetManager.apply_preset_by_name(name, obj))
+
+def _is_closed(mesh):
+    """True if every edge of the mesh is shared by exactly two faces"""
+    if len(mesh.edges) == 0:
+        return False
+    edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", edges)
+    return bool(np.all(np.bincount(edges, minlength=len(mesh.edges)) == 2))
+
+def compute_mass(objs, density):
+    """Set the mass of rigid bodies from their mesh volume and a density (kg/m³), returns the masses"""
+    bodies = [obj for obj in _bodies(objs) if obj.type == 'MESH']
+    if not bodies:
+        return np.empty(0)
+
+    analysis = mesh_analysis.analyze_meshes([obj.data for obj in bodies])
+    volumes = np.array([analysis[obj.data.session_uid]['volume'] for obj in bodies])
+
+    # The signed volume of an open mesh means nothing, use its convex hull instead
+    open_bodies = [index for index, obj in enumerate(bodies) if not _is_closed(obj.data)]
+    if open_bodies:
+        hulls = mesh_analysis.analyze_meshes([bodies[index].data for index in open_bodies], with_hull=True)
+        volumes[open_bodies] = [hulls[bodies[index].data.session_uid]['hull_volume'] for index in open_bodies]
+
+    # Flat meshes have no hull volume either, use their bounding box
+    extents = np.array([np.subtract(analysis[obj.data.session_uid]['max'], analysis[obj.data.session_uid]['min'])
+                        for obj in bodies])
+    volumes = np.where(volumes > 0.0, volumes, extents.prod(axis=1))
+
+    # Object scale (and rotation) changes the volume by the determinant
+    matrices = np.array([np.array(obj.matrix_world)[:3, :3] for obj in bodies])
+    unit_scale = bpy.context.scene.unit_settings.scale_length
+    masses = volumes * np.abs(np.linalg.det(matrices)) * unit_scale ** 3 * density
+    masses = np.maximum(masses, 0.001)
+
+    for obj, mass in zip(bodies, masses.tolist()):
+        obj.rigid_body.mass = mass
+    return masses
+
+def _set_frame_range(scene, frame_range):
+    if frame_range is not None:
+        point_cache = scene.rigidbody_world.point_cache
+        point_cache.frame_start, point_cache.frame_end = frame_range
+
+def bake_job(scene=None, frame_range=None, settle=None):
+    """Create a BakeJob, settle is (speed, energy, frames) to stop once everything rests"""
+    scene = scene or bpy.context.scene
+    _set_frame_range(scene, frame_range)
+
+    job = bake_module.BakeJob(scene)
+    if settle is not None:
+        job.settle = bake_module.SettleDetector(scene, *settle)
+    return job
+
+def restore_identical(scene):
+    """Restore a stored bake of the same simulation, returns (content hash, restored)"""
+    content_hash = bake_store.simulation_hash(scene)
+    if not bake_store.restore_bake(scene, content_hash):
+        return content_hash, False
+    incremental.take_snapshot(scene)
+    return content_hash, True
+
+def finish_bake(scene, job, content_hash=None):
+    """Bookkeeping after a bake job has finished"""
+    quality.record_bake_time(scene, job.elapsed)
+    # Keep disk bakes so an identical simulation can be restored later
+    if content_hash is not None:
+        bake_store.store_bake(scene, content_hash, job.frames_done)
+    incremental.take_snapshot(scene)
+
+def bake(frame_range=None, scene=None, settle=None, reuse=True):
+    """Bake the simulation synchronously, returns a summary of the bake
+
+    Replaces an existing bake. With reuse, an identical simulation stored
+    before is restored instead of simulated, and new disk bakes are stored."""
+    scene = scene or bpy.context.scene
+    if scene.rigidbody_world is None:
+        raise RuntimeError("The scene has no rigid body world")
+    point_cache = scene.rigidbody_world.point_cache
+    if point_cache.is_baked:
+        with bpy.context.temp_override(scene=scene, point_cache=point_cache):
+            bpy.ops.ptcache.free_bake()
+
+    # The range is part of the simulation hash, so it is set before the reuse check
+    _set_frame_range(scene, frame_range)
+    content_hash = None
+    if reuse:
+        content_hash, restored = restore_identical(scene)
+        if restored:
+            return {'frames': bake_store.last_reuse['frames'], 'restored': True,
+                    'time': bake_store.last_reuse['time']}
+
+    # Large bakes go to disk if the user allowed it, before the job starts filling the cache
+    if not point_cache.use_disk_cache and cache_manager.exceeds_memory_budget(scene):
+        if scene.quick_rigid_settings.auto_spill:
+            cache_manager.spill_to_disk(scene)
+
+    job = bake_job(scene, settle=settle)
+    if not job.run():
+        raise RuntimeError("The simulation was cached but could not be converted to a bake")
+    finish_bake(scene, job, content_hash)
+    return dict(bake_module.last_result, restored=False)
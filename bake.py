@@ -0,0 +1,247 @@
+import bpy
+import numpy as np
+import time
+
+from . import batch
+
+# The bake job currently driven by the modal bake operator (only one at a time)
+_active_job = None
+
+# Summary of the last finished bake, shown in the Bake box
+last_result = None
+
+def get_active_job():
+    """Return the running bake job, or None if nothing is baking"""
+    return _active_job
+
+def set_active_job(job):
+    """Register the bake job the panel should report progress for"""
+    global _active_job
+    _active_job = job
+
+def redraw_ui(context):
+    """Redraw the 3D View sidebars so progress stays up to date"""
+    wm = context.window_manager
+    for window in wm.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                for region in area.regions:
+                    if region.type == 'UI':
+                        region.tag_redraw()
+
+def format_duration(seconds):
+    """Format a duration in seconds as a short human readable string"""
+    if seconds is None:
+        return "--"
+    seconds = int(round(seconds))
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m {seconds:02d}s"
+    if minutes:
+        return f"{minutes}m {seconds:02d}s"
+    return f"{seconds}s"
+
+def body_speeds(previous, current, fps):
+    """Linear and angular speed of bodies between two consecutive frames of world matrices"""
+    # Linear speed from the change in position since the last frame
+    velocity = (current[:, :3, 3] - previous[:, :3, 3]) * fps
+    speed = np.linalg.norm(velocity, axis=1)
+
+    # Angular speed from the relative rotation (scale removed) since the last frame
+    rotation = current[:, :3, :3] / np.linalg.norm(current[:, :3, :3], axis=1, keepdims=True)
+    previous_rotation = previous[:, :3, :3] / np.linalg.norm(previous[:, :3, :3], axis=1, keepdims=True)
+    trace = np.einsum('nji,nji->n', previous_rotation, rotation)
+    angular_speed = np.arccos(np.clip((trace - 1.0) / 2.0, -1.0, 1.0)) * fps
+    return speed, angular_speed
+
+class SettleDetector:
+    """Tracks kinetic energy and moving bodies to find when a simulation comes to rest"""
+
+    def __init__(self, scene, speed_threshold, energy_threshold, frames_required, angular_threshold=0.1):
+        # A world without a collection has nothing to settle
+        self.objects = batch.world_bodies(scene)
+        rb = batch.gather_rigid_body(self.objects or [], ("type", "enabled", "mass"))
+        self.active = (rb["type"] == 'ACTIVE') & rb["enabled"].astype(bool)
+        self.masses = rb["mass"].astype(np.float64)[self.active]
+
+        self.fps = scene.render.fps / scene.render.fps_base
+        self.speed_threshold = speed_threshold
+        self.energy_threshold = energy_threshold
+        self.angular_threshold = angular_threshold
+        self.frames_required = frames_required
+
+        self.previous = None
+        self.quiet_frames = 0
+        self.energy = None
+        self.moving = None
+        self.settled_frame = None
+
+    def update(self, frame):
+        """Measure the frame that was just simulated, returns True once settled"""
+        if self.objects is None:
+            return False
+        matrices = batch.gather_matrices(self.objects)[self.active].astype(np.float64)
+        if self.previous is None or not len(matrices):
+            self.previous = matrices
+            return False
+
+        speed, angular_speed = body_speeds(self.previous, matrices, self.fps)
+        self.previous = matrices
+        self.energy = float(0.5 * np.sum(self.masses * speed ** 2))
+        self.moving = int(np.count_nonzero((speed > self.speed_threshold) |
+                                           (angular_speed > self.angular_threshold)))
+
+        if self.energy <= self.energy_threshold and self.moving == 0:
+            self.quiet_frames += 1
+        else:
+            self.quiet_frames = 0
+
+        if self.quiet_frames >= self.frames_required:
+            self.settled_frame = frame - self.frames_required
+            return True
+        return False
+
+class BakeJob:
+    """Steps the rigid body simulation frame by frame to fill the point cache"""
+
+    # Weight of the newest frame in the running average of frame durations
+    SMOOTHING = 0.1
+
+    def __init__(self, scene, frame_start=None, frame_end=None):
+        self.scene = scene
+        point_cache = scene.rigidbody_world.point_cache
+        self.frame_start = point_cache.frame_start if frame_start is None else frame_start
+        self.frame_end = point_cache.frame_end if frame_end is None else frame_end
+        self.original_frame = scene.frame_current
+
+        self.frame = self.frame_start
+        self.start_time = None
+        self.end_time = None
+        self.average_frame_time = None
+        self.cancelled = False
+        self.cancel_requested = False
+        self.finished = False
+
+        # Optional SettleDetector that ends the bake once everything is at rest
+        self.settle = None
+        self.original_frame_end = self.frame_end
+
+    @property
+    def total_frames(self):
+        return max(self.frame_end - self.frame_start, 1)
+
+    @property
+    def frames_done(self):
+        return self.frame - self.frame_start
+
+    @property
+    def progress(self):
+        """Fraction of the frame range that has been simulated"""
+        return min(max(self.frames_done / self.total_frames, 0.0), 1.0)
+
+    @property
+    def elapsed(self):
+        if self.start_time is None:
+            return 0.0
+        end = self.end_time if self.end_time is not None else time.perf_counter()
+        return end - self.start_time
+
+    @property
+    def fps(self):
+        """Frames per second from the running average frame time"""
+        if not self.average_frame_time:
+            return None
+        return 1.0 / self.average_frame_time
+
+    @property
+    def eta(self):
+        """Estimated seconds remaining, based on the running average"""
+        if self.average_frame_time is None:
+            return None
+        return (self.frame_end - self.frame) * self.average_frame_time
+
+    def start(self):
+        """Jump to the start frame so the simulation begins from its initial state"""
+        self.start_time = time.perf_counter()
+        self.scene.frame_set(self.frame_start)
+        if self.settle is not None:
+            # The initial state is the reference for the first simulated frame
+            self.settle.update(self.frame_start)
+
+    def step(self):
+        """Simulate the next frame, returns False once the range is complete"""
+        if self.frame >= self.frame_end:
+            return False
+
+        frame_begin = time.perf_counter()
+        self.frame += 1
+        self.scene.frame_set(self.frame)
+        frame_time = time.perf_counter() - frame_begin
+
+        # Exponential moving average keeps the ETA stable but responsive
+        if self.average_frame_time is None:
+            self.average_frame_time = frame_time
+        else:
+            self.average_frame_time += self.SMOOTHING * (frame_time - self.average_frame_time)
+
+        if self.settle is not None and self.settle.update(self.frame):
+            return False
+        return self.frame < self.frame_end
+
+    @property
+    def settled(self):
+        return self.settle is not None and self.settle.settled_frame is not None
+
+    @property
+    def time_saved(self):
+        """Estimated seconds saved by stopping at the settle frame"""
+        if not self.settled or self.average_frame_time is None:
+            return 0.0
+        return (self.original_frame_end - self.frame) * self.average_frame_time
+
+    def step_for(self, budget):
+        """Simulate frames until the time budget (in seconds) is used up"""
+        deadline = time.perf_counter() + budget
+        more = True
+        while more and time.perf_counter() < deadline:
+            more = self.step()
+        return more
+
+    def run(self):
+        """Simulate the whole range synchronously"""
+        self.start()
+        while self.step():
+            pass
+        return self.finish()
+
+    def finish(self):
+        """Turn the filled cache into a bake, returns True on success"""
+        self.end_time = time.perf_counter()
+        self.finished = True
+        point_cache = self.scene.rigidbody_world.point_cache
+        try:
+            with bpy.context.temp_override(scene=self.scene, point_cache=point_cache):
+                bpy.ops.ptcache.bake_from_cache()
+        except RuntimeError as e:
+            print(f"Quick Rigid: could not convert cache to bake: {e}")
+            return False
+
+        # The range is left as the user set it. A baked cache isn't simulated
+        # again, so past the settle frame the bodies hold their final state.
+        global last_result
+        last_result = {
+            'frames': self.frames_done,
+            'time': self.elapsed,
+            'settled_frame': self.settle.settled_frame if self.settled else None,
+            'time_saved': self.time_saved,
+        }
+        return True
+
+    def cancel(self):
+        """Stop baking and keep the frames that were already cached"""
+        self.end_time = time.perf_counter()
+        self.cancelled = True
+        # Jumping past the last simulated frame would simulate again, so stay
+        # inside the cached range when going back to the original frame
+        self.scene.frame_set(min(self.original_frame, self.frame))
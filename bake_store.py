@@ -0,0 +1,274 @@
+import bpy
+import hashlib
+import json
+import os
+import shutil
+import time
+import numpy as np
+
+from . import batch
+from . import cache_manager
+from . import mesh_analysis
+
+# Rigid body settings that change the outcome of a simulation
+BODY_SETTINGS = (
+    "type", "enabled", "kinematic", "mass", "friction", "restitution", "collision_shape",
+    "collision_margin", "use_margin", "mesh_source", "use_deform", "linear_damping",
+    "angular_damping", "use_deactivation", "use_start_deactivated",
+    "deactivate_linear_velocity", "deactivate_angular_velocity",
+)
+
+WORLD_SETTINGS = ("enabled", "time_scale", "substeps_per_frame", "solver_iterations", "use_split_impulse")
+
+CONSTRAINT_SETTINGS = ("type", "enabled", "disable_collisions", "use_breaking", "breaking_threshold",
+                       "use_override_solver_iterations", "solver_iterations")
+
+# Transform channels that place a body at the start frame, with their sizes
+TRANSFORM_CHANNELS = (
+    ("location", 3), ("rotation_euler", 3), ("rotation_quaternion", 4), ("rotation_axis_angle", 4),
+    ("scale", 3), ("delta_location", 3), ("delta_rotation_euler", 3),
+    ("delta_rotation_quaternion", 4), ("delta_scale", 3),
+)
+
+# Stored bakes keep their frames as <frame>_<index>.bphys next to a meta.json
+STORED_FILE = "{frame:06d}_{index:02d}.bphys"
+
+# Result of the last reuse check, shown in the Bake box
+last_reuse = None
+
+# (count, bytes) of the store, recomputed after it changes
+_size = None
+
+def store_directory(create=False):
+    """Directory of the local bake store, shared by all blend files"""
+    return bpy.utils.user_resource('DATAFILES', path="quick_rigid_bakes", create=create)
+
+def _settings(owner, names):
+    values = []
+    for name in names:
+        value = getattr(owner, name, None)
+        # Boolean arrays such as collision collections
+        if hasattr(value, "__len__") and not isinstance(value, str):
+            value = tuple(value)
+        values.append(value)
+    return tuple(values)
+
+def animation_keys(objects):
+    """Keyframes of every animated body, keyed by (object, data path, index)"""
+    curves = {}
+    for obj in objects:
+        fcurves = batch.object_fcurves(obj)
+        if fcurves is None:
+            continue
+        for fcurve in fcurves:
+            keys, interpolation = batch.gather_keyframes(fcurve)
+            curve = (fcurve.extrapolation, fcurve.mute, len(fcurve.modifiers))
+            curves[(obj.name, fcurve.data_path, fcurve.array_index)] = (keys, interpolation, curve)
+    return curves
+
+def _start_transform(obj, frame):
+    """Transform channels of an object and its parents at a frame, read without changing frames"""
+    fcurves = batch.object_fcurves(obj)
+    channels = [obj.rotation_mode]
+    for data_path, size in TRANSFORM_CHANNELS:
+        values = list(getattr(obj, data_path))
+        if fcurves is not None:
+            for index in range(size):
+                fcurve = fcurves.find(data_path, index=index)
+                if fcurve is not None and not fcurve.mute:
+                    values[index] = fcurve.evaluate(frame)
+        channels.append(tuple(values))
+    if obj.parent is not None:
+        channels.append((obj.parent_type, obj.parent_bone, tuple(tuple(row) for row in obj.matrix_parent_inverse),
+                         obj.parent.name, _start_transform(obj.parent, frame)))
+    return tuple(channels)
+
+def simulation_hash(scene, include_animation=True):
+    """Hash of every input that affects the rigid body simulation of a scene"""
+    rbw = scene.rigidbody_world
+    point_cache = rbw.point_cache
+    settings = scene.quick_rigid_settings
+    digest = hashlib.blake2b(digest_size=16)
+
+    def add(value):
+        digest.update(repr(value).encode("utf-8"))
+        digest.update(b"\0")
+
+    # Solver behaviour can change between Blender versions
+    add(bpy.app.version)
+    add(_settings(rbw, WORLD_SETTINGS))
+    add((point_cache.frame_start, point_cache.frame_end))
+    add((scene.use_gravity, tuple(scene.gravity), rbw.effector_weights.gravity, rbw.effector_weights.all))
+    add((scene.render.fps, scene.render.fps_base))
+    add((settings.use_settle_detection, settings.settle_speed, settings.settle_energy, settings.settle_frames))
+
+    objects = batch.world_bodies(scene)
+    if objects is None or len(objects) == 0:
+        return digest.hexdigest()
+
+    # Initial transforms are the ones at the start frame. They are read from the
+    # transform channels and F-Curves, so hashing never changes the scene's frame.
+    frame_start = point_cache.frame_start
+    add([obj.name for obj in objects])
+    add([_start_transform(obj, frame_start) for obj in objects])
+    add([_settings(obj.rigid_body, BODY_SETTINGS + ("collision_collections",)) for obj in objects])
+    digest.update(np.ascontiguousarray(batch.gather_bound_boxes(objects)).tobytes())
+
+    # Geometry of every mesh, with the modifier stack that may change it. Only
+    # the hash is needed, so nothing is written to the meshes.
+    meshes = {obj.data.session_uid: obj.data for obj in objects if obj.type == 'MESH'}
+    executor = mesh_analysis.get_executor()
+    jobs = {uid: executor.submit(mesh_analysis.geometry_hash, *mesh_analysis.read_geometry(mesh))
+            for uid, mesh in meshes.items()}
+    add([jobs[obj.data.session_uid].result() if obj.type == 'MESH' else None for obj in objects])
+    add([[(mod.type, mod.show_viewport) for mod in obj.modifiers] for obj in objects])
+
+    # Keyframed animation, e.g. of kinematic bodies
+    if include_animation:
+        for key, (keys, interpolation, curve) in sorted(animation_keys(objects).items()):
+            add((key, interpolation, curve))
+            digest.update(keys.tobytes())
+
+    if rbw.constraints is not None and len(rbw.constraints.objects):
+        constraints = rbw.constraints.objects
+        add([(obj.name,
+              _settings(obj.rigid_body_constraint, CONSTRAINT_SETTINGS),
+              getattr(obj.rigid_body_constraint.object1, "name", None),
+              getattr(obj.rigid_body_constraint.object2, "name", None))
+             for obj in constraints if obj.rigid_body_constraint is not None])
+        add([_start_transform(obj, frame_start) for obj in constraints])
+
+    return digest.hexdigest()
+
+def store_bake(scene, key, frames=None):
+    """Copy a finished disk bake into the store, returns True if it was stored
+
+    frames is the number of simulated frames the bake reported, a restore
+    reports the same count."""
+    point_cache = scene.rigidbody_world.point_cache
+    directory = cache_manager.cache_directory(point_cache)
+    if not point_cache.use_disk_cache or not point_cache.is_baked or directory is None:
+        return False
+
+    files = cache_manager.cache_files(directory, cache_manager.cache_file_name(scene.name, point_cache))
+    if not files:
+        return False
+
+    target = os.path.join(store_directory(create=True), key)
+    os.makedirs(target, exist_ok=True)
+    for frame, index, path in files:
+        shutil.copy2(path, os.path.join(target, STORED_FILE.format(frame=frame, index=index)))
+
+    with open(os.path.join(target, "meta.json"), "w") as f:
+        json.dump({
+            'frame_start': point_cache.frame_start,
+            'frame_end': point_cache.frame_end,
+            'frames': frames,
+            'files': len(files),
+            'created': time.time(),
+        }, f)
+
+    global _size
+    _size = None
+    evict(scene.quick_rigid_settings.bake_store_limit * 1024 * 1024, keep=key)
+    return True
+
+def _stored_bakes():
+    """(last used, bytes, path) of every stored bake, the meta file is touched on use"""
+    directory = store_directory()
+    bakes = []
+    if not os.path.isdir(directory):
+        return bakes
+    for entry in os.scandir(directory):
+        if not entry.is_dir():
+            continue
+        size = 0
+        used = 0.0
+        for item in os.scandir(entry.path):
+            try:
+                stat = item.stat()
+            except OSError:
+                continue
+            size += stat.st_size
+            if item.name == "meta.json":
+                used = stat.st_mtime
+        bakes.append((used, size, entry.path))
+    return bakes
+
+def evict(limit, keep=None):
+    """Delete the least recently used bakes until the store fits in limit bytes, returns the count"""
+    global _size
+    bakes = sorted(_stored_bakes())
+    total = sum(size for _, size, _ in bakes)
+    removed = 0
+    for _, size, path in bakes:
+        if total <= limit:
+            break
+        if os.path.basename(path) == keep:
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
+        removed += 1
+    if removed:
+        _size = None
+    return removed
+
+def restore_bake(scene, key):
+    """Put a stored bake in place of the scene's cache, returns True on success"""
+    global last_reuse
+    source = os.path.join(store_directory(), key)
+    meta_path = os.path.join(source, "meta.json")
+    if not os.path.isfile(meta_path) or not bpy.data.filepath:
+        return False
+    with open(meta_path) as f:
+        meta = json.load(f)
+    # Mark the bake as recently used so eviction keeps it
+    os.utime(meta_path)
+
+    begin = time.perf_counter()
+    point_cache = scene.rigidbody_world.point_cache
+    if not point_cache.use_disk_cache:
+        point_cache.use_disk_cache = True
+    cache_manager.clear_disk_cache(point_cache)
+
+    # A settled bake may have been trimmed, range changes must come before the files
+    point_cache.frame_end = meta['frame_end']
+
+    directory = cache_manager.cache_directory(point_cache)
+    os.makedirs(directory, exist_ok=True)
+    cache_name = cache_manager.cache_file_name(scene.name, point_cache)
+    copied = 0
+    for entry in os.scandir(source):
+        if not entry.name.endswith(".bphys"):
+            continue
+        frame, index = entry.name[:-len(".bphys")].split("_")
+        shutil.copy2(entry.path, os.path.join(directory, f"{cache_name}_{frame}_{index}.bphys"))
+        copied += 1
+
+    with bpy.context.temp_override(scene=scene, point_cache=point_cache):
+        bpy.ops.ptcache.bake_from_cache()
+
+    # Stores written before the frame count was kept fall back to the range
+    frames = meta.get('frames')
+    if frames is None:
+        frames = meta['frame_end'] - meta['frame_start']
+    last_reuse = {'key': key, 'files': copied, 'frames': frames, 'time': time.perf_counter() - begin}
+    return True
+
+def store_size():
+    """Number of stored bakes and their total size on disk"""
+    global _size
+    if _size is not None:
+        return _size
+
+    bakes = _stored_bakes()
+    _size = (len(bakes), sum(size for _, size, _ in bakes))
+    return _size
+
+def clear_store():
+    """Delete every stored bake"""
+    global _size
+    directory = store_directory()
+    if os.path.isdir(directory):
+        shutil.rmtree(directory, ignore_errors=True)
+    _size = None
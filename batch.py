@@ -0,0 +1,175 @@
+import numpy as np
+
+# Largest number of candidate pairs checked at once by the sweep, bounds memory use
+SWEEP_CHUNK = 4_000_000
+
+def world_bodies(scene):
+    """Return the object collection of the rigid body world, or None"""
+    rbw = scene.rigidbody_world
+    if rbw is None or rbw.collection is None:
+        return None
+    return rbw.collection.objects
+
+def gather_float(collection, attr, width=1):
+    """Read a float property of every item in a collection in one call"""
+    count = len(collection)
+    values = np.empty(count * width, dtype=np.float32)
+    collection.foreach_get(attr, values)
+    return values.reshape(count, width) if width > 1 else values
+
+def gather_matrices(collection, attr="matrix_world"):
+    """Read a 4x4 matrix property of every item, returned row-major as (n, 4, 4)"""
+    count = len(collection)
+    values = np.empty(count * 16, dtype=np.float32)
+    collection.foreach_get(attr, values)
+    # Blender stores matrices column-major
+    return values.reshape(count, 4, 4).transpose(0, 2, 1)
+
+def gather_bound_boxes(collection):
+    """Read the local bounding box corners of every object as (n, 8, 3)"""
+    count = len(collection)
+    values = np.empty(count * 24, dtype=np.float32)
+    collection.foreach_get("bound_box", values)
+    return values.reshape(count, 8, 3)
+
+def gather_rigid_body(objects, attrs):
+    """Read several rigid body settings of many objects in a single pass"""
+    rows = [tuple(getattr(obj.rigid_body, attr) for attr in attrs) for obj in objects]
+    columns = list(zip(*rows)) if rows else [()] * len(attrs)
+    return {attr: np.array(column) for attr, column in zip(attrs, columns)}
+
+def world_aabbs(matrices, bound_boxes):
+    """Transform local bounding boxes into world space axis aligned boxes"""
+    corners = np.einsum('nij,nkj->nki', matrices[:, :3, :3], bound_boxes) + matrices[:, None, :3, 3]
+    return corners.min(axis=1), corners.max(axis=1)
+
+def world_scales(matrices):
+    """Length of each object's world space axes, as (n, 3)"""
+    return np.linalg.norm(matrices[:, :3, :3], axis=1)
+
+def overlapping_pairs(mins, maxs):
+    """Find all pairs of overlapping boxes with a vectorized sort and sweep"""
+    count = len(mins)
+    if count < 2:
+        return np.empty((0, 2), dtype=np.int64)
+
+    # Sweep along the axis where the boxes are spread out the most
+    axis = int(np.argmax(np.var(mins + maxs, axis=0)))
+    order = np.argsort(mins[:, axis], kind='stable')
+    sorted_mins = mins[order, axis]
+    sorted_maxs = maxs[order, axis]
+
+    # Every box after i in sweep order that starts before i ends is a candidate
+    ends = np.searchsorted(sorted_mins, sorted_maxs, side='right')
+    counts = np.maximum(ends - np.arange(count) - 1, 0)
+
+    pairs = []
+    bounds = np.cumsum(counts)
+    start = 0
+    while start < count:
+        # Split the sweep into chunks of at most SWEEP_CHUNK candidates
+        limit = (bounds[start - 1] if start else 0) + SWEEP_CHUNK
+        stop = max(int(np.searchsorted(bounds, limit, side='right')), start + 1)
+        stop = min(stop, count)
+
+        chunk_counts = counts[start:stop]
+        total = int(chunk_counts.sum())
+        if total:
+            first = np.repeat(np.arange(start, stop), chunk_counts)
+            offsets = np.arange(total) - np.repeat(np.cumsum(chunk_counts) - chunk_counts, chunk_counts)
+            a = order[first]
+            b = order[first + 1 + offsets]
+            overlap = np.all((mins[a] <= maxs[b]) & (mins[b] <= maxs[a]), axis=1)
+            pairs.append(np.stack([a[overlap], b[overlap]], axis=1))
+        start = stop
+
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.concatenate(pairs)
+
+def add_rigid_bodies(context, objects, body_type='ACTIVE'):
+    """Add rigid bodies to many objects with one operator call, without touching the selection"""
+    import bpy
+
+    objects = [obj for obj in objects if obj.type == 'MESH' and obj.rigid_body is None]
+    if not objects:
+        return 0
+    with context.temp_override(selected_objects=objects, selected_editable_objects=objects,
+                               active_object=objects[0], object=objects[0]):
+        bpy.ops.rigidbody.objects_add(type=body_type)
+    return len(objects)
+
+def remove_rigid_bodies(context, objects):
+    """Remove the rigid bodies of many objects with one operator call"""
+    import bpy
+
+    objects = [obj for obj in objects if obj.rigid_body is not None]
+    if not objects:
+        return 0
+    with context.temp_override(selected_objects=objects, selected_editable_objects=objects,
+                               active_object=objects[0], object=objects[0]):
+        bpy.ops.rigidbody.objects_remove()
+    return len(objects)
+
+def object_fcurves(obj):
+    """Return the F-Curves of an object's action, or None if it isn't animated"""
+    anim = obj.animation_data
+    if anim is None or anim.action is None:
+        return None
+
+    fcurves = getattr(anim.action, "fcurves", None)
+    if fcurves is None:
+        # Slotted actions keep their F-Curves in a channelbag per slot
+        from bpy_extras import anim_utils
+        channelbag = anim_utils.action_get_channelbag_for_slot(anim.action, anim.action_slot)
+        if channelbag is None:
+            return None
+        fcurves = channelbag.fcurves
+    return fcurves
+
+def find_fcurve(obj, data_path, index=0):
+    """Return the F-Curve animating a property of an object, or None"""
+    fcurves = object_fcurves(obj)
+    if fcurves is None:
+        return None
+    return fcurves.find(data_path, index=index)
+
+def gather_keyframes(fcurve):
+    """Keyframe positions and handles of an F-Curve as (n, 6), plus interpolation modes"""
+    points = fcurve.keyframe_points
+    count = len(points)
+    values = np.empty((3, count * 2), dtype=np.float32)
+    points.foreach_get("co", values[0])
+    points.foreach_get("handle_left", values[1])
+    points.foreach_get("handle_right", values[2])
+    keys = values.reshape(3, count, 2).transpose(1, 0, 2).reshape(count, 6)
+    return keys, [point.interpolation for point in points]
+
+def set_keyframes(obj, data_path, frames, values, index=0):
+    """Key a property at several frames, adding all but the first key in bulk"""
+    owner, _, prop = data_path.rpartition(".")
+    target = obj.path_resolve(owner) if owner else obj
+
+    # Inserting the first key creates the F-Curve with the right flags for the property
+    current = getattr(target, prop)
+    if isinstance(current, (int, float, bool)):
+        setattr(target, prop, type(current)(values[0]))
+    else:
+        current[index] = values[0]
+    obj.keyframe_insert(data_path, index=index, frame=frames[0])
+
+    fcurve = find_fcurve(obj, data_path, index)
+    if fcurve is None or len(frames) == 1:
+        return fcurve
+    return append_keyframes(fcurve, frames[1:], values[1:])
+
+def append_keyframes(fcurve, frames, values):
+    """Add keys to an existing F-Curve with one add and one foreach_set"""
+    existing = len(fcurve.keyframe_points)
+    fcurve.keyframe_points.add(len(frames))
+    co = np.empty(len(fcurve.keyframe_points) * 2, dtype=np.float32)
+    fcurve.keyframe_points.foreach_get("co", co)
+    co[existing * 2:] = np.column_stack([frames, values]).ravel()
+    fcurve.keyframe_points.foreach_set("co", co)
+    fcurve.update()
+    return fcurve
@@ -0,0 +1,367 @@
+import bpy
+import os
+import re
+import sys
+import threading
+import time
+
+from .bake import BakeJob, redraw_ui
+
+# Point cache files are named <cache name>_<frame>_<stack index>.bphys
+CACHE_FILE_PATTERN = re.compile(r"^(?P<name>.+)_(?P<frame>\d{6})_(?P<index>\d{2})\.bphys$")
+
+# Compression settings compared by the benchmark
+COMPRESSION_MODES = ('NO', 'LIGHT', 'HEAVY')
+
+# Each cached body stores a location (3 floats) and a rotation quaternion (4 floats)
+BYTES_PER_SAMPLE = 7 * 4
+
+# Rough per-frame bookkeeping of a cached frame (headers, frame lists)
+BYTES_PER_FRAME = 256
+
+# Results of the last scan and benchmark, shown in the Cache Status box
+scan_result = None
+benchmark_results = []
+
+_scan_thread = None
+
+def format_size(num_bytes):
+    """Format a byte count as a short human readable string"""
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024.0 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024.0
+
+def hex_name(name):
+    """Encode an ID name the way Blender does for unnamed point caches"""
+    return "".join(f"{b:02X}" for b in name.encode("utf-8"))
+
+def decode_cache_name(cache_name):
+    """Decode a hex encoded cache name back to the ID name, if possible"""
+    try:
+        return bytes.fromhex(cache_name).decode("utf-8")
+    except ValueError:
+        return cache_name
+
+def cache_file_name(owner_name, point_cache):
+    """Return the file name prefix Blender uses for a point cache"""
+    if not point_cache.name and not point_cache.use_external:
+        return hex_name(owner_name)
+    return point_cache.name
+
+def cache_directory(point_cache):
+    """Return the absolute directory of a disk cache, or None if the file is unsaved"""
+    if point_cache.use_external:
+        return bpy.path.abspath(point_cache.filepath)
+    if not bpy.data.filepath:
+        return None
+    blend_name = os.path.splitext(os.path.basename(bpy.data.filepath))[0]
+    return os.path.join(os.path.dirname(bpy.data.filepath), f"blendcache_{blend_name}")
+
+def world_cache_names():
+    """Return the cache file names of every rigid body world in the file"""
+    names = {}
+    for scene in bpy.data.scenes:
+        if scene.rigidbody_world:
+            names[cache_file_name(scene.name, scene.rigidbody_world.point_cache)] = scene.name
+    return names
+
+def known_cache_names():
+    """Return the cache file names of every point cache owner in the file"""
+    names = set(world_cache_names())
+    for obj in bpy.data.objects:
+        names.add(hex_name(obj.name))
+        for modifier in obj.modifiers:
+            point_cache = getattr(modifier, "point_cache", None)
+            if point_cache is not None and point_cache.name:
+                names.add(point_cache.name)
+        for psys in getattr(obj, "particle_systems", ()):
+            if psys.point_cache.name:
+                names.add(psys.point_cache.name)
+    return names
+
+def scan_directory(directory, world_names, known_names):
+    """Collect size and frame count per cache in a directory (runs off the main thread)"""
+    caches = {}
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        entries = []
+
+    for entry in entries:
+        match = CACHE_FILE_PATTERN.match(entry.name)
+        if not match or not entry.is_file():
+            continue
+        key = (match.group("name"), int(match.group("index")))
+        cache = caches.setdefault(key, {
+            'name': match.group("name"),
+            'label': world_names.get(match.group("name"), decode_cache_name(match.group("name"))),
+            'index': key[1],
+            'size': 0,
+            'frames': 0,
+            'is_world': match.group("name") in world_names,
+            'is_stale': match.group("name") not in known_names,
+            'files': [],
+        })
+        try:
+            cache['size'] += entry.stat().st_size
+        except OSError:
+            continue
+        cache['frames'] += 1
+        cache['files'].append(entry.path)
+
+    return {
+        'directory': directory,
+        'caches': sorted(caches.values(), key=lambda c: c['size'], reverse=True),
+        'total_size': sum(c['size'] for c in caches.values()),
+        'stale_size': sum(c['size'] for c in caches.values() if c['is_stale']),
+    }
+
+def is_scanning():
+    return _scan_thread is not None and _scan_thread.is_alive()
+
+def start_scan(directory):
+    """Scan a cache directory on a background thread"""
+    global _scan_thread
+
+    # Gather everything that needs bpy on the main thread
+    world_names = world_cache_names()
+    known_names = known_cache_names()
+
+    def worker():
+        global scan_result
+        scan_result = scan_directory(directory, world_names, known_names)
+
+    _scan_thread = threading.Thread(target=worker, name="QuickRigidCacheScan", daemon=True)
+    _scan_thread.start()
+    bpy.app.timers.register(_poll_scan, first_interval=0.1)
+
+def _poll_scan():
+    """Timer callback that redraws the panel once the scan has finished"""
+    if is_scanning():
+        return 0.1
+    redraw_ui(bpy.context)
+    return None
+
+def purge_stale_caches():
+    """Delete the files of every stale cache found by the last scan"""
+    if scan_result is None:
+        return 0, 0
+    removed_files = 0
+    removed_bytes = 0
+    for cache in scan_result['caches']:
+        if not cache['is_stale']:
+            continue
+        for path in cache['files']:
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+            except OSError:
+                continue
+            removed_files += 1
+            removed_bytes += size
+    return removed_files, removed_bytes
+
+def cache_files(directory, cache_name):
+    """(frame, index, path) of every file belonging to one disk cache"""
+    files = []
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return files
+    for entry in entries:
+        match = CACHE_FILE_PATTERN.match(entry.name)
+        if match and match.group("name") == cache_name:
+            files.append((int(match.group("frame")), int(match.group("index")), entry.path))
+    return files
+
+def cache_size_on_disk(directory, cache_name):
+    """Total size of all files belonging to one cache"""
+    total = 0
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return 0
+    for entry in entries:
+        match = CACHE_FILE_PATTERN.match(entry.name)
+        if match and match.group("name") == cache_name:
+            total += entry.stat().st_size
+    return total
+
+def clear_disk_cache(point_cache):
+    """Clear an unbaked disk cache, toggling disk caching frees all its frames"""
+    point_cache.use_disk_cache = False
+    point_cache.use_disk_cache = True
+
+class CompressionBenchmark:
+    """Bakes a short range with each compression setting, a few frames per call to step"""
+
+    def __init__(self, scene, frame_count):
+        self.scene = scene
+        point_cache = scene.rigidbody_world.point_cache
+        self.frame_start = point_cache.frame_start
+        self.frame_end = min(self.frame_start + frame_count, point_cache.frame_end)
+        self.directory = cache_directory(point_cache)
+        self.cache_name = cache_file_name(scene.name, point_cache)
+
+        self.modes = list(COMPRESSION_MODES)
+        self.results = []
+        self.job = None
+        self.compression = None
+        self.write_time = 0.0
+        self.read_time = 0.0
+        # Frame being read back, None while the current compression is still writing
+        self.read_frame = None
+        self.original = None
+
+    def start(self):
+        """Switch to the disk cache and begin writing with the first compression"""
+        point_cache = self.scene.rigidbody_world.point_cache
+        self.original = (point_cache.use_disk_cache, point_cache.compression, self.scene.frame_current)
+        point_cache.use_disk_cache = True
+        self._next_mode()
+
+    def _next_mode(self):
+        point_cache = self.scene.rigidbody_world.point_cache
+        self.compression = self.modes.pop(0)
+        point_cache.compression = self.compression
+        clear_disk_cache(point_cache)
+
+        begin = time.perf_counter()
+        self.job = BakeJob(self.scene, self.frame_start, self.frame_end)
+        self.job.start()
+        self.write_time = time.perf_counter() - begin
+        self.read_frame = None
+
+    def step(self):
+        """Write or read back one frame, returns False once every compression is measured"""
+        begin = time.perf_counter()
+        if self.read_frame is None:
+            # Simulating writes every frame to disk
+            writing = self.job.step()
+            self.write_time += time.perf_counter() - begin
+            if not writing:
+                self.read_frame = self.frame_start
+                self.read_time = 0.0
+            return True
+
+        # Stepping again reads every frame back from disk
+        self.scene.frame_set(self.read_frame)
+        self.read_time += time.perf_counter() - begin
+        self.read_frame += 1
+        if self.read_frame <= self.frame_end:
+            return True
+
+        self.results.append({
+            'compression': self.compression,
+            'frames': self.frame_end - self.frame_start,
+            'write_time': self.write_time,
+            'read_time': self.read_time,
+            'bytes': cache_size_on_disk(self.directory, self.cache_name),
+        })
+        if not self.modes:
+            return False
+        self._next_mode()
+        return True
+
+    def step_for(self, budget):
+        """Measure frames until the time budget (in seconds) is used up"""
+        deadline = time.perf_counter() + budget
+        more = True
+        while more and time.perf_counter() < deadline:
+            more = self.step()
+        return more
+
+    def restore(self):
+        """Free the benchmark frames and put the user's cache settings back"""
+        if self.original is None:
+            return
+        point_cache = self.scene.rigidbody_world.point_cache
+        use_disk_cache, compression, frame = self.original
+        self.original = None
+        clear_disk_cache(point_cache)
+        point_cache.compression = compression
+        point_cache.use_disk_cache = use_disk_cache
+        self.scene.frame_set(frame)
+
+def estimate_cache_footprint(scene):
+    """Predict the point cache size of the rigid body world before baking"""
+    rbw = scene.rigidbody_world
+    point_cache = rbw.point_cache
+
+    # Every body in the world gets a slot in each cached frame, passive ones included
+    bodies = len(rbw.collection.objects) if rbw.collection else 0
+    # Rigid body caches store every frame, their step is fixed at 1
+    frames = point_cache.frame_end - point_cache.frame_start + 1
+
+    return {
+        'bodies': bodies,
+        'frames': frames,
+        'bytes': frames * (bodies * BYTES_PER_SAMPLE + BYTES_PER_FRAME),
+    }
+
+def available_memory():
+    """Return the available system memory in bytes, or None if it can't be determined"""
+    try:
+        import psutil
+        return psutil.virtual_memory().available
+    except ImportError:
+        pass
+
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/meminfo") as f:
+                for line in f:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) * 1024
+        except (OSError, ValueError, IndexError):
+            return None
+
+    if sys.platform == "win32":
+        import ctypes
+
+        class MEMORYSTATUSEX(ctypes.Structure):
+            _fields_ = [
+                ("dwLength", ctypes.c_ulong),
+                ("dwMemoryLoad", ctypes.c_ulong),
+                ("ullTotalPhys", ctypes.c_ulonglong),
+                ("ullAvailPhys", ctypes.c_ulonglong),
+                ("ullTotalPageFile", ctypes.c_ulonglong),
+                ("ullAvailPageFile", ctypes.c_ulonglong),
+                ("ullTotalVirtual", ctypes.c_ulonglong),
+                ("ullAvailVirtual", ctypes.c_ulonglong),
+                ("sullAvailExtendedVirtual", ctypes.c_ulonglong),
+            ]
+
+        status = MEMORYSTATUSEX()
+        status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullAvailPhys
+        return None
+
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+def over_budget(settings, estimate, available):
+    """Check a cache estimate against the user's budget and the available memory (None if unknown)"""
+    budget = settings.memory_budget * 1024 * 1024
+    if available is not None:
+        budget = min(budget, available)
+    return estimate['bytes'] > budget
+
+def exceeds_memory_budget(scene):
+    """Check if an in-memory bake is predicted to go over the user's budget"""
+    return over_budget(scene.quick_rigid_settings, estimate_cache_footprint(scene), available_memory())
+
+def spill_to_disk(scene):
+    """Move the rigid body cache to disk with the chosen compression"""
+    settings = scene.quick_rigid_settings
+    point_cache = scene.rigidbody_world.point_cache
+    if not bpy.data.filepath:
+        return False
+    point_cache.use_disk_cache = True
+    point_cache.compression = settings.spill_compression
+    return True
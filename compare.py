@@ -0,0 +1,173 @@
+import bpy
+import os
+import numpy as np
+
+from . import batch
+
+# Each sample stores the scale free rotation (9 floats) and location (3 floats)
+SAMPLE_WIDTH = 12
+
+# Snapshots bigger than this are written to a memory-mapped .npy file
+MEMMAP_THRESHOLD = 64 * 1024 * 1024
+
+# Frames compared at once, keeps memory flat for memory-mapped snapshots
+FRAME_CHUNK = 64
+
+# Rotation divergence (radians) that counts as much as one body size of position divergence
+ROTATION_REFERENCE = np.radians(45.0)
+
+# Number of objects listed as worst offenders
+WORST_COUNT = 10
+
+# Captured snapshots keyed by slot ('A' or 'B') and the last comparison
+snapshots = {}
+comparison = None
+
+def snapshot_path(slot):
+    """File that backs a memory-mapped snapshot"""
+    return os.path.join(bpy.app.tempdir, f"quick_rigid_snapshot_{slot}.npy")
+
+def _allocate(slot, shape):
+    """Create the sample array, memory-mapped when it's large"""
+    if np.prod(shape) * 4 > MEMMAP_THRESHOLD:
+        return np.lib.format.open_memmap(snapshot_path(slot), mode='w+', dtype=np.float32, shape=shape)
+    return np.empty(shape, dtype=np.float32)
+
+def sample_transforms(scene, slot):
+    """Step through the cached range and store every body's transform per frame"""
+    objects = batch.world_bodies(scene)
+    if objects is None or len(objects) == 0:
+        return None
+
+    point_cache = scene.rigidbody_world.point_cache
+    frames = np.arange(point_cache.frame_start, point_cache.frame_end + 1)
+    original_frame = scene.frame_current
+
+    # Unmap the previous snapshot of this slot before its file is rewritten
+    _release(slot)
+    samples = _allocate(slot, (len(frames), len(objects), SAMPLE_WIDTH))
+    try:
+        for index, frame in enumerate(frames.tolist()):
+            scene.frame_set(frame)
+            matrices = batch.gather_matrices(objects)
+            rotation = matrices[:, :3, :3] / np.maximum(np.linalg.norm(matrices[:, :3, :3], axis=1, keepdims=True), 1e-12)
+            samples[index, :, :9] = rotation.reshape(-1, 9)
+            samples[index, :, 9:] = matrices[:, :3, 3]
+    finally:
+        scene.frame_set(original_frame)
+
+    if isinstance(samples, np.memmap):
+        samples.flush()
+
+    dimensions = batch.gather_float(objects, "dimensions", 3)
+    snapshots[slot] = {
+        'names': [obj.name for obj in objects],
+        'frames': frames,
+        'samples': samples,
+        'size': float(np.median(dimensions.max(axis=1))),
+        'settings': describe_settings(scene),
+    }
+    return snapshots[slot]
+
+def describe_settings(scene):
+    """Short description of the world settings a snapshot was baked with"""
+    rbw = scene.rigidbody_world
+    return f"{rbw.substeps_per_frame} substeps, {rbw.solver_iterations} iterations"
+
+def compare_snapshots(a, b):
+    """Position and rotation divergence between two snapshots, per object and per frame"""
+    # Only bodies and frames present in both bakes can be compared
+    index_b = {name: i for i, name in enumerate(b['names'])}
+    pairs = [(i, index_b[name]) for i, name in enumerate(a['names']) if name in index_b]
+    frames, frames_a, frames_b = np.intersect1d(a['frames'], b['frames'], return_indices=True)
+    if not pairs or not len(frames):
+        return None
+    objects_a = np.array([i for i, _ in pairs])
+    objects_b = np.array([j for _, j in pairs])
+
+    count = len(pairs)
+    position_sum = np.zeros(count)
+    position_max = np.zeros(count)
+    rotation_sum = np.zeros(count)
+    rotation_max = np.zeros(count)
+    frame_position = np.zeros(len(frames))
+    frame_rotation = np.zeros(len(frames))
+
+    for start in range(0, len(frames), FRAME_CHUNK):
+        stop = min(start + FRAME_CHUNK, len(frames))
+        chunk_a = np.asarray(a['samples'][frames_a[start:stop]])[:, objects_a].astype(np.float64)
+        chunk_b = np.asarray(b['samples'][frames_b[start:stop]])[:, objects_b].astype(np.float64)
+
+        position = np.linalg.norm(chunk_a[..., 9:] - chunk_b[..., 9:], axis=2)
+
+        # Angle of the relative rotation from the trace of Ra^T Rb
+        rot_a = chunk_a[..., :9].reshape(stop - start, count, 3, 3)
+        rot_b = chunk_b[..., :9].reshape(stop - start, count, 3, 3)
+        trace = np.einsum('fnji,fnji->fn', rot_a, rot_b)
+        rotation = np.arccos(np.clip((trace - 1.0) / 2.0, -1.0, 1.0))
+
+        position_sum += position.sum(axis=0)
+        rotation_sum += rotation.sum(axis=0)
+        np.maximum(position_max, position.max(axis=0), out=position_max)
+        np.maximum(rotation_max, rotation.max(axis=0), out=rotation_max)
+        frame_position[start:stop] = position.mean(axis=1)
+        frame_rotation[start:stop] = rotation.mean(axis=1)
+
+    position_mean = position_sum / len(frames)
+    rotation_mean = rotation_sum / len(frames)
+
+    # Score from 100 (identical) down, position measured in typical body sizes
+    size = max(a['size'], 1e-6)
+    error = frame_position.mean() / size + frame_rotation.mean() / ROTATION_REFERENCE
+    score = 100.0 / (1.0 + error)
+
+    names = [a['names'][i] for i in objects_a.tolist()]
+    divergence = position_max / size + rotation_max / ROTATION_REFERENCE
+    worst = np.argsort(divergence)[::-1][:WORST_COUNT]
+    worst = worst[divergence[worst] > 0.0]
+    worst_frame = int(np.argmax(frame_position / size + frame_rotation / ROTATION_REFERENCE))
+
+    return {
+        'score': float(score),
+        'objects': count,
+        'frames': len(frames),
+        'position_mean': float(frame_position.mean()),
+        'position_max': float(position_max.max()),
+        'rotation_mean': float(np.degrees(frame_rotation.mean())),
+        'rotation_max': float(np.degrees(rotation_max.max())),
+        'worst_frame': int(frames[worst_frame]),
+        'worst_objects': [{
+            'name': names[i],
+            'position_max': float(position_max[i]),
+            'position_mean': float(position_mean[i]),
+            'rotation_max': float(np.degrees(rotation_max[i])),
+            'rotation_mean': float(np.degrees(rotation_mean[i])),
+        } for i in worst.tolist()],
+        'frame_position': frame_position,
+        'frame_rotation': np.degrees(frame_rotation),
+    }
+
+def compare():
+    """Compare snapshot A against snapshot B and keep the result for the panel"""
+    global comparison
+    if 'A' not in snapshots or 'B' not in snapshots:
+        return None
+    comparison = compare_snapshots(snapshots['A'], snapshots['B'])
+    return comparison
+
+def _release(slot):
+    """Drop a snapshot and remove its memory-mapped file"""
+    snapshot = snapshots.pop(slot, None)
+    if snapshot is not None and isinstance(snapshot['samples'], np.memmap):
+        del snapshot['samples']
+        try:
+            os.remove(snapshot_path(slot))
+        except OSError:
+            pass
+
+def clear():
+    """Forget both snapshots and the last comparison"""
+    global comparison
+    for slot in list(snapshots):
+        _release(slot)
+    comparison = None
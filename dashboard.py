@@ -0,0 +1,131 @@
+import bpy
+from bpy.app.handlers import persistent
+from collections import Counter
+
+# Collision shapes whose cost depends on the mesh behind them
+MESH_SHAPES = {'MESH', 'CONVEX_HULL'}
+
+# Per body contribution (type, shape, vertices) keyed by object session uid
+_entries = {}
+_by_type = Counter()
+_by_shape = Counter()
+_mesh_vertices = 0
+_scene_name = None
+_valid = False
+
+# Bumped whenever the statistics change, lets other caches know they are stale
+generation = 0
+
+def invalidate():
+    global _valid, generation
+    _valid = False
+    generation += 1
+
+def _entry(obj):
+    """Contribution of one body to the statistics"""
+    rb = obj.rigid_body
+    if rb is None:
+        return None
+    vertices = len(obj.data.vertices) if obj.type == 'MESH' and rb.collision_shape in MESH_SHAPES else 0
+    return (rb.type, rb.collision_shape, vertices)
+
+def _add(entry, sign):
+    global _mesh_vertices
+    body_type, shape, vertices = entry
+    _by_type[body_type] += sign
+    _by_shape[shape] += sign
+    _mesh_vertices += sign * vertices
+
+def rebuild(scene):
+    """Recompute the statistics of the whole rigid body world"""
+    global _scene_name, _valid, _mesh_vertices, generation
+    _entries.clear()
+    _by_type.clear()
+    _by_shape.clear()
+    _mesh_vertices = 0
+
+    rbw = scene.rigidbody_world
+    if rbw is not None and rbw.collection is not None:
+        for obj in rbw.collection.objects:
+            entry = _entry(obj)
+            if entry is not None:
+                _entries[obj.session_uid] = entry
+                _add(entry, 1)
+
+    _scene_name = scene.name
+    _valid = True
+    generation += 1
+
+def update_object(obj, in_world):
+    """Replace the contribution of a single body"""
+    global generation
+    old = _entries.pop(obj.session_uid, None)
+    new = _entry(obj) if in_world else None
+    if old == new:
+        if new is not None:
+            _entries[obj.session_uid] = new
+        return
+    if old is not None:
+        _add(old, -1)
+    if new is not None:
+        _entries[obj.session_uid] = new
+        _add(new, 1)
+    generation += 1
+
+@persistent
+def on_depsgraph_update(scene, depsgraph):
+    """Apply changed objects to the statistics instead of recounting everything"""
+    if not _valid:
+        return
+    if scene.name != _scene_name:
+        invalidate()
+        return
+
+    rbw = scene.rigidbody_world
+    world_objects = rbw.collection.objects if rbw is not None and rbw.collection is not None else None
+    if world_objects is None:
+        invalidate()
+        return
+
+    for update in depsgraph.updates:
+        data = update.id
+        if isinstance(data, bpy.types.Collection):
+            # Bodies were added to or removed from the world
+            if data.original == rbw.collection:
+                invalidate()
+                return
+        elif isinstance(data, bpy.types.Object):
+            obj = data.original
+            update_object(obj, world_objects.get(obj.name) == obj)
+
+@persistent
+def on_load(dummy):
+    invalidate()
+
+def get_stats(scene):
+    """Return the current statistics, building them the first time"""
+    if not _valid or scene.name != _scene_name:
+        rebuild(scene)
+
+    rbw = scene.rigidbody_world
+    constraints = 0
+    if rbw is not None and rbw.constraints is not None:
+        constraints = len(rbw.constraints.objects)
+
+    return {
+        'bodies': len(_entries),
+        'by_type': dict(_by_type),
+        'by_shape': {shape: count for shape, count in _by_shape.items() if count},
+        'mesh_vertices': _mesh_vertices,
+        'constraints': constraints,
+    }
+
+def register():
+    bpy.app.handlers.depsgraph_update_post.append(on_depsgraph_update)
+    bpy.app.handlers.load_post.append(on_load)
+
+def unregister():
+    for handlers, handler in ((bpy.app.handlers.depsgraph_update_post, on_depsgraph_update),
+                              (bpy.app.handlers.load_post, on_load)):
+        if handler in handlers:
+            handlers.remove(handler)
@@ -0,0 +1,132 @@
+import bpy
+import hashlib
+import numpy as np
+from mathutils import Matrix
+
+from . import mesh_analysis
+
+# Shapes built from the mesh itself; primitive shapes are fit to the local bounds,
+# so for those a rotated local frame would change the collision shape
+MESH_SHAPES = {'MESH', 'CONVEX_HULL'}
+
+# Largest RMS vertex distance (relative to the mesh size) that still counts as identical
+DEFAULT_TOLERANCE = 1e-4
+
+# Largest relative difference between scale axes that still counts as uniform
+UNIFORM_SCALE_TOLERANCE = 1e-5
+
+def _hash(*arrays):
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()
+
+def topology_key(mesh, tris):
+    """Everything except vertex positions that has to match for two meshes to be swappable"""
+    uvs = []
+    for layer in mesh.uv_layers:
+        uv = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        layer.data.foreach_get("uv", uv)
+        uvs.append(uv)
+    material_index = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_index)
+    materials = tuple(material.name if material else "" for material in mesh.materials)
+    return (len(mesh.vertices), _hash(tris, material_index, *uvs), materials)
+
+def kabsch(a, b):
+    """Best rotation and translation mapping points a onto b, with the RMS error left"""
+    center_a, center_b = a.mean(axis=0), b.mean(axis=0)
+    u, _, vt = np.linalg.svd((a - center_a).T @ (b - center_b))
+    # A negative determinant would be a mirror, which no object transform can undo
+    d = np.sign(np.linalg.det(vt.T @ u.T))
+    rotation = vt.T @ np.diag([1.0, 1.0, d]) @ u.T
+    translation = center_b - rotation @ center_a
+    error = np.sqrt(np.mean(np.sum((a @ rotation.T + translation - b) ** 2, axis=1)))
+    return rotation, translation, float(error), d > 0
+
+def _is_identity(rotation, translation, size, tolerance):
+    return np.abs(rotation - np.eye(3)).max() <= tolerance and np.abs(translation).max() <= tolerance * size
+
+def _uniform_scale(obj):
+    """True if the object and all its parents are scaled the same on every axis"""
+    while obj is not None:
+        scale = np.abs(np.array(obj.matrix_world.to_scale()))
+        if scale.max() - scale.min() > UNIFORM_SCALE_TOLERANCE * max(scale.max(), 1e-9):
+            return False
+        obj = obj.parent
+    return True
+
+def _can_rotate(obj):
+    """A rotated local frame keeps the shape only for mesh shapes under uniform scale,
+    otherwise the new world matrix would be sheared and decompose into a different shape"""
+    return (obj.rigid_body.collision_shape in MESH_SHAPES and not obj.children and not obj.modifiers
+            and _uniform_scale(obj))
+
+def find_duplicates(objects, tolerance=DEFAULT_TOLERANCE):
+    """Map meshes to an identical shared mesh, returns {mesh name: (mesh, 4x4 transform)}"""
+    users = {}
+    for obj in objects:
+        if obj.type == 'MESH' and obj.rigid_body is not None:
+            users.setdefault(obj.data.name, []).append(obj)
+
+    groups = {}
+    geometry = {}
+    for name, mesh_users in users.items():
+        mesh = mesh_users[0].data
+        if mesh.shape_keys is not None or len(mesh.vertices) == 0:
+            continue
+        co, tris = mesh_analysis.read_geometry(mesh)
+        geometry[name] = co.astype(np.float64)
+        groups.setdefault(topology_key(mesh, tris), []).append(name)
+
+    duplicates = {}
+    for names in groups.values():
+        representatives = []
+        for name in names:
+            co = geometry[name]
+            size = max(float(np.linalg.norm(co.max(axis=0) - co.min(axis=0))), 1e-9)
+            for representative in representatives:
+                rotation, translation, error, proper = kabsch(geometry[representative], co)
+                if not proper or error > tolerance * size:
+                    continue
+                # The object origin is the center of mass, it must not move
+                if np.linalg.norm(translation) > tolerance * size:
+                    continue
+                # Otherwise the object keeps its own mesh
+                if not _is_identity(rotation, translation, size, tolerance) and not all(
+                        _can_rotate(obj) for obj in users[name]):
+                    continue
+                transform = np.eye(4)
+                transform[:3, :3] = rotation
+                transform[:3, 3] = translation
+                duplicates[name] = (bpy.data.meshes[representative], transform)
+                break
+            else:
+                representatives.append(name)
+    return duplicates, users
+
+def dedupe(objects, tolerance=DEFAULT_TOLERANCE):
+    """Relink rigid bodies with identical geometry to one shared mesh, returns a summary"""
+    duplicates, users = find_duplicates(objects, tolerance)
+
+    relinked = 0
+    removed = 0
+    saved_bytes = 0
+    for name, (shared, transform) in duplicates.items():
+        mesh = bpy.data.meshes[name]
+        offset = Matrix(transform.tolist())
+        for obj in users[name]:
+            obj.data = shared
+            # The shared mesh sits in a rotated local frame, move the object to compensate
+            obj.matrix_world = obj.matrix_world @ offset
+            relinked += 1
+        if mesh.users == 0:
+            saved_bytes += mesh_analysis.estimate_mesh_bytes(mesh)
+            bpy.data.meshes.remove(mesh)
+            removed += 1
+
+    return {
+        'relinked': relinked,
+        'meshes_removed': removed,
+        'saved_bytes': saved_bytes,
+    }
@@ -0,0 +1,105 @@
+import numpy as np
+
+from . import batch
+
+# The scene bounds are split into this many cells along each axis to find hot regions
+REGION_DIVISIONS = 8
+
+# Number of objects and regions kept in the report
+TOP_COUNT = 10
+
+# Result of the last analysis, shown in the Bake box
+last_analysis = None
+
+def analyze(scene, frame_step=1, progress=None):
+    """Count broadphase pairs per frame over the simulated range, returns the report"""
+    global last_analysis
+
+    objects = batch.world_bodies(scene)
+    if objects is None or len(objects) < 2:
+        return None
+
+    rb = batch.gather_rigid_body(objects, ("type", "collision_margin"))
+    is_active = rb["type"] == 'ACTIVE'
+    padding = np.maximum(rb["collision_margin"].astype(np.float32), 1e-4)[:, None]
+    bound_boxes = batch.gather_bound_boxes(objects)
+
+    point_cache = scene.rigidbody_world.point_cache
+    frames = np.arange(point_cache.frame_start, point_cache.frame_end + 1, max(frame_step, 1))
+    original_frame = scene.frame_current
+
+    pairs_per_frame = np.zeros(len(frames), dtype=np.int64)
+    object_pairs = np.zeros(len(objects), dtype=np.int64)
+    object_peak = np.zeros(len(objects), dtype=np.int64)
+    region_points = []
+
+    # Blender only steps the simulation on consecutive frames, so an unbaked
+    # range is simulated frame by frame and every Nth frame is sampled
+    if point_cache.is_baked:
+        visited = frames
+    else:
+        visited = np.arange(point_cache.frame_start, frames[-1] + 1)
+
+    try:
+        index = 0
+        for frame in visited.tolist():
+            scene.frame_set(frame)
+            if index >= len(frames) or frame != frames[index]:
+                continue
+            mins, maxs = batch.world_aabbs(batch.gather_matrices(objects), bound_boxes)
+            mins -= padding
+            maxs += padding
+
+            pairs = batch.overlapping_pairs(mins, maxs)
+            # Bullet never pairs two static bodies
+            if len(pairs):
+                pairs = pairs[is_active[pairs[:, 0]] | is_active[pairs[:, 1]]]
+            pairs_per_frame[index] = len(pairs)
+
+            counts = np.bincount(pairs.ravel(), minlength=len(objects))
+            object_pairs += counts
+            np.maximum(object_peak, counts, out=object_peak)
+
+            # Each pair counts at the center of the overlap of its two boxes
+            if len(pairs):
+                a, b = pairs[:, 0], pairs[:, 1]
+                region_points.append((np.maximum(mins[a], mins[b]) + np.minimum(maxs[a], maxs[b])) / 2.0)
+
+            if progress is not None:
+                progress(index / len(frames))
+            index += 1
+    finally:
+        scene.frame_set(original_frame)
+
+    names = [obj.name for obj in objects]
+    top = np.argsort(object_pairs)[::-1][:TOP_COUNT]
+    top = top[object_pairs[top] > 0]
+
+    last_analysis = {
+        'frames': frames,
+        'pairs': pairs_per_frame,
+        'peak_frame': int(frames[np.argmax(pairs_per_frame)]),
+        'peak_pairs': int(pairs_per_frame.max()),
+        'mean_pairs': float(pairs_per_frame.mean()),
+        'objects': [{
+            'name': names[i],
+            'pairs': int(object_pairs[i]),
+            'peak': int(object_peak[i]),
+        } for i in top.tolist()],
+        'regions': hot_regions(np.concatenate(region_points)) if region_points else [],
+    }
+    return last_analysis
+
+def hot_regions(points):
+    """Group pair locations into a grid over their bounds, returns the busiest cells"""
+    low = points.min(axis=0)
+    size = np.maximum((points.max(axis=0) - low) / REGION_DIVISIONS, 1e-6)
+    cells = np.minimum(((points - low) / size).astype(np.int64), REGION_DIVISIONS - 1)
+
+    keys, counts = np.unique(cells, axis=0, return_counts=True)
+    order = np.argsort(counts)[::-1][:TOP_COUNT]
+    return [{
+        'center': (low + (keys[i] + 0.5) * size).tolist(),
+        'size': size.tolist(),
+        'pairs': int(counts[i]),
+    } for i in order.tolist()]
@@ -0,0 +1,191 @@
+import bpy
+import os
+import shutil
+import tempfile
+import numpy as np
+
+from . import batch
+from . import bake
+from . import bake_store
+from . import cache_manager
+
+# Inputs of the last bake per scene, compared against to find the first changed frame
+_snapshots = {}
+
+def take_snapshot(scene):
+    """Remember the inputs of the bake that was just made"""
+    objects = batch.world_bodies(scene)
+    _snapshots[scene.name] = {
+        'static': bake_store.simulation_hash(scene, include_animation=False),
+        'curves': bake_store.animation_keys(objects) if objects is not None else {},
+    }
+
+def curve_change_frame(old, new):
+    """First frame at which an F-Curve evaluates differently, -inf if from the start, None if unchanged"""
+    if old is None or new is None:
+        return float('-inf')
+    old_keys, old_interpolation, old_curve = old
+    new_keys, new_interpolation, new_curve = new
+    if old_curve != new_curve:
+        return float('-inf')
+
+    count = min(len(old_keys), len(new_keys))
+    differs = np.any(old_keys[:count] != new_keys[:count], axis=1)
+    differs |= np.array(old_interpolation[:count]) != np.array(new_interpolation[:count])
+    changed = np.flatnonzero(differs)
+    first = int(changed[0]) if len(changed) else count
+    if first == count and len(old_keys) == len(new_keys):
+        return None
+    if first == 0:
+        # Extrapolation before the first key changes too
+        return float('-inf')
+    # The curve is unchanged up to the last key both versions share
+    return float(old_keys[first - 1][0])
+
+def first_affected_frame(scene):
+    """First frame whose simulation depends on something edited since the last bake, None if nothing"""
+    frame_start = scene.rigidbody_world.point_cache.frame_start
+    snapshot = _snapshots.get(scene.name)
+    if snapshot is None:
+        return frame_start
+    if bake_store.simulation_hash(scene, include_animation=False) != snapshot['static']:
+        return frame_start
+
+    objects = batch.world_bodies(scene)
+    curves = bake_store.animation_keys(objects) if objects is not None else {}
+    affected = None
+    for key in set(curves) | set(snapshot['curves']):
+        frame = curve_change_frame(snapshot['curves'].get(key), curves.get(key))
+        if frame is not None and (affected is None or frame < affected):
+            affected = frame
+    if affected is None or affected >= scene.rigidbody_world.point_cache.frame_end:
+        return None
+    return max(int(np.floor(affected)), frame_start)
+
+def _move_files(files, directory, moved):
+    """Move cache files into a directory, appending their new (frame, index, path) to moved"""
+    for frame, index, path in files:
+        target = os.path.join(directory, os.path.basename(path))
+        shutil.move(path, target)
+        moved.append((frame, index, target))
+
+def _return_files(files, directory):
+    """Move parked cache files back into the cache directory, returns the ones left behind"""
+    left = []
+    for frame, index, path in files:
+        try:
+            shutil.move(path, os.path.join(directory, os.path.basename(path)))
+        except OSError:
+            left.append((frame, index, path))
+    return left
+
+def _restore_start(point_cache, frame_start, temp, original_basis):
+    """Put back the start frame and the initial transforms changed for a resumed segment"""
+    point_cache.frame_start = frame_start
+    if original_basis is not None:
+        temp.objects.foreach_set("matrix_basis", original_basis.transpose(0, 2, 1).ravel())
+    # Let the cache reset caused by these changes happen before files return
+    bpy.context.view_layer.update()
+
+def _simulated_bodies(scene):
+    objects = batch.world_bodies(scene)
+    rb = batch.gather_rigid_body(objects, ("type", "kinematic", "enabled"))
+    return (rb["type"] == 'ACTIVE') & ~rb["kinematic"].astype(bool) & rb["enabled"].astype(bool)
+
+def resume_blocker(scene, frame, speed_threshold=0.05, angular_threshold=0.1):
+    """Reason the bake can't be resumed at a frame, or None if it can
+
+    Only positions and rotations are cached, so a resumed segment starts with
+    zero velocity; that matches the full simulation only for resting bodies."""
+    point_cache = scene.rigidbody_world.point_cache
+    if frame - 1 <= point_cache.frame_start:
+        return "the change affects the start of the simulation"
+    if not point_cache.use_disk_cache or not bpy.data.filepath:
+        return "resuming needs a disk cache in a saved file"
+
+    objects = batch.world_bodies(scene)
+    original_frame = scene.frame_current
+    scene.frame_set(frame - 1)
+    previous = batch.gather_matrices(objects).astype(np.float64)
+    scene.frame_set(frame)
+    current = batch.gather_matrices(objects).astype(np.float64)
+    scene.frame_set(original_frame)
+
+    fps = scene.render.fps / scene.render.fps_base
+    speed, angular_speed = bake.body_speeds(previous, current, fps)
+    simulated = _simulated_bodies(scene)
+    moving = np.count_nonzero((speed[simulated] > speed_threshold) | (angular_speed[simulated] > angular_threshold))
+    if moving:
+        return f"{moving} bodies are still moving at frame {frame}"
+    return None
+
+def rebake_segment(scene, resume_frame, progress=None):
+    """Keep the cached frames up to resume_frame and simulate only the rest"""
+    rbw = scene.rigidbody_world
+    point_cache = rbw.point_cache
+    frame_start = point_cache.frame_start
+    directory = cache_manager.cache_directory(point_cache)
+    cache_name = cache_manager.cache_file_name(scene.name, point_cache)
+    objects = batch.world_bodies(scene)
+    simulated = _simulated_bodies(scene)
+
+    # Poses at the resume frame become the initial state of the segment
+    scene.frame_set(resume_frame)
+    poses = batch.gather_matrices(objects)[simulated]
+
+    temp = bpy.data.collections.new("QR Resume")
+    holding = tempfile.mkdtemp(prefix="quick_rigid_")
+    original_basis = None
+    prefix = []
+    segment = []
+    kept = 0
+    finished = False
+    try:
+        for obj, keep in zip(objects, simulated.tolist()):
+            if keep:
+                temp.objects.link(obj)
+        original_basis = batch.gather_matrices(temp.objects, "matrix_basis")
+
+        # Range and bake changes clear the cache files, park the valid prefix first
+        valid = [f for f in cache_manager.cache_files(directory, cache_name) if f[0] <= resume_frame]
+        _move_files(valid, holding, prefix)
+        kept = len(prefix)
+
+        with bpy.context.temp_override(scene=scene, point_cache=point_cache):
+            bpy.ops.ptcache.free_bake()
+        point_cache.frame_start = resume_frame
+        temp.objects.foreach_set("matrix_world", poses.transpose(0, 2, 1).ravel())
+
+        job = bake.BakeJob(scene)
+        job.start()
+        while job.step():
+            if progress is not None:
+                progress(job.progress)
+        simulated_files = [f for f in cache_manager.cache_files(directory, cache_name) if f[0] > resume_frame]
+        _move_files(simulated_files, holding, segment)
+
+        # Back to the real start and initial state, then put both parts in place
+        _restore_start(point_cache, frame_start, temp, original_basis)
+        prefix = _return_files(prefix, directory)
+        segment = _return_files(segment, directory)
+
+        with bpy.context.temp_override(scene=scene, point_cache=point_cache):
+            bpy.ops.ptcache.bake_from_cache()
+        finished = True
+    finally:
+        if not finished:
+            # Keep the user's start frame, initial state and valid frames
+            _restore_start(point_cache, frame_start, temp, original_basis)
+            prefix = _return_files(prefix, directory)
+        bpy.data.collections.remove(temp)
+        if prefix:
+            print(f"Quick Rigid: could not move cached frames back, they are kept in {holding}")
+        else:
+            shutil.rmtree(holding, ignore_errors=True)
+
+    take_snapshot(scene)
+    return {
+        'kept': kept,
+        'simulated': job.frames_done,
+        'time': job.elapsed,
+    }
@@ -0,0 +1,210 @@
+import bpy
+import fnmatch
+import re
+import numpy as np
+from bpy.app.handlers import persistent
+
+from . import batch
+
+# Filter state of each body, the baked state depends on the world's cache
+STATE_ITEMS = [
+    ('ALL', "All", "Bodies in any state"),
+    ('BAKED', "Baked", "Simulated bodies whose motion is in a baked cache"),
+    ('SIMULATED', "Not Baked", "Simulated bodies without a baked cache"),
+    ('ANIMATED', "Animated", "Bodies driven by their animation"),
+    ('DISABLED', "Disabled", "Bodies taken out of the simulation"),
+]
+
+SORT_ITEMS = [
+    ('NAME', "Name", "Sort by object name"),
+    ('TYPE', "Type", "Sort by body type"),
+    ('SHAPE', "Shape", "Sort by collision shape"),
+    ('MASS', "Mass", "Sort by mass"),
+    ('FRICTION', "Friction", "Sort by friction"),
+    ('VERTICES', "Vertices", "Sort by mesh vertex count"),
+]
+
+# Columns filled by _row, in its order
+ROW_COLUMNS = ('name', 'name_key', 'type', 'shape', 'mass', 'friction', 'vertices', 'enabled', 'kinematic')
+
+# Per body columns in the order of the world collection, refreshed row by row
+_columns = None
+_rows = {}
+_dirty_rows = set()
+_scene_name = None
+_valid = False
+
+# Above this share of changed bodies one bulk rebuild is faster than row updates
+REBUILD_FRACTION = 0.25
+
+# Filter results of the last call keyed by the inputs, redraws reuse them
+_last_filter = (None, None)
+# Name filter of the last call and the bodies it matched
+_name_mask = (None, None)
+
+def invalidate():
+    global _valid
+    _valid = False
+
+def _row(obj):
+    rb = obj.rigid_body
+    vertices = len(obj.data.vertices) if obj.type == 'MESH' else 0
+    return (obj.name, obj.name.lower(), rb.type, rb.collision_shape, rb.mass, rb.friction,
+            vertices, rb.enabled, rb.kinematic)
+
+def rebuild(scene, objects):
+    """Gather every column of the world's bodies"""
+    global _columns, _rows, _scene_name, _valid, _last_filter, _name_mask
+    rb = batch.gather_rigid_body(objects, ("type", "collision_shape", "mass", "friction", "enabled", "kinematic"))
+    names = [obj.name for obj in objects]
+    # Strings stay Python objects so a renamed body or a new shape fits in place
+    _columns = {
+        'name': np.array(names, dtype=object),
+        'name_key': np.array([name.lower() for name in names], dtype=object),
+        'type': rb["type"].astype(object),
+        'shape': rb["collision_shape"].astype(object),
+        'mass': rb["mass"].astype(np.float64),
+        'friction': rb["friction"].astype(np.float64),
+        'vertices': np.array([len(obj.data.vertices) if obj.type == 'MESH' else 0 for obj in objects], dtype=np.int64),
+        'enabled': rb["enabled"].astype(bool),
+        'kinematic': rb["kinematic"].astype(bool),
+    }
+    _rows = {obj.session_uid: index for index, obj in enumerate(objects)}
+    _dirty_rows.clear()
+    _scene_name = scene.name
+    _valid = True
+    _last_filter = (None, None)
+    _name_mask = (None, None)
+
+def _refresh_rows(objects):
+    """Re-read only the bodies changed since the last filter"""
+    global _last_filter, _name_mask
+    for uid in _dirty_rows:
+        index = _rows.get(uid)
+        if index is None:
+            continue
+        obj = objects[index]
+        if obj.rigid_body is None:
+            invalidate()
+            return
+        for column, value in zip(ROW_COLUMNS, _row(obj)):
+            _columns[column][index] = value
+    if _dirty_rows:
+        # A renamed body can change the name matches too
+        _last_filter = (None, None)
+        _name_mask = (None, None)
+    _dirty_rows.clear()
+
+def get_columns(scene, objects):
+    """Columns of every body in the world, rebuilt only when bodies were added or removed"""
+    if not _valid or scene.name != _scene_name or len(_rows) != len(objects):
+        rebuild(scene, objects)
+    else:
+        _refresh_rows(objects)
+        if not _valid:
+            rebuild(scene, objects)
+    return _columns
+
+@persistent
+def on_depsgraph_update(scene, depsgraph):
+    """Note which bodies changed, they are re-read the next time the list filters"""
+    if not _valid:
+        return
+    for update in depsgraph.updates:
+        data = update.id
+        if isinstance(data, bpy.types.Collection):
+            invalidate()
+            return
+        if not isinstance(data, bpy.types.Object):
+            continue
+        # Moving bodies, e.g. during playback, changes none of the columns
+        if update.is_updated_transform and not update.is_updated_geometry:
+            continue
+        _dirty_rows.add(data.original.session_uid)
+        if len(_dirty_rows) > len(_rows) * REBUILD_FRACTION:
+            invalidate()
+            return
+
+@persistent
+def on_load(dummy):
+    invalidate()
+
+def body_states(scene, columns):
+    """State of every body as an index into STATE_ITEMS"""
+    baked = scene.rigidbody_world.point_cache.is_baked
+    states = np.full(len(columns['enabled']), 1 if baked else 2, dtype=np.int64)
+    states[columns['kinematic']] = 3
+    states[~columns['enabled']] = 4
+    return states
+
+def name_mask(columns, name_filter):
+    """Bodies whose name matches the list's name filter, kept while only other filters change"""
+    global _name_mask
+    if _name_mask[1] is not None and _name_mask[0] == name_filter:
+        return _name_mask[1]
+    if name_filter:
+        pattern = re.compile(fnmatch.translate(f"*{name_filter.lower()}*"))
+        mask = np.fromiter((pattern.match(name) is not None for name in columns['name_key']),
+                           dtype=bool, count=len(columns['name_key']))
+    else:
+        mask = np.ones(len(columns['name_key']), dtype=bool)
+    _name_mask = (name_filter, mask)
+    return mask
+
+def filter_bodies(scene, objects, name_filter, filters, sort_by):
+    """Visibility mask and display order of the bodies, both computed on whole columns"""
+    global _last_filter
+    columns = get_columns(scene, objects)
+    key = (name_filter, filters, sort_by, scene.rigidbody_world.point_cache.is_baked)
+    if _last_filter[0] == key:
+        return _last_filter[1]
+
+    visible = name_mask(columns, name_filter).copy()
+
+    body_type, shape, state, min_mass, max_mass, min_friction, max_friction, min_vertices = filters
+    if body_type != 'ALL':
+        visible &= columns['type'] == body_type
+    if shape != 'ALL':
+        visible &= columns['shape'] == shape
+    if state != 'ALL':
+        state_index = [identifier for identifier, _, _ in STATE_ITEMS].index(state)
+        visible &= body_states(scene, columns) == state_index
+    visible &= (columns['mass'] >= min_mass) & (columns['mass'] <= max_mass)
+    visible &= (columns['friction'] >= min_friction) & (columns['friction'] <= max_friction)
+    visible &= columns['vertices'] >= min_vertices
+
+    sort_column = {
+        'NAME': 'name_key', 'TYPE': 'type', 'SHAPE': 'shape',
+        'MASS': 'mass', 'FRICTION': 'friction', 'VERTICES': 'vertices',
+    }[sort_by]
+    order = np.argsort(columns[sort_column], kind='stable')
+    # UIList wants the display position of every item, it reverses the order itself
+    positions = np.empty(len(order), dtype=np.int64)
+    positions[order] = np.arange(len(order))
+
+    result = (visible, positions)
+    _last_filter = (key, result)
+    return result
+
+def select_body(context, index):
+    """Make a body of the list the only selected and the active object"""
+    objects = batch.world_bodies(context.scene)
+    if objects is None or not 0 <= index < len(objects):
+        return
+    obj = objects[index]
+    if context.view_layer.objects.get(obj.name) is None:
+        return
+    for selected in context.selected_objects:
+        selected.select_set(False)
+    obj.select_set(True)
+    context.view_layer.objects.active = obj
+
+def register():
+    bpy.app.handlers.depsgraph_update_post.append(on_depsgraph_update)
+    bpy.app.handlers.load_post.append(on_load)
+
+def unregister():
+    for handlers, handler in ((bpy.app.handlers.depsgraph_update_post, on_depsgraph_update),
+                              (bpy.app.handlers.load_post, on_load)):
+        if handler in handlers:
+            handlers.remove(handler)
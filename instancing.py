@@ -0,0 +1,80 @@
+import bpy
+import numpy as np
+import time
+
+from . import batch
+from .mesh_analysis import estimate_mesh_bytes
+
+def collect_instances(depsgraph, instancer):
+    """Read the evaluated mesh instances of an object, returns (source meshes, matrices)"""
+    sources = []
+    matrices = []
+    # Meshes that only exist in the evaluated geometry, keyed by their data pointer
+    generated = {}
+
+    for instance in depsgraph.object_instances:
+        if not instance.is_instance or instance.parent is None:
+            continue
+        if instance.parent.original != instancer or instance.object.type != 'MESH':
+            continue
+
+        source = instance.object.original
+        if source != instancer and source.type == 'MESH':
+            # Instanced object, share its mesh datablock
+            mesh = source.data
+        else:
+            # Geometry created by the node tree, copy it once per unique mesh
+            key = instance.object.data.as_pointer()
+            mesh = generated.get(key)
+            if mesh is None:
+                mesh = bpy.data.meshes.new_from_object(instance.object, depsgraph=depsgraph)
+                mesh.name = f"{instancer.name}_instance"
+                generated[key] = mesh
+
+        sources.append(mesh)
+        # Instance data is only valid during iteration
+        matrices.append(instance.matrix_world.copy())
+
+    return sources, matrices
+
+def instances_to_rigid_bodies(context, instancer, body_type='ACTIVE', collision_shape='CONVEX_HULL'):
+    """Turn the instances of an instancer into rigid body objects sharing mesh data"""
+    begin = time.perf_counter()
+    depsgraph = context.evaluated_depsgraph_get()
+    sources, matrices = collect_instances(depsgraph, instancer)
+    if not sources:
+        return None
+
+    # New objects go to their own collection so its object order matches ours
+    collection = bpy.data.collections.new(f"{instancer.name} Bodies")
+    context.scene.collection.children.link(collection)
+
+    digits = len(str(len(sources)))
+    objects = []
+    for index, mesh in enumerate(sources):
+        obj = bpy.data.objects.new(f"{instancer.name}_{index:0{digits}d}", mesh)
+        collection.objects.link(obj)
+        objects.append(obj)
+
+    # Copy every instance transform in one call (Blender matrices are column-major)
+    flat = np.array(matrices, dtype=np.float32).transpose(0, 2, 1).ravel()
+    collection.objects.foreach_set("matrix_world", flat)
+
+    batch.add_rigid_bodies(context, objects, body_type)
+    if collision_shape != 'CONVEX_HULL':
+        for obj in objects:
+            obj.rigid_body.collision_shape = collision_shape
+
+    # Memory shared instead of realizing one mesh copy per instance
+    unique = {mesh.session_uid: mesh for mesh in sources}
+    shared_bytes = sum(estimate_mesh_bytes(mesh) for mesh in unique.values())
+    realized_bytes = sum(estimate_mesh_bytes(unique[mesh.session_uid]) for mesh in sources)
+
+    return {
+        'objects': objects,
+        'collection': collection,
+        'meshes': len(unique),
+        'mesh_bytes': shared_bytes,
+        'saved_bytes': realized_bytes - shared_bytes,
+        'time': time.perf_counter() - begin,
+    }
@@ -0,0 +1,202 @@
+import collections
+import functools
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+# Number of operator runs kept in memory
+RING_SIZE = 256
+
+records = collections.deque(maxlen=RING_SIZE)
+
+def addon_version():
+    from . import bl_info
+    return ".".join(str(part) for part in bl_info["version"])
+
+def is_enabled(context):
+    settings = getattr(context.scene, "quick_rigid_settings", None)
+    return settings is not None and settings.enable_instrumentation
+
+def current_rss():
+    """Resident memory of the Blender process in bytes, or None if unknown"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            return None
+
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(PROCESS_MEMORY_COUNTERS)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return counters.WorkingSetSize
+        return None
+
+    try:
+        import resource
+        # Peak rather than current on macOS (bytes) and BSD (kilobytes)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except (ImportError, ValueError):
+        return None
+
+class Measurement:
+    """Wall time, object count and memory of one operator run"""
+
+    def __init__(self, operator, context):
+        self.operator = operator.bl_idname
+        self.selected = len(context.selected_objects) if context.selected_objects is not None else 0
+        rbw = context.scene.rigidbody_world
+        self.bodies = len(rbw.collection.objects) if rbw is not None and rbw.collection is not None else 0
+
+        # Nested measurements share the outer trace and never reset its peak,
+        # only a fresh trace starts from zero
+        self.owns_tracing = not tracemalloc.is_tracing()
+        if self.owns_tracing:
+            tracemalloc.start()
+
+        self.rss_before = current_rss()
+        self.start = time.perf_counter()
+
+    def finish(self, result):
+        wall_time = time.perf_counter() - self.start
+        _, peak = tracemalloc.get_traced_memory()
+        if self.owns_tracing:
+            tracemalloc.stop()
+        rss_after = current_rss()
+
+        records.append({
+            'operator': self.operator,
+            'version': addon_version(),
+            'timestamp': time.time(),
+            'result': sorted(result),
+            'wall_time': wall_time,
+            'selected': self.selected,
+            'bodies': self.bodies,
+            'tracemalloc_peak': peak,
+            'rss_delta': rss_after - self.rss_before if rss_after is not None and self.rss_before is not None else None,
+        })
+
+def _end_measurement(self, result):
+    """Finish the operator's running measurement, if it has one"""
+    measurement = getattr(self, "_qr_measurement", None)
+    if measurement is not None:
+        self._qr_measurement = None
+        measurement.finish(result)
+
+def _measured_call(method, self, context, args):
+    """Call an operator entry point, measuring it unless already measured"""
+    # Nested calls (invoke calling execute) belong to the outer measurement
+    if getattr(self, "_qr_measurement", None) is not None or not is_enabled(context):
+        return method(self, context, *args)
+
+    measurement = Measurement(self, context)
+    self._qr_measurement = measurement
+    try:
+        result = method(self, context, *args)
+    except Exception:
+        _end_measurement(self, {'ERROR'})
+        raise
+    if 'RUNNING_MODAL' not in result:
+        _end_measurement(self, result)
+    return result
+
+# Blender checks the argument count of operator methods, so each entry point
+# gets a wrapper with the exact signature
+def _wrap_execute(method):
+    @functools.wraps(method)
+    def execute(self, context):
+        return _measured_call(method, self, context, ())
+    return execute
+
+def _wrap_invoke(method):
+    @functools.wraps(method)
+    def invoke(self, context, event):
+        return _measured_call(method, self, context, (event,))
+    return invoke
+
+def _wrap_modal(method):
+    """Wrap modal so a measurement ends when the modal operator does"""
+    @functools.wraps(method)
+    def modal(self, context, event):
+        try:
+            result = method(self, context, event)
+        except Exception:
+            _end_measurement(self, {'ERROR'})
+            raise
+        if 'FINISHED' in result or 'CANCELLED' in result:
+            _end_measurement(self, result)
+        return result
+    return modal
+
+def _wrap_cancel(method):
+    """Wrap cancel so a modal run interrupted by Blender still ends its measurement"""
+    @functools.wraps(method)
+    def cancel(self, context):
+        try:
+            return method(self, context)
+        finally:
+            _end_measurement(self, {'CANCELLED'})
+    return cancel
+
+# Operator entry points and the wrapper each one gets
+WRAPPERS = (
+    ("execute", _wrap_execute),
+    ("invoke", _wrap_invoke),
+    ("modal", _wrap_modal),
+    ("cancel", _wrap_cancel),
+)
+
+def instrument(cls):
+    """Add opt-in timing and memory measurement to an operator class"""
+    for name, wrap in WRAPPERS:
+        method = cls.__dict__.get(name)
+        # Re-enabling the addon without a reload must not wrap twice
+        if method is None or getattr(method, "_qr_instrumented", False):
+            continue
+        wrapper = wrap(method)
+        wrapper._qr_instrumented = True
+        setattr(cls, name, wrapper)
+    return cls
+
+def uninstrument(cls):
+    """Put back the original entry points of an operator class"""
+    for name, _ in WRAPPERS:
+        method = cls.__dict__.get(name)
+        if method is not None and getattr(method, "_qr_instrumented", False):
+            setattr(cls, name, method.__wrapped__)
+    return cls
+
+def export_jsonl(filepath):
+    """Write all recorded runs to a JSON lines file"""
+    with open(filepath, "w") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    return len(records)
@@ -135,6 +135,7 @@ class VIEW3D_MT_quick_rigid_bake_submenu(bpy.types.Menu):
         
         if context.scene.rigidbody_world:
             # Bake options
+            layout.operator("quick_rigid.bake", text="Quick Bake", icon='PLAY')
             layout.operator("rigidbody.bake_to_keyframes", text="Bake to Keyframes", icon='KEY_HLT')
             layout.operator("ptcache.bake_all", text="Bake All Dynamics", icon='PHYSICS').bake=True
             layout.operator("ptcache.bake", text="Calculate to Frame", icon='PREVIEW_RANGE')
@@ -0,0 +1,172 @@
+import bmesh
+import hashlib
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+# Custom property on the mesh that keeps the results across file reloads
+PROPERTY = "quick_rigid_analysis"
+
+# In-memory results keyed by (mesh session uid, geometry hash)
+_cache = {}
+
+_executor = None
+
+def get_executor():
+    """Shared thread pool for the NumPy heavy work (NumPy releases the GIL)"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(thread_name_prefix="QuickRigidMeshAnalysis")
+    return _executor
+
+def shutdown():
+    """Stop the thread pool and forget in-memory results"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+    _cache.clear()
+
+def read_geometry(mesh):
+    """Read vertex positions and triangle indices of a mesh in bulk"""
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+
+    mesh.calc_loop_triangles()
+    tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", tris)
+
+    return co.reshape(-1, 3), tris.reshape(-1, 3)
+
+def geometry_hash(co, tris):
+    """Hash of the vertex and index buffers, identical geometry gives identical hashes"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(co).tobytes())
+    digest.update(np.ascontiguousarray(tris).tobytes())
+    return digest.hexdigest()
+
+def analyze_arrays(co, tris):
+    """Bounds, volume, area and principal axes of a mesh (safe to run on a worker thread)"""
+    result = {
+        'vertices': int(len(co)),
+        'triangles': int(len(tris)),
+        'min': [0.0, 0.0, 0.0],
+        'max': [0.0, 0.0, 0.0],
+        'volume': 0.0,
+        'area': 0.0,
+        'center': [0.0, 0.0, 0.0],
+        'axes': [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]],
+        'extents': [0.0, 0.0, 0.0],
+    }
+    if len(co) == 0:
+        return result
+
+    co = co.astype(np.float64)
+    result['min'] = co.min(axis=0).tolist()
+    result['max'] = co.max(axis=0).tolist()
+
+    if len(tris):
+        v0, v1, v2 = co[tris[:, 0]], co[tris[:, 1]], co[tris[:, 2]]
+        cross = np.cross(v1 - v0, v2 - v0)
+        result['area'] = float(np.linalg.norm(cross, axis=1).sum() / 2.0)
+        # Signed tetrahedron volumes, exact for closed meshes
+        result['volume'] = float(abs(np.einsum('ij,ij->i', v0, np.cross(v1, v2)).sum()) / 6.0)
+
+    # Principal axes give an oriented box for shape fitting
+    center = co.mean(axis=0)
+    centered = co - center
+    if len(co) > 2:
+        _, vectors = np.linalg.eigh(centered.T @ centered)
+        axes = vectors[:, ::-1].T
+    else:
+        axes = np.eye(3)
+    projected = centered @ axes.T
+    result['center'] = center.tolist()
+    result['axes'] = axes.tolist()
+    result['extents'] = (projected.max(axis=0) - projected.min(axis=0)).tolist()
+    return result
+
+def convex_hull(co):
+    """Vertex count and volume of the convex hull, runs on the main thread"""
+    if len(co) < 4:
+        return {'hull_vertices': int(len(co)), 'hull_volume': 0.0}
+
+    bm = bmesh.new()
+    try:
+        for point in co.tolist():
+            bm.verts.new(point)
+        result = bmesh.ops.convex_hull(bm, input=bm.verts[:])
+        # Only keep the hull itself
+        bmesh.ops.delete(bm, geom=result['geom_interior'] + result['geom_unused'], context='VERTS')
+        return {'hull_vertices': len(bm.verts), 'hull_volume': abs(bm.calc_volume())}
+    finally:
+        bm.free()
+
+def _stored(mesh, geo_hash):
+    """Return results saved on the mesh if they belong to this geometry"""
+    stored = mesh.get(PROPERTY)
+    if stored is None:
+        return None
+    try:
+        stored = stored.to_dict()
+    except AttributeError:
+        return None
+    return stored if stored.get('hash') == geo_hash else None
+
+def _store(mesh, analysis):
+    """Save results on the mesh so they survive a file reload"""
+    try:
+        mesh[PROPERTY] = analysis
+    except (TypeError, AttributeError):
+        # Linked library data is read-only, the in-memory cache still has it
+        pass
+
+def analyze_meshes(meshes, with_hull=False):
+    """Return analysis results for many meshes, reusing cached results where possible"""
+    unique = {mesh.session_uid: mesh for mesh in meshes}
+    geometry = {uid: read_geometry(mesh) for uid, mesh in unique.items()}
+
+    # Hash every mesh on the thread pool
+    executor = get_executor()
+    hash_jobs = {uid: executor.submit(geometry_hash, *geometry[uid]) for uid in unique}
+    hashes = {uid: job.result() for uid, job in hash_jobs.items()}
+
+    results = {}
+    pending = {}
+    for uid, mesh in unique.items():
+        analysis = _cache.get((uid, hashes[uid])) or _stored(mesh, hashes[uid])
+        if analysis is not None:
+            results[uid] = analysis
+        else:
+            pending[uid] = executor.submit(analyze_arrays, *geometry[uid])
+
+    changed = set()
+    for uid, job in pending.items():
+        analysis = job.result()
+        analysis['hash'] = hashes[uid]
+        results[uid] = analysis
+        changed.add(uid)
+
+    if with_hull:
+        for uid, analysis in results.items():
+            if 'hull_volume' not in analysis:
+                analysis.update(convex_hull(geometry[uid][0]))
+                changed.add(uid)
+
+    for uid, analysis in results.items():
+        _cache[(uid, hashes[uid])] = analysis
+        if uid in changed:
+            _store(unique[uid], analysis)
+
+    return {mesh.session_uid: results[mesh.session_uid] for mesh in meshes}
+
+def analyze_mesh(mesh, with_hull=False):
+    """Return analysis results for a single mesh"""
+    return analyze_meshes([mesh], with_hull)[mesh.session_uid]
+
+def estimate_mesh_bytes(mesh):
+    """Rough memory used by the geometry buffers of a mesh"""
+    return (len(mesh.vertices) * 12          # positions
+            + len(mesh.edges) * 8            # edge vertex pairs
+            + len(mesh.loops) * 8            # corner vertices and edges
+            + len(mesh.polygons) * 4         # face offsets
+            + len(mesh.loops) * 8 * len(mesh.uv_layers))
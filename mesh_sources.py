@@ -0,0 +1,144 @@
+import numpy as np
+
+from . import mesh_analysis
+
+# Shapes built from the mesh, the only ones that use the mesh source
+MESH_SHAPES = {'MESH', 'CONVEX_HULL'}
+
+# Modifiers that move vertices without adding any, they are part of the DEFORM source
+DEFORM_MODIFIERS = {
+    'ARMATURE', 'CAST', 'CURVE', 'DISPLACE', 'HOOK', 'LAPLACIANDEFORM', 'LATTICE',
+    'MESH_DEFORM', 'SHRINKWRAP', 'SIMPLE_DEFORM', 'SMOOTH', 'CORRECTIVE_SMOOTH',
+    'LAPLACIANSMOOTH', 'SURFACE_DEFORM', 'WARP', 'WAVE',
+}
+
+# Result of the last analysis, shown in the Bake box
+last_report = None
+
+def _evaluated_geometry(obj, depsgraph):
+    """Vertex positions and triangles of the evaluated mesh of an object"""
+    evaluated = obj.evaluated_get(depsgraph)
+    mesh = evaluated.to_mesh()
+    try:
+        return mesh_analysis.read_geometry(mesh)
+    finally:
+        evaluated.to_mesh_clear()
+
+def shape_deviation(co, tris, reference_co, reference_tris, shape):
+    """How much a collision shape changes when built from other geometry, relative to its size"""
+    if len(co) == 0 or len(reference_co) == 0:
+        return 1.0
+    low, high = reference_co.min(axis=0), reference_co.max(axis=0)
+    size = max(float(np.linalg.norm(high - low)), 1e-9)
+    bounds = max(np.abs(co.min(axis=0) - low).max(), np.abs(co.max(axis=0) - high).max()) / size
+
+    if shape == 'CONVEX_HULL':
+        volume = mesh_analysis.convex_hull(co)['hull_volume']
+        reference = mesh_analysis.convex_hull(reference_co)['hull_volume']
+    else:
+        volume = mesh_analysis.analyze_arrays(co, tris)['volume']
+        reference = mesh_analysis.analyze_arrays(reference_co, reference_tris)['volume']
+
+    # Compare volumes as a length so both measures share a scale
+    if reference > 1e-12:
+        volume_change = abs(np.cbrt(volume / reference) - 1.0)
+    else:
+        volume_change = 0.0 if volume <= 1e-12 else 1.0
+    return float(max(bounds, volume_change))
+
+# Lighter sources in order of preference when they are equally cheap
+LIGHTER_SOURCES = ('BASE', 'DEFORM')
+
+def _has_deform(obj):
+    """True if shape keys or deform modifiers make DEFORM differ from BASE"""
+    return obj.data.shape_keys is not None or any(
+        mod.type in DEFORM_MODIFIERS and mod.show_viewport for mod in obj.modifiers)
+
+def analyze(context, objects, tolerance):
+    """Compare the FINAL collision geometry of bodies with every lighter source, keeping the cheapest safe one"""
+    global last_report
+
+    candidates = [obj for obj in objects
+                  if obj.type == 'MESH' and obj.rigid_body is not None
+                  and obj.rigid_body.collision_shape in MESH_SHAPES
+                  and obj.rigid_body.mesh_source == 'FINAL'
+                  and obj.modifiers]
+
+    depsgraph = context.evaluated_depsgraph_get()
+    final = {obj.name: _evaluated_geometry(obj, depsgraph) for obj in candidates}
+    sources = {obj.name: {'BASE': mesh_analysis.read_geometry(obj.data)} for obj in candidates}
+
+    # DEFORM is the same geometry as BASE without shape keys or deform modifiers,
+    # otherwise evaluate it for all bodies at once with only deform modifiers enabled
+    deform = [obj for obj in candidates if _has_deform(obj)]
+    disabled = [mod for obj in deform for mod in obj.modifiers
+                if mod.show_viewport and mod.type not in DEFORM_MODIFIERS]
+    if disabled:
+        try:
+            for mod in disabled:
+                mod.show_viewport = False
+            depsgraph = context.evaluated_depsgraph_get()
+            depsgraph.update()
+            for obj in deform:
+                sources[obj.name]['DEFORM'] = _evaluated_geometry(obj, depsgraph)
+        finally:
+            for mod in disabled:
+                mod.show_viewport = True
+    else:
+        for obj in deform:
+            sources[obj.name]['DEFORM'] = _evaluated_geometry(obj, depsgraph)
+
+    rows = []
+    for obj in candidates:
+        final_co, final_tris = final[obj.name]
+        shape = obj.rigid_body.collision_shape
+        options = []
+        for source in LIGHTER_SOURCES:
+            geometry = sources[obj.name].get(source)
+            # Sources that don't drop any geometry have nothing to gain
+            if geometry is None or len(geometry[0]) >= len(final_co):
+                continue
+            deviation = shape_deviation(geometry[0], geometry[1], final_co, final_tris, shape)
+            options.append((len(geometry[0]), source, deviation))
+        if not options:
+            continue
+
+        # Cheapest source within the tolerance, or the closest one to show why none is
+        safe = sorted((option for option in options if option[2] <= tolerance),
+                      key=lambda option: (option[0], LIGHTER_SOURCES.index(option[1])))
+        vertices, source, deviation = safe[0] if safe else min(options, key=lambda option: option[2])
+        rows.append({
+            'name': obj.name,
+            'shape': shape,
+            'source': source,
+            'final_vertices': int(len(final_co)),
+            'vertices': int(vertices),
+            'deviation': deviation,
+            'safe': deviation <= tolerance,
+        })
+
+    rows.sort(key=lambda row: row['final_vertices'] - row['vertices'], reverse=True)
+    safe = [row for row in rows if row['safe']]
+    last_report = {
+        'checked': len(candidates),
+        'rows': rows,
+        'safe': len(safe),
+        'reduction': sum(row['final_vertices'] - row['vertices'] for row in safe),
+        'final_vertices': sum(row['final_vertices'] for row in safe),
+    }
+    return last_report
+
+def apply(objects_by_name):
+    """Switch every safe candidate of the last analysis to its lighter mesh source"""
+    if last_report is None:
+        return 0, 0
+    changed = 0
+    reduction = 0
+    for row in last_report['rows']:
+        obj = objects_by_name.get(row['name'])
+        if not row['safe'] or obj is None or obj.rigid_body is None:
+            continue
+        obj.rigid_body.mesh_source = row['source']
+        changed += 1
+        reduction += row['final_vertices'] - row['vertices']
+    return changed, reduction
@@ -0,0 +1,78 @@
+import numpy as np
+
+from . import batch
+
+# Numeric rigid body settings that can be edited across the selection,
+# with the lower limit Blender enforces for each of them
+NUMERIC_SETTINGS = {
+    'mass': 0.001,
+    'friction': 0.0,
+    'restitution': 0.0,
+}
+
+# Changes to the edited value are relative to each body's current value
+EDIT_MODES = [
+    ('ABSOLUTE', "Set", "Give every selected body the same value"),
+    ('RELATIVE', "Add", "Add the value to each body's current value"),
+    ('SCALE', "Multiply", "Multiply each body's current value by the value"),
+]
+
+# Values closer than this count as the same when deciding if a field is mixed
+MIXED_TOLERANCE = 1e-6
+
+def selected_bodies(context):
+    """Selected objects that have a rigid body"""
+    return [obj for obj in context.selected_objects if obj.rigid_body is not None]
+
+def selection_stats(objects):
+    """Min, max, mean and mixed state of every editable setting, from one gather"""
+    rb = batch.gather_rigid_body(objects, tuple(NUMERIC_SETTINGS) + ("collision_shape", "kinematic"))
+
+    stats = {}
+    for attr in NUMERIC_SETTINGS:
+        values = rb[attr].astype(np.float64)
+        low, high = float(values.min()), float(values.max())
+        stats[attr] = {
+            'min': low,
+            'max': high,
+            'mean': float(values.mean()),
+            'mixed': high - low > MIXED_TOLERANCE,
+        }
+
+    shapes, counts = np.unique(rb["collision_shape"], return_counts=True)
+    stats['collision_shape'] = {
+        'values': dict(zip(shapes.tolist(), counts.tolist())),
+        'mixed': len(shapes) > 1,
+    }
+
+    animated = int(np.count_nonzero(rb["kinematic"]))
+    stats['kinematic'] = {
+        'count': animated,
+        'mixed': 0 < animated < len(objects),
+    }
+    return stats
+
+def edit_numeric(objects, attr, mode, value):
+    """Change a numeric setting on many bodies at once, returns the number changed"""
+    current = batch.gather_rigid_body(objects, (attr,))[attr].astype(np.float64)
+    if mode == 'ABSOLUTE':
+        new = np.full_like(current, value)
+    elif mode == 'RELATIVE':
+        new = current + value
+    else:
+        new = current * value
+    new = np.maximum(new, NUMERIC_SETTINGS[attr])
+
+    changed = np.flatnonzero(np.abs(new - current) > MIXED_TOLERANCE)
+    for index, new_value in zip(changed.tolist(), new[changed].tolist()):
+        setattr(objects[index].rigid_body, attr, new_value)
+    return len(changed)
+
+def set_setting(objects, attr, value):
+    """Give every body the same value for a setting, returns the number changed"""
+    changed = 0
+    for obj in objects:
+        if getattr(obj.rigid_body, attr) != value:
+            setattr(obj.rigid_body, attr, value)
+            changed += 1
+    return changed
@@ -1,7 +1,29 @@
 import bpy
 from bpy.props import StringProperty
+from bpy_extras.io_utils import ExportHelper
+from mathutils import Vector
 
 from .presets import RigidBodyPreset, RigidBodyPresetManager
+from . import bake
+from . import batch
+from . import cache_manager
+from . import preflight
+from . import instancing
+from . import spawner
+from . import spatial
+from . import instrumentation
+from . import quality
+from . import multi_edit
+from . import compare
+from . import playback
+from . import hotspots
+from . import mesh_sources
+from . import settled
+from . import dedupe
+from . import bake_store
+from . import incremental
+from . import sweep
+from . import api
 
 class AddPassiveRigidBody(bpy.types.Operator):
     """Add passive rigid bodies to all selected mesh objects"""
@@ -23,12 +45,7 @@ class AddPassiveRigidBody(bpy.types.Operator):
             self.report({'ERROR'}, "Rigid bodies can only be added to mesh objects")
             return {'CANCELLED'}
         
-        # Add passive rigid body to each selected mesh object
-        for obj in selected_objects:
-            # Set the object as active
-            context.view_layer.objects.active = obj
-            # Add rigid body as passive
-            bpy.ops.rigidbody.objects_add(type='PASSIVE')
+        api.add_bodies(selected_objects, 'PASSIVE')
         
         # Restore the original active object if it was in the selected objects
         # or set the active object to the last processed object with a rigid body
@@ -62,12 +79,7 @@ class AddActiveRigidBody(bpy.types.Operator):
             self.report({'ERROR'}, "Rigid bodies can only be added to mesh objects")
             return {'CANCELLED'}
         
-        # Add active rigid body to each selected mesh object
-        for obj in selected_objects:
-            # Set the object as active
-            context.view_layer.objects.active = obj
-            # Add rigid body as active
-            bpy.ops.rigidbody.objects_add(type='ACTIVE')
+        api.add_bodies(selected_objects, 'ACTIVE')
         
         # Restore the original active object if it was in the selected objects
         # or set the active object to the last processed object with a rigid body
@@ -201,11 +213,11 @@ class ApplyRigidBodyPreset(bpy.types.Operator):
             self.report({'ERROR'}, "No selected objects with rigid bodies")
             return {'CANCELLED'}
             
-        # Apply preset to all selected objects with rigid bodies
-        count = 0
-        for obj in selected_rb_objects:
-            if RigidBodyPresetManager.apply_preset_by_name(self.preset_name, obj):
-                count += 1
+        try:
+            count = api.apply_preset(selected_rb_objects, self.preset_name, context.scene)
+        except KeyError as e:
+            self.report({'ERROR'}, str(e.args[0]))
+            return {'CANCELLED'}
                 
         if count > 0:
             self.report({'INFO'}, f"Applied preset '{self.preset_name}' to {count} objects")
@@ -250,6 +262,1231 @@ class DeleteRigidBodyPreset(bpy.types.Operator):
         self.report({'ERROR'}, f"Preset '{self.preset_name}' not found")
         return {'CANCELLED'}
 
+class QuickRigidBake(bpy.types.Operator):
+    """Bake the rigid body simulation frame by frame without blocking the interface"""
+    bl_idname = "quick_rigid.bake"
+    bl_label = "Quick Bake"
+    bl_options = {'REGISTER'}
+
+    # Seconds of simulation per timer tick, keeps the UI responsive between ticks
+    frame_budget = 0.05
+
+    _timer = None
+    _job = None
+    _content_hash = None
+
+    @classmethod
+    def poll(cls, context):
+        rbw = context.scene.rigidbody_world
+        return rbw is not None and rbw.collection is not None and bake.get_active_job() is None
+
+    def invoke(self, context, event):
+        return self.execute(context)
+
+    def execute(self, context):
+        scene = context.scene
+        point_cache = scene.rigidbody_world.point_cache
+
+        if point_cache.is_baked:
+            self.report({'WARNING'}, "Simulation is already baked, delete the bake first")
+            return {'CANCELLED'}
+
+        # An identical simulation was baked before, bring it back instead
+        settings = scene.quick_rigid_settings
+        self._content_hash, restored = None, False
+        if settings.use_bake_reuse:
+            self._content_hash, restored = api.restore_identical(scene)
+        if restored:
+            self.report({'INFO'}, f"Restored an identical bake in {bake.format_duration(bake_store.last_reuse['time'])}")
+            return {'FINISHED'}
+
+        # Large bakes go to disk before they can run the machine out of memory
+        if not point_cache.use_disk_cache and cache_manager.exceeds_memory_budget(scene):
+            if scene.quick_rigid_settings.auto_spill and cache_manager.spill_to_disk(scene):
+                self.report({'INFO'}, "Cache estimate exceeds the memory budget, using disk cache")
+            else:
+                self.report({'WARNING'}, "Cache estimate exceeds the memory budget")
+
+        settle = None
+        if settings.use_settle_detection:
+            settle = (settings.settle_speed, settings.settle_energy, settings.settle_frames)
+        self._job = api.bake_job(scene, settle=settle)
+        self._job.start()
+        bake.set_active_job(self._job)
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.01, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        job = self._job
+
+        if event.type == 'ESC' or job.cancel_requested:
+            return self.cancel_bake(context)
+
+        if event.type != 'TIMER':
+            # Let everything else through so the interface stays usable
+            return {'PASS_THROUGH'}
+
+        more = job.step_for(self.frame_budget)
+        bake.redraw_ui(context)
+
+        if more:
+            return {'RUNNING_MODAL'}
+
+        self.cleanup(context)
+        if job.finish():
+            api.finish_bake(context.scene, job, self._content_hash)
+            if job.settled:
+                self.report({'INFO'}, f"Settled at frame {job.settle.settled_frame}, baked {job.frames_done} frames "
+                                      f"in {bake.format_duration(job.elapsed)} "
+                                      f"(saved about {bake.format_duration(job.time_saved)})")
+            else:
+                self.report({'INFO'}, f"Baked {job.frames_done} frames in {bake.format_duration(job.elapsed)}")
+            return {'FINISHED'}
+
+        self.report({'WARNING'}, "Simulation cached but could not be converted to a bake")
+        return {'FINISHED'}
+
+    def cancel_bake(self, context):
+        """Stop the bake, keeping the frames that were already simulated"""
+        job = self._job
+        self.cleanup(context)
+        job.cancel()
+        self.report({'INFO'}, f"Bake cancelled at frame {job.frame}, cached frames kept")
+        return {'CANCELLED'}
+
+    def cleanup(self, context):
+        """Remove the timer and clear the running job"""
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        bake.set_active_job(None)
+        bake.redraw_ui(context)
+
+    def cancel(self, context):
+        # Called by Blender when the operator is interrupted (e.g. file load)
+        if self._job is not None and not self._job.finished:
+            self.cleanup(context)
+            self._job.cancel()
+
+class CancelQuickRigidBake(bpy.types.Operator):
+    """Cancel the running Quick Rigid bake, keeping the frames already cached"""
+    bl_idname = "quick_rigid.cancel_bake"
+    bl_label = "Cancel Bake"
+
+    @classmethod
+    def poll(cls, context):
+        return bake.get_active_job() is not None
+
+    def execute(self, context):
+        # The modal operator picks this up on its next event
+        bake.get_active_job().cancel_requested = True
+        return {'FINISHED'}
+
+class ScanDiskCache(bpy.types.Operator):
+    """Scan the point cache directory for cache sizes and stale caches"""
+    bl_idname = "quick_rigid.scan_disk_cache"
+    bl_label = "Scan Disk Cache"
+
+    @classmethod
+    def poll(cls, context):
+        rbw = context.scene.rigidbody_world
+        return rbw is not None and bool(bpy.data.filepath) and not cache_manager.is_scanning()
+
+    def execute(self, context):
+        directory = cache_manager.cache_directory(context.scene.rigidbody_world.point_cache)
+        if not directory:
+            self.report({'ERROR'}, "Save the file to use the disk cache")
+            return {'CANCELLED'}
+
+        # The scan runs on a background thread, the panel updates when it's done
+        cache_manager.start_scan(directory)
+        return {'FINISHED'}
+
+class PurgeStaleCaches(bpy.types.Operator):
+    """Delete cache files that no longer belong to anything in this file"""
+    bl_idname = "quick_rigid.purge_stale_caches"
+    bl_label = "Purge Stale Caches"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        result = cache_manager.scan_result
+        return result is not None and result['stale_size'] > 0 and not cache_manager.is_scanning()
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_confirm(self, event)
+
+    def execute(self, context):
+        removed_files, removed_bytes = cache_manager.purge_stale_caches()
+        self.report({'INFO'}, f"Removed {removed_files} files ({cache_manager.format_size(removed_bytes)})")
+
+        # Rescan so the panel reflects what is left on disk
+        cache_manager.start_scan(cache_manager.scan_result['directory'])
+        return {'FINISHED'}
+
+class BenchmarkCacheCompression(bpy.types.Operator):
+    """Compare write time, read time and size of each cache compression on this shot"""
+    bl_idname = "quick_rigid.benchmark_cache_compression"
+    bl_label = "Benchmark Compression"
+    bl_options = {'REGISTER'}
+
+    # Seconds of benchmarking per timer tick, same as the Quick Bake
+    frame_budget = 0.05
+
+    _timer = None
+    _benchmark = None
+
+    @classmethod
+    def poll(cls, context):
+        rbw = context.scene.rigidbody_world
+        return (rbw is not None and bool(bpy.data.filepath)
+                and not rbw.point_cache.is_baked and bake.get_active_job() is None)
+
+    def invoke(self, context, event):
+        return self.execute(context)
+
+    def execute(self, context):
+        settings = context.scene.quick_rigid_settings
+        self._benchmark = cache_manager.CompressionBenchmark(context.scene, settings.benchmark_frames)
+        self._benchmark.start()
+        # The bake of the compression being measured shows in the Bake box and blocks other bakes
+        bake.set_active_job(self._benchmark.job)
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.01, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        benchmark = self._benchmark
+
+        if event.type == 'ESC' or benchmark.job.cancel_requested:
+            self.cleanup(context)
+            self.report({'INFO'}, "Benchmark cancelled")
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        more = benchmark.step_for(self.frame_budget)
+        bake.set_active_job(benchmark.job)
+        bake.redraw_ui(context)
+        if more:
+            return {'RUNNING_MODAL'}
+
+        self.cleanup(context)
+        cache_manager.benchmark_results = benchmark.results
+        smallest = min(benchmark.results, key=lambda r: r['bytes'])
+        self.report({'INFO'}, f"Benchmark finished, smallest cache: {smallest['compression']}")
+        return {'FINISHED'}
+
+    def cleanup(self, context):
+        """Remove the timer and put the cache settings back"""
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        self._benchmark.restore()
+        bake.set_active_job(None)
+        bake.redraw_ui(context)
+
+    def cancel(self, context):
+        # Called by Blender when the operator is interrupted (e.g. file load)
+        if self._benchmark is not None:
+            self.cleanup(context)
+
+class SpillCacheToDisk(bpy.types.Operator):
+    """Store the rigid body cache on disk with the chosen compression"""
+    bl_idname = "quick_rigid.spill_cache_to_disk"
+    bl_label = "Use Disk Cache"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        rbw = context.scene.rigidbody_world
+        return rbw is not None and bool(bpy.data.filepath) and not rbw.point_cache.use_disk_cache
+
+    def execute(self, context):
+        if not cache_manager.spill_to_disk(context.scene):
+            self.report({'ERROR'}, "Save the file to use the disk cache")
+            return {'CANCELLED'}
+        self.report({'INFO'}, "Rigid body cache now stored on disk")
+        return {'FINISHED'}
+
+class RunPreflightCheck(bpy.types.Operator):
+    """Scan all rigid bodies for settings that slow down the simulation"""
+    bl_idname = "quick_rigid.preflight_check"
+    bl_label = "Preflight Check"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.rigidbody_world is not None
+
+    def execute(self, context):
+        issues = preflight.scan_scene(context.scene)
+        preflight.store_issues(context.scene, issues)
+
+        if not issues:
+            self.report({'INFO'}, "No performance issues found")
+        else:
+            total = sum(issue['cost'] for issue in issues)
+            self.report({'WARNING'}, f"Found {len(issues)} issues, estimated cost {total:.1f} body equivalents")
+        return {'FINISHED'}
+
+class FixPreflightIssue(bpy.types.Operator):
+    """Apply the suggested fix for a preflight issue"""
+    bl_idname = "quick_rigid.fix_preflight_issue"
+    bl_label = "Fix Issue"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    index: bpy.props.IntProperty(
+        name="Issue Index",
+        description="Index of the issue to fix",
+        default=0
+    )
+
+    def execute(self, context):
+        issues = context.scene.quick_rigid_issues
+        if not 0 <= self.index < len(issues):
+            self.report({'ERROR'}, "Issue not found")
+            return {'CANCELLED'}
+
+        item = issues[self.index]
+        if item.fix == 'SELECT':
+            return bpy.ops.quick_rigid.select_preflight_issue(index=self.index)
+
+        changed = preflight.fix_issue(context.scene, item)
+        if changed == 0:
+            # Keep the issue listed, nothing was fixed
+            if item.fix == 'APPLY_SCALE':
+                self.report({'WARNING'}, f"Could not fix '{item.name}': scale can't be applied to shared meshes or parents")
+            else:
+                self.report({'WARNING'}, f"Could not fix '{item.name}': no objects were changed")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Fixed '{item.name}' on {changed} objects")
+        issues.remove(self.index)
+        return {'FINISHED'}
+
+class SelectPreflightIssue(bpy.types.Operator):
+    """Select the objects affected by a preflight issue"""
+    bl_idname = "quick_rigid.select_preflight_issue"
+    bl_label = "Select Issue Objects"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    index: bpy.props.IntProperty(
+        name="Issue Index",
+        description="Index of the issue to select",
+        default=0
+    )
+
+    def execute(self, context):
+        issues = context.scene.quick_rigid_issues
+        if not 0 <= self.index < len(issues):
+            self.report({'ERROR'}, "Issue not found")
+            return {'CANCELLED'}
+
+        objects = [bpy.data.objects.get(name) for name in issues[self.index].get_objects()]
+        objects = [obj for obj in objects if obj is not None and obj.name in context.view_layer.objects]
+        if not objects:
+            self.report({'WARNING'}, "None of the affected objects are in this view layer")
+            return {'CANCELLED'}
+
+        for obj in context.selected_objects:
+            obj.select_set(False)
+        for obj in objects:
+            obj.select_set(True)
+        # The worst offender comes first
+        context.view_layer.objects.active = objects[0]
+        self.report({'INFO'}, f"Selected {len(objects)} objects")
+        return {'FINISHED'}
+
+class InstancesToRigidBodies(bpy.types.Operator):
+    """Turn the Geometry Nodes instances of the active object into rigid bodies sharing mesh data"""
+    bl_idname = "quick_rigid.instances_to_rigid_bodies"
+    bl_label = "Instances to Rigid Bodies"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    body_type: bpy.props.EnumProperty(
+        name="Type",
+        description="Rigid body type of the new objects",
+        items=[
+            ('ACTIVE', "Active", "Simulated bodies"),
+            ('PASSIVE', "Passive", "Static colliders"),
+        ],
+        default='ACTIVE'
+    )
+
+    collision_shape: bpy.props.EnumProperty(
+        name="Shape",
+        description="Collision shape of the new bodies",
+        items=[
+            ('BOX', "Box", ""),
+            ('SPHERE', "Sphere", ""),
+            ('CONVEX_HULL', "Convex Hull", ""),
+            ('MESH', "Mesh", ""),
+        ],
+        default='CONVEX_HULL'
+    )
+
+    hide_instancer: bpy.props.BoolProperty(
+        name="Hide Instancer",
+        description="Hide the instancer so the instances are not shown twice",
+        default=True
+    )
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and any(mod.type == 'NODES' for mod in obj.modifiers)
+
+    def execute(self, context):
+        instancer = context.active_object
+        result = instancing.instances_to_rigid_bodies(context, instancer, self.body_type, self.collision_shape)
+        if result is None:
+            self.report({'ERROR'}, "The active object has no mesh instances")
+            return {'CANCELLED'}
+
+        if self.hide_instancer:
+            instancer.hide_set(True)
+            instancer.hide_render = True
+
+        self.report({'INFO'}, f"Created {len(result['objects'])} bodies from {result['meshes']} shared meshes "
+                              f"in {result['time']:.2f}s, mesh data {cache_manager.format_size(result['mesh_bytes'])} "
+                              f"({cache_manager.format_size(result['saved_bytes'])} saved)")
+        return {'FINISHED'}
+
+class SpawnRigidBodyPool(bpy.types.Operator):
+    """Build a pool of bodies from the selected meshes and release them over time"""
+    bl_idname = "quick_rigid.spawn_pool"
+    bl_label = "Timed Spawner"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    count: bpy.props.IntProperty(
+        name="Count",
+        description="Number of bodies in the pool",
+        default=100,
+        min=1
+    )
+
+    frame_start: bpy.props.IntProperty(
+        name="Start Frame",
+        description="Frame the first body is released on",
+        default=1
+    )
+
+    rate: bpy.props.FloatProperty(
+        name="Rate",
+        description="Bodies released per frame",
+        default=1.0,
+        min=0.01
+    )
+
+    radius: bpy.props.FloatProperty(
+        name="Radius",
+        description="Radius around the 3D cursor bodies are released in",
+        default=2.0,
+        min=0.0,
+        subtype='DISTANCE'
+    )
+
+    height: bpy.props.FloatProperty(
+        name="Height",
+        description="Height range above the 3D cursor bodies are released in",
+        default=0.5,
+        min=0.0,
+        subtype='DISTANCE'
+    )
+
+    hold_depth: bpy.props.FloatProperty(
+        name="Hold Depth",
+        description="How far below the 3D cursor waiting bodies are parked",
+        default=1000.0,
+        min=0.0,
+        subtype='DISTANCE'
+    )
+
+    mode: bpy.props.EnumProperty(
+        name="Waiting State",
+        description="How bodies wait in the pool before release",
+        items=[
+            ('KINEMATIC', "Animated", "Waiting bodies are animated (kinematic)"),
+            ('DISABLED', "Disabled", "Waiting bodies have their simulation disabled"),
+        ],
+        default='KINEMATIC'
+    )
+
+    seed: bpy.props.IntProperty(
+        name="Seed",
+        description="Random seed for the release positions",
+        default=0,
+        min=0
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return any(obj.type == 'MESH' for obj in context.selected_objects)
+
+    def invoke(self, context, event):
+        self.frame_start = context.scene.frame_current
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        templates = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if not templates:
+            self.report({'ERROR'}, "Select mesh objects to spawn")
+            return {'CANCELLED'}
+
+        objects, last_frame = spawner.spawn(
+            context, templates, self.count, self.frame_start, self.rate,
+            context.scene.cursor.location, self.radius, self.height,
+            self.hold_depth, self.mode, self.seed)
+
+        self.report({'INFO'}, f"Spawning {len(objects)} bodies from frame {self.frame_start} to {last_frame}")
+        return {'FINISHED'}
+
+class SelectRigidBodiesSpatial(bpy.types.Operator):
+    """Select rigid bodies by their position in the scene"""
+    bl_idname = "quick_rigid.select_spatial"
+    bl_label = "Select Rigid Bodies by Position"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        description="How bodies are chosen",
+        items=[
+            ('RADIUS', "Radius", "Bodies within a radius of the 3D cursor"),
+            ('NEAREST', "Nearest", "The bodies closest to the 3D cursor"),
+            ('BOUNDS', "Inside Active", "Bodies inside the bounding box of the active object"),
+            ('BELOW', "Below Active", "Bodies under the bounding box of the active object"),
+        ],
+        default='RADIUS'
+    )
+
+    radius: bpy.props.FloatProperty(
+        name="Radius",
+        description="Search radius around the 3D cursor",
+        default=2.0,
+        min=0.0,
+        subtype='DISTANCE'
+    )
+
+    count: bpy.props.IntProperty(
+        name="Count",
+        description="Number of bodies to select",
+        default=10,
+        min=1
+    )
+
+    body_type: bpy.props.EnumProperty(
+        name="Type",
+        description="Only select bodies of this type",
+        items=[
+            ('ANY', "Any", "Active and passive bodies"),
+            ('ACTIVE', "Active", "Only active bodies"),
+            ('PASSIVE', "Passive", "Only passive bodies"),
+        ],
+        default='ANY'
+    )
+
+    extend: bpy.props.BoolProperty(
+        name="Extend",
+        description="Add to the current selection instead of replacing it",
+        default=False
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.rigidbody_world is not None
+
+    def execute(self, context):
+        scene = context.scene
+        center = scene.cursor.location
+
+        if self.mode == 'RADIUS':
+            names = spatial.in_radius(scene, center, self.radius, self.body_type)
+        elif self.mode == 'NEAREST':
+            names = spatial.nearest(scene, center, self.count, self.body_type)
+        else:
+            reference = context.active_object
+            if reference is None:
+                self.report({'ERROR'}, "No active object to use as bounds")
+                return {'CANCELLED'}
+            corners = [reference.matrix_world @ Vector(corner) for corner in reference.bound_box]
+            bounds_min = [min(co[axis] for co in corners) for axis in range(3)]
+            bounds_max = [max(co[axis] for co in corners) for axis in range(3)]
+            names = spatial.in_bounds(scene, bounds_min, bounds_max, self.body_type, below=self.mode == 'BELOW')
+            names = [name for name in names if name != reference.name]
+
+        view_layer_objects = context.view_layer.objects
+        objects = [view_layer_objects.get(name) for name in names]
+        objects = [obj for obj in objects if obj is not None]
+
+        if not self.extend:
+            for obj in context.selected_objects:
+                obj.select_set(False)
+        for obj in objects:
+            obj.select_set(True)
+        if objects and self.mode in {'RADIUS', 'NEAREST'}:
+            context.view_layer.objects.active = objects[0]
+
+        self.report({'INFO'}, f"Selected {len(objects)} rigid bodies")
+        return {'FINISHED'}
+
+class ExportOperatorTimings(bpy.types.Operator, ExportHelper):
+    """Export the recorded Quick Rigid operator timings as JSON lines"""
+    bl_idname = "quick_rigid.export_timings"
+    bl_label = "Export Timings"
+
+    filename_ext = ".jsonl"
+
+    filter_glob: StringProperty(
+        default="*.jsonl",
+        options={'HIDDEN'}
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return len(instrumentation.records) > 0
+
+    def execute(self, context):
+        try:
+            count = instrumentation.export_jsonl(self.filepath)
+        except OSError as e:
+            self.report({'ERROR'}, f"Could not write timings: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Exported {count} operator timings")
+        return {'FINISHED'}
+
+class ClearOperatorTimings(bpy.types.Operator):
+    """Forget all recorded Quick Rigid operator timings"""
+    bl_idname = "quick_rigid.clear_timings"
+    bl_label = "Clear Timings"
+
+    def execute(self, context):
+        instrumentation.records.clear()
+        return {'FINISHED'}
+
+class SetQualityTier(bpy.types.Operator):
+    """Switch substeps, solver iterations, shapes and simulated bodies to a quality tier"""
+    bl_idname = "quick_rigid.set_quality_tier"
+    bl_label = "Set Quality Tier"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    tier: bpy.props.EnumProperty(
+        name="Tier",
+        description="Quality tier to switch to",
+        items=[
+            ('DRAFT', "Draft", "Fastest iteration"),
+            ('PREVIEW', "Preview", "Balanced speed and quality"),
+            ('FINAL', "Final", "Restore your original settings"),
+        ],
+        default='FINAL'
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.rigidbody_world is not None
+
+    def execute(self, context):
+        scene = context.scene
+        if scene.rigidbody_world.point_cache.is_baked:
+            self.report({'WARNING'}, "Delete the bake before changing the quality tier")
+            return {'CANCELLED'}
+
+        quality.set_tier(scene, self.tier)
+        self.report({'INFO'}, f"Switched to {self.tier.title()} quality")
+        return {'FINISHED'}
+
+class EditSelectedBodies(bpy.types.Operator):
+    """Change a numeric rigid body setting on every selected body at once"""
+    bl_idname = "quick_rigid.edit_selected_bodies"
+    bl_label = "Edit Selected Bodies"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    attribute: bpy.props.EnumProperty(
+        name="Setting",
+        description="Rigid body setting to change",
+        items=[
+            ('mass', "Mass", "Mass of the bodies"),
+            ('friction', "Friction", "Resistance of the bodies to movement"),
+            ('restitution', "Bounciness", "Tendency of the bodies to bounce after colliding"),
+        ],
+        default='mass'
+    )
+
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        description="How the value changes the current settings",
+        items=multi_edit.EDIT_MODES,
+        default='ABSOLUTE'
+    )
+
+    value: bpy.props.FloatProperty(
+        name="Value",
+        description="New value, amount to add or factor to multiply by",
+        default=1.0
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return any(obj.rigid_body for obj in context.selected_objects)
+
+    def invoke(self, context, event):
+        # Start from the mean so Set keeps the selection roughly where it is
+        if self.mode == 'ABSOLUTE':
+            stats = multi_edit.selection_stats(multi_edit.selected_bodies(context))
+            self.value = stats[self.attribute]['mean']
+        else:
+            self.value = 0.0 if self.mode == 'RELATIVE' else 1.0
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        bodies = multi_edit.selected_bodies(context)
+        changed = multi_edit.edit_numeric(bodies, self.attribute, self.mode, self.value)
+        self.report({'INFO'}, f"Changed {self.attribute} on {changed} of {len(bodies)} bodies")
+        return {'FINISHED'}
+
+class SetSelectedShape(bpy.types.Operator):
+    """Give every selected body the same collision shape"""
+    bl_idname = "quick_rigid.set_selected_shape"
+    bl_label = "Set Shape of Selected"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    shape: bpy.props.EnumProperty(
+        name="Shape",
+        description="Collision shape of the selected bodies",
+        items=[
+            ('BOX', "Box", ""),
+            ('SPHERE', "Sphere", ""),
+            ('CAPSULE', "Capsule", ""),
+            ('CYLINDER', "Cylinder", ""),
+            ('CONE', "Cone", ""),
+            ('CONVEX_HULL', "Convex Hull", ""),
+            ('MESH', "Mesh", ""),
+            ('COMPOUND', "Compound Parent", ""),
+        ],
+        default='CONVEX_HULL'
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return any(obj.rigid_body for obj in context.selected_objects)
+
+    def execute(self, context):
+        bodies = multi_edit.selected_bodies(context)
+        changed = multi_edit.set_setting(bodies, "collision_shape", self.shape)
+        self.report({'INFO'}, f"Changed the shape of {changed} bodies")
+        return {'FINISHED'}
+
+class SetSelectedAnimated(bpy.types.Operator):
+    """Turn the animated state of every selected body on or off"""
+    bl_idname = "quick_rigid.set_selected_animated"
+    bl_label = "Set Animated of Selected"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    animated: bpy.props.BoolProperty(
+        name="Animated",
+        description="Let the animation system move the bodies",
+        default=True
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return any(obj.rigid_body for obj in context.selected_objects)
+
+    def execute(self, context):
+        bodies = multi_edit.selected_bodies(context)
+        changed = multi_edit.set_setting(bodies, "kinematic", self.animated)
+        self.report({'INFO'}, f"Changed the animated state of {changed} bodies")
+        return {'FINISHED'}
+
+class CaptureBakeSnapshot(bpy.types.Operator):
+    """Sample the transforms of every body over the cached range for comparison"""
+    bl_idname = "quick_rigid.capture_bake_snapshot"
+    bl_label = "Capture Bake Snapshot"
+
+    slot: bpy.props.EnumProperty(
+        name="Slot",
+        description="Which side of the comparison to fill",
+        items=[
+            ('A', "A", "Reference bake"),
+            ('B', "B", "Bake to compare against the reference"),
+        ],
+        default='A'
+    )
+
+    @classmethod
+    def poll(cls, context):
+        rbw = context.scene.rigidbody_world
+        return rbw is not None and rbw.point_cache.is_baked
+
+    def execute(self, context):
+        snapshot = compare.sample_transforms(context.scene, self.slot)
+        if snapshot is None:
+            self.report({'WARNING'}, "The rigid body world has no bodies")
+            return {'CANCELLED'}
+
+        compare.comparison = None
+        self.report({'INFO'}, f"Captured {len(snapshot['names'])} bodies over {len(snapshot['frames'])} frames as {self.slot}")
+        return {'FINISHED'}
+
+class CompareBakes(bpy.types.Operator):
+    """Measure how far bake B diverges from bake A"""
+    bl_idname = "quick_rigid.compare_bakes"
+    bl_label = "Compare Bakes"
+
+    @classmethod
+    def poll(cls, context):
+        return 'A' in compare.snapshots and 'B' in compare.snapshots
+
+    def execute(self, context):
+        result = compare.compare()
+        if result is None:
+            self.report({'WARNING'}, "The snapshots have no bodies or frames in common")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"Similarity score {result['score']:.1f}, "
+                              f"mean divergence {result['position_mean']:.3g} m / {result['rotation_mean']:.2f}°")
+        return {'FINISHED'}
+
+class SelectDivergentBodies(bpy.types.Operator):
+    """Select the bodies that diverge the most between the compared bakes"""
+    bl_idname = "quick_rigid.select_divergent_bodies"
+    bl_label = "Select Worst Offenders"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return compare.comparison is not None and compare.comparison['worst_objects']
+
+    def execute(self, context):
+        names = [entry['name'] for entry in compare.comparison['worst_objects']]
+        objects = [context.view_layer.objects.get(name) for name in names]
+        objects = [obj for obj in objects if obj is not None]
+        if not objects:
+            return {'CANCELLED'}
+
+        for obj in context.selected_objects:
+            obj.select_set(False)
+        for obj in objects:
+            obj.select_set(True)
+        context.view_layer.objects.active = objects[0]
+        self.report({'INFO'}, f"Selected {len(objects)} objects")
+        return {'FINISHED'}
+
+class ClearBakeSnapshots(bpy.types.Operator):
+    """Forget both bake snapshots and free their memory"""
+    bl_idname = "quick_rigid.clear_bake_snapshots"
+    bl_label = "Clear Snapshots"
+
+    def execute(self, context):
+        compare.clear()
+        return {'FINISHED'}
+
+class ConvertToPlayback(bpy.types.Operator):
+    """Replace the baked bodies by one point cloud that instances their meshes for fast playback"""
+    bl_idname = "quick_rigid.convert_to_playback"
+    bl_label = "Convert to Playback"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        rbw = context.scene.rigidbody_world
+        return (rbw is not None and rbw.point_cache.is_baked
+                and not context.scene.quick_rigid_settings.playback_state)
+
+    def execute(self, context):
+        state = playback.convert_to_playback(context)
+        if state is None:
+            self.report({'WARNING'}, "The rigid body world has no mesh bodies")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"Converted {state['bodies']} bodies sharing {state['meshes']} meshes, "
+                              f"frame update {state['time_before'] * 1000:.1f} ms -> {state['time_after'] * 1000:.1f} ms")
+        return {'FINISHED'}
+
+class RestorePlaybackBodies(bpy.types.Operator):
+    """Bring back the original rigid bodies and remove the playback point cloud"""
+    bl_idname = "quick_rigid.restore_playback_bodies"
+    bl_label = "Restore Bodies"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return bool(context.scene.quick_rigid_settings.playback_state)
+
+    def execute(self, context):
+        restored = playback.restore_bodies(context)
+        self.report({'INFO'}, f"Restored {restored} bodies")
+        return {'FINISHED'}
+
+class AnalyzeBroadphaseHotspots(bpy.types.Operator):
+    """Count potential contact pairs per frame to find the objects and regions that slow the bake down"""
+    bl_idname = "quick_rigid.analyze_hotspots"
+    bl_label = "Analyze Hotspots"
+
+    frame_step: bpy.props.IntProperty(
+        name="Frame Step",
+        description="Analyze every Nth frame of the simulation range",
+        default=1,
+        min=1
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.rigidbody_world is not None and bake.get_active_job() is None
+
+    def execute(self, context):
+        wm = context.window_manager
+        wm.progress_begin(0.0, 1.0)
+        try:
+            result = hotspots.analyze(context.scene, self.frame_step, wm.progress_update)
+        finally:
+            wm.progress_end()
+
+        if result is None:
+            self.report({'WARNING'}, "Need at least two rigid bodies to analyze")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"Peak of {result['peak_pairs']} pairs at frame {result['peak_frame']}, "
+                              f"{result['mean_pairs']:.0f} on average")
+        return {'FINISHED'}
+
+class SelectHotspotBodies(bpy.types.Operator):
+    """Select the bodies involved in the most broadphase pairs, or the bodies inside a hot region"""
+    bl_idname = "quick_rigid.select_hotspot_bodies"
+    bl_label = "Select Hot Bodies"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    index: bpy.props.IntProperty(
+        name="Object Index",
+        description="Hot object to select, -1 selects all of them",
+        default=-1
+    )
+
+    region: bpy.props.IntProperty(
+        name="Region Index",
+        description="Hot region whose bodies (at the current frame) are selected, -1 to ignore",
+        default=-1
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return hotspots.last_analysis is not None
+
+    def execute(self, context):
+        result = hotspots.last_analysis
+        if self.region >= 0:
+            if self.region >= len(result['regions']):
+                return {'CANCELLED'}
+            region = result['regions'][self.region]
+            center, size = Vector(region['center']), Vector(region['size'])
+            names = spatial.in_bounds(context.scene, center - size / 2, center + size / 2)
+        elif self.index >= 0:
+            names = [entry['name'] for entry in result['objects'][self.index:self.index + 1]]
+        else:
+            names = [entry['name'] for entry in result['objects']]
+
+        objects = [context.view_layer.objects.get(name) for name in names]
+        objects = [obj for obj in objects if obj is not None]
+        if not objects:
+            self.report({'WARNING'}, "No bodies to select")
+            return {'CANCELLED'}
+
+        for obj in context.selected_objects:
+            obj.select_set(False)
+        for obj in objects:
+            obj.select_set(True)
+        context.view_layer.objects.active = objects[0]
+        self.report({'INFO'}, f"Selected {len(objects)} objects")
+        return {'FINISHED'}
+
+class AnalyzeMeshSources(bpy.types.Operator):
+    """Compare the collision geometry of modified bodies with their base and deform meshes"""
+    bl_idname = "quick_rigid.analyze_mesh_sources"
+    bl_label = "Analyze Mesh Sources"
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.rigidbody_world is not None
+
+    def execute(self, context):
+        settings = context.scene.quick_rigid_settings
+        objects = batch.world_bodies(context.scene) or []
+        report = mesh_sources.analyze(context, list(objects), settings.mesh_source_tolerance)
+        self.report({'INFO'}, f"{report['safe']} of {len(report['rows'])} candidates can switch, "
+                              f"saving {report['reduction']:,} collision vertices")
+        return {'FINISHED'}
+
+class ApplyMeshSources(bpy.types.Operator):
+    """Switch every safe candidate to its lighter mesh source"""
+    bl_idname = "quick_rigid.apply_mesh_sources"
+    bl_label = "Switch Safe Candidates"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return mesh_sources.last_report is not None and mesh_sources.last_report['safe'] > 0
+
+    def execute(self, context):
+        changed, reduction = mesh_sources.apply(bpy.data.objects)
+        mesh_sources.last_report = None
+        self.report({'INFO'}, f"Switched {changed} bodies, {reduction:,} fewer collision vertices")
+        return {'FINISHED'}
+
+class FreezeSettledState(bpy.types.Operator):
+    """Use the simulated transforms at the current frame as the initial state of the selected bodies"""
+    bl_idname = "quick_rigid.freeze_state"
+    bl_label = "Freeze as Initial State"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    rest_action: bpy.props.EnumProperty(
+        name="Resting Bodies",
+        description="What to do with bodies that have come to rest",
+        items=[
+            ('NONE', "Keep Active", "Leave resting bodies as they are"),
+            ('DEACTIVATED', "Start Deactivated", "Resting bodies sleep until something hits them"),
+            ('PASSIVE', "Make Passive", "Resting bodies become static colliders"),
+        ],
+        default='NONE'
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return (context.scene.rigidbody_world is not None and bake.get_active_job() is None
+                and any(obj.rigid_body for obj in context.selected_objects))
+
+    def execute(self, context):
+        settings = context.scene.quick_rigid_settings
+        result = settled.freeze_state(context.scene, context.selected_objects,
+                                      self.rest_action, settings.settle_speed)
+        if result is None:
+            self.report({'WARNING'}, "No simulated bodies selected")
+            return {'CANCELLED'}
+
+        message = f"Froze {result['frozen']} bodies"
+        if self.rest_action != 'NONE':
+            message += f", {result['resting']} at rest"
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+
+class MergeSettledDebris(bpy.types.Operator):
+    """Turn bodies that stay at rest into one passive collider, keeping the pieces for rendering"""
+    bl_idname = "quick_rigid.merge_settled_debris"
+    bl_label = "Merge Settled Debris"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    frames: bpy.props.IntProperty(
+        name="Rest Frames",
+        description="Bodies must stay at rest over this many frames before the current one",
+        default=20,
+        min=1
+    )
+
+    shape: bpy.props.EnumProperty(
+        name="Collider Shape",
+        description="Shape each piece contributes to the combined collider",
+        items=[
+            ('CONVEX_HULL', "Convex Hulls", "Convex hull of every piece"),
+            ('BOX', "Boxes", "Bounding box of every piece, cheapest"),
+        ],
+        default='CONVEX_HULL'
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.rigidbody_world is not None and bake.get_active_job() is None
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        settings = context.scene.quick_rigid_settings
+        result = settled.merge_resting(context, self.frames, self.shape, settings.settle_speed)
+        if result is None:
+            self.report({'WARNING'}, "Fewer than two bodies stayed at rest over the frame span")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"Merged {result['merged']} resting bodies into {result['collider'].name} "
+                              f"({result['vertices']:,} vertices), bodies {result['bodies_before']} -> {result['bodies_after']}")
+        return {'FINISHED'}
+
+class DedupeRigidBodyMeshes(bpy.types.Operator):
+    """Relink rigid bodies with identical geometry to one shared mesh"""
+    bl_idname = "quick_rigid.dedupe_meshes"
+    bl_label = "Deduplicate Meshes"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    tolerance: bpy.props.FloatProperty(
+        name="Tolerance",
+        description="Largest vertex deviation, relative to the mesh size, that still counts as identical",
+        default=dedupe.DEFAULT_TOLERANCE,
+        min=0.0,
+        max=0.01,
+        precision=5
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.rigidbody_world is not None and context.mode == 'OBJECT'
+
+    def execute(self, context):
+        objects = batch.world_bodies(context.scene) or []
+        result = dedupe.dedupe(list(objects), self.tolerance)
+        if not result['relinked']:
+            self.report({'INFO'}, "No duplicate meshes found")
+            return {'FINISHED'}
+
+        self.report({'INFO'}, f"Relinked {result['relinked']} bodies, removed {result['meshes_removed']} meshes "
+                              f"({cache_manager.format_size(result['saved_bytes'])} saved)")
+        return {'FINISHED'}
+
+class ClearBakeStore(bpy.types.Operator):
+    """Delete every bake kept for reuse"""
+    bl_idname = "quick_rigid.clear_bake_store"
+    bl_label = "Clear Stored Bakes"
+
+    def execute(self, context):
+        count, size = bake_store.store_size()
+        bake_store.clear_store()
+        self.report({'INFO'}, f"Deleted {count} stored bakes ({cache_manager.format_size(size)})")
+        return {'FINISHED'}
+
+class IncrementalRebake(bpy.types.Operator):
+    """Re-simulate only the frames affected by changes since the last bake"""
+    bl_idname = "quick_rigid.incremental_rebake"
+    bl_label = "Update Bake"
+
+    @classmethod
+    def poll(cls, context):
+        rbw = context.scene.rigidbody_world
+        return rbw is not None and rbw.point_cache.is_baked and bake.get_active_job() is None
+
+    def execute(self, context):
+        scene = context.scene
+        settings = scene.quick_rigid_settings
+
+        frame = incremental.first_affected_frame(scene)
+        if frame is None:
+            self.report({'INFO'}, "Nothing changed since the last bake")
+            return {'CANCELLED'}
+
+        reason = incremental.resume_blocker(scene, frame, settings.settle_speed)
+        if reason is not None:
+            # A full bake is the only way to get the same result
+            settled.free_bake(scene)
+            self.report({'INFO'}, f"Baking everything again, {reason}")
+            bpy.ops.quick_rigid.bake('INVOKE_DEFAULT')
+            return {'FINISHED'}
+
+        wm = context.window_manager
+        wm.progress_begin(0.0, 1.0)
+        try:
+            result = incremental.rebake_segment(scene, frame, wm.progress_update)
+        finally:
+            wm.progress_end()
+
+        quality.record_bake_time(scene, result['time'])
+        self.report({'INFO'}, f"Kept {result['kept']} cached frames, simulated {result['simulated']} "
+                              f"from frame {frame} in {bake.format_duration(result['time'])}")
+        return {'FINISHED'}
+
+class AddSweepParameter(bpy.types.Operator):
+    """Add a row to the parameter sweep grid"""
+    bl_idname = "quick_rigid.add_sweep_parameter"
+    bl_label = "Add Sweep Parameter"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        parameters = context.scene.quick_rigid_sweep_parameters
+        used = {item.parameter for item in parameters}
+        item = parameters.add()
+        # Start with the first setting that isn't in the grid yet
+        for identifier, _, _ in sweep.PARAMETER_ITEMS:
+            if identifier not in used:
+                item.parameter = identifier
+                break
+        return {'FINISHED'}
+
+class RemoveSweepParameter(bpy.types.Operator):
+    """Remove a row from the parameter sweep grid"""
+    bl_idname = "quick_rigid.remove_sweep_parameter"
+    bl_label = "Remove Sweep Parameter"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    index: bpy.props.IntProperty(
+        name="Index",
+        description="Grid row to remove",
+        default=0
+    )
+
+    def execute(self, context):
+        parameters = context.scene.quick_rigid_sweep_parameters
+        if 0 <= self.index < len(parameters):
+            parameters.remove(self.index)
+        return {'FINISHED'}
+
+class RunParameterSweep(bpy.types.Operator):
+    """Bake every combination of the grid in parallel background Blender processes"""
+    bl_idname = "quick_rigid.run_parameter_sweep"
+    bl_label = "Run Sweep"
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.rigidbody_world is not None and sweep.get_runner() is None
+
+    def execute(self, context):
+        try:
+            runs = sweep.build_grid(context.scene.quick_rigid_sweep_parameters)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        if not runs:
+            self.report({'WARNING'}, "Add at least one parameter to the grid")
+            return {'CANCELLED'}
+
+        runner = sweep.start_sweep(context, runs)
+        self.report({'INFO'}, f"Running {runner.total} bakes on {runner.workers} background processes")
+        return {'FINISHED'}
+
+class CancelParameterSweep(bpy.types.Operator):
+    """Stop the running parameter sweep, finished runs are kept"""
+    bl_idname = "quick_rigid.cancel_parameter_sweep"
+    bl_label = "Cancel Sweep"
+
+    @classmethod
+    def poll(cls, context):
+        return sweep.get_runner() is not None
+
+    def execute(self, context):
+        sweep.cancel_sweep()
+        return {'FINISHED'}
+
+class ApplySweepResult(bpy.types.Operator):
+    """Apply the values of a sweep run to the scene"""
+    bl_idname = "quick_rigid.apply_sweep_result"
+    bl_label = "Apply Sweep Result"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    index: bpy.props.IntProperty(
+        name="Run",
+        description="Grid index of the run to apply",
+        default=0
+    )
+
+    def execute(self, context):
+        result = next((result for result in sweep.results if result['index'] == self.index), None)
+        if result is None:
+            self.report({'WARNING'}, "Sweep result not found")
+            return {'CANCELLED'}
+
+        sweep.apply_parameters(context.scene, sweep.last_targets, result['params'])
+        self.report({'INFO'}, f"Applied {sweep.format_params(result['params'])}")
+        return {'FINISHED'}
+
 class ApplyShortcutKey(bpy.types.Operator):
     """Apply the selected shortcut key for the Quick Rigid menu"""
     bl_idname = "quick_rigid.apply_shortcut_key"
@@ -315,6 +1552,44 @@ classes = [
     AddRigidBodyPreset,
     ApplyRigidBodyPreset,
     DeleteRigidBodyPreset,
+    QuickRigidBake,
+    CancelQuickRigidBake,
+    ScanDiskCache,
+    PurgeStaleCaches,
+    BenchmarkCacheCompression,
+    SpillCacheToDisk,
+    RunPreflightCheck,
+    FixPreflightIssue,
+    SelectPreflightIssue,
+    InstancesToRigidBodies,
+    SpawnRigidBodyPool,
+    SelectRigidBodiesSpatial,
+    ExportOperatorTimings,
+    ClearOperatorTimings,
+    SetQualityTier,
+    EditSelectedBodies,
+    SetSelectedShape,
+    SetSelectedAnimated,
+    CaptureBakeSnapshot,
+    CompareBakes,
+    SelectDivergentBodies,
+    ClearBakeSnapshots,
+    ConvertToPlayback,
+    RestorePlaybackBodies,
+    AnalyzeBroadphaseHotspots,
+    SelectHotspotBodies,
+    AnalyzeMeshSources,
+    ApplyMeshSources,
+    FreezeSettledState,
+    MergeSettledDebris,
+    DedupeRigidBodyMeshes,
+    ClearBakeStore,
+    IncrementalRebake,
+    AddSweepParameter,
+    RemoveSweepParameter,
+    RunParameterSweep,
+    CancelParameterSweep,
+    ApplySweepResult,
     ApplyShortcutKey
 ]
 
@@ -322,10 +1597,13 @@ def register():
     """Register operator classes"""
     from bpy.utils import register_class
     for cls in classes:
+        # Timing is opt-in, the wrappers do nothing unless enabled in the settings
+        instrumentation.instrument(cls)
         register_class(cls)
 
 def unregister():
     """Unregister operator classes"""
     from bpy.utils import unregister_class
     for cls in reversed(classes):
-        unregister_class(cls)
\ No newline at end of file
+        unregister_class(cls)
+        instrumentation.uninstrument(cls)
\ No newline at end of file
@@ -1,5 +1,103 @@
 import bpy
+import numpy as np
 from .icons import get_icon_id  # Import the function to get icon ID
+from . import bake
+from . import cache_manager
+from . import dashboard
+from . import instrumentation
+from . import quality
+from . import multi_edit
+from . import compare
+from . import playback
+from . import hotspots
+from . import mesh_sources
+from . import bake_store
+from . import sweep
+from . import inspector
+
+class VIEW3D_UL_QuickRigidBodies(bpy.types.UIList):
+    """Rigid bodies of the world, filtered and sorted on whole columns at once"""
+    filter_type: bpy.props.EnumProperty(
+        name="Type",
+        items=[
+            ('ALL', "All Types", "Active and passive bodies"),
+            ('ACTIVE', "Active", "Only active bodies"),
+            ('PASSIVE', "Passive", "Only passive bodies"),
+        ],
+        default='ALL'
+    )
+    filter_shape: bpy.props.EnumProperty(
+        name="Shape",
+        items=[
+            ('ALL', "All Shapes", "Any collision shape"),
+            ('BOX', "Box", ""),
+            ('SPHERE', "Sphere", ""),
+            ('CAPSULE', "Capsule", ""),
+            ('CYLINDER', "Cylinder", ""),
+            ('CONE', "Cone", ""),
+            ('CONVEX_HULL', "Convex Hull", ""),
+            ('MESH', "Mesh", ""),
+            ('COMPOUND', "Compound Parent", ""),
+        ],
+        default='ALL'
+    )
+    filter_state: bpy.props.EnumProperty(
+        name="State",
+        items=inspector.STATE_ITEMS,
+        default='ALL'
+    )
+    min_mass: bpy.props.FloatProperty(name="Min Mass", default=0.0, min=0.0)
+    max_mass: bpy.props.FloatProperty(name="Max Mass", default=1e9, min=0.0)
+    min_friction: bpy.props.FloatProperty(name="Min Friction", default=0.0, min=0.0)
+    # Friction can go above 1, the default bound must not hide any body
+    max_friction: bpy.props.FloatProperty(name="Max Friction", default=1e9, min=0.0)
+    min_vertices: bpy.props.IntProperty(name="Min Vertices", default=0, min=0)
+    sort_by: bpy.props.EnumProperty(
+        name="Sort By",
+        items=inspector.SORT_ITEMS,
+        default='NAME'
+    )
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        # Only called for the rows on screen
+        rb = item.rigid_body
+        if rb is None:
+            layout.label(text=item.name, icon='ERROR')
+            return
+        row = layout.row(align=True)
+        row.label(text=item.name, icon='PINNED' if rb.type == 'PASSIVE' else 'UNPINNED')
+        row.label(text=rb.collision_shape.replace('_', ' ').title())
+        row.prop(rb, "mass", text="", emboss=False)
+        row.prop(rb, "friction", text="", emboss=False)
+
+    def draw_filter(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, "filter_name", text="")
+        row.prop(self, "use_filter_invert", text="", icon='ARROW_LEFTRIGHT')
+        row = layout.row(align=True)
+        row.prop(self, "sort_by", text="")
+        row.prop(self, "use_filter_sort_reverse", text="", icon='SORT_DESC' if self.use_filter_sort_reverse else 'SORT_ASC')
+        row = layout.row(align=True)
+        row.prop(self, "filter_type", text="")
+        row.prop(self, "filter_shape", text="")
+        row.prop(self, "filter_state", text="")
+        row = layout.row(align=True)
+        row.prop(self, "min_mass", text="Mass")
+        row.prop(self, "max_mass", text="to")
+        row = layout.row(align=True)
+        row.prop(self, "min_friction", text="Friction")
+        row.prop(self, "max_friction", text="to")
+        layout.prop(self, "min_vertices")
+
+    def filter_items(self, context, data, propname):
+        objects = getattr(data, propname)
+        if not len(objects):
+            return [], []
+        filters = (self.filter_type, self.filter_shape, self.filter_state, self.min_mass, self.max_mass,
+                   self.min_friction, self.max_friction, self.min_vertices)
+        visible, positions = inspector.filter_bodies(context.scene, objects, self.filter_name, filters, self.sort_by)
+        flags = np.where(visible, self.bitflag_filter_item, 0)
+        return flags.tolist(), positions.tolist()
 
 class VIEW3D_PT_QuickRigid(bpy.types.Panel):
     """Panel for Quick Rigid tools"""
@@ -20,6 +118,15 @@ class VIEW3D_PT_QuickRigid(bpy.types.Panel):
         # Get quick rigid settings - moved to the top so we can use it everywhere
         settings = context.scene.quick_rigid_settings
         
+        # Whole world statistics, shown regardless of the selection
+        if context.scene.rigidbody_world:
+            self.draw_dashboard(context, layout, settings)
+            self.draw_inspector(context, layout, settings)
+        
+        # The archived bodies can't be selected, so playback is managed up here
+        if settings.playback_state:
+            self.draw_playback(layout, settings)
+        
         if not context.selected_objects:
             layout.label(text="Select a mesh to add a rigid body", icon='INFO')
             # Still show addon settings even when nothing is selected
@@ -52,6 +159,13 @@ class VIEW3D_PT_QuickRigid(bpy.types.Panel):
             row.operator("object.add_active_rigid_body", text="Add Active", icon='MESH_MONKEY')
             row.operator("object.add_passive_rigid_body", text="Add Passive", icon='MESH_CUBE')
             
+            # Release copies of the selection over time
+            box.operator("quick_rigid.spawn_pool", text="Timed Spawner", icon='PARTICLES')
+            
+            # Geometry Nodes instancers can turn their instances into bodies
+            if context.active_object and any(mod.type == 'NODES' for mod in context.active_object.modifiers):
+                box.operator("quick_rigid.instances_to_rigid_bodies", text="Instances to Bodies", icon='OUTLINER_OB_POINTCLOUD')
+            
             # Remove button with red color
             remove_row = box.row()
             remove_row.alert = True  # This makes the button red
@@ -64,12 +178,23 @@ class VIEW3D_PT_QuickRigid(bpy.types.Panel):
                 icon = 'PINNED' if obj.rigid_body.type == 'PASSIVE' else 'UNPINNED'
                 type_row.label(text=f"Type: {obj.rigid_body.type.title()}", icon=icon)
 
+        # Spatial selection - collapsible
+        if context.scene.rigidbody_world:
+            self.draw_spatial_select(layout, settings)
+        
         # Get the active object and check for rigid body
         obj = context.active_object
         has_rigid_body = obj and hasattr(obj, "rigid_body") and obj.rigid_body is not None
         
-        # Only show the rigid body specific settings if active object has rigid body
-        if has_rigid_body:
+        # Only show the rigid body specific settings if active object has rigid body,
+        # or several selected objects do
+        bodies = multi_edit.selected_bodies(context)
+        if has_rigid_body or len(bodies) > 1:
+            # With several bodies selected the boxes edit all of them, gathered once per redraw
+            stats = None
+            if len(bodies) > 1 and (settings.show_main_settings or settings.show_mass or settings.show_surface):
+                stats = multi_edit.selection_stats(bodies)
+            
             # Main settings - collapsible
             box = layout.box()
             row = box.row()
@@ -78,16 +203,19 @@ class VIEW3D_PT_QuickRigid(bpy.types.Panel):
             row.label(text="Main Settings:", icon='SETTINGS')
             
             if settings.show_main_settings:
-                # Collision shape property
-                col = box.column(align=True)
-                col.prop(obj.rigid_body, "collision_shape", text="Shape", icon='MESH_ICOSPHERE')
-                
-                # Add a small space between shape and animated properties
-                box.separator(factor=0.5)
-                
-                # Animated property 
-                anim_row = box.row()
-                anim_row.prop(obj.rigid_body, "kinematic", text="Animated", icon='RENDER_ANIMATION', toggle=True)
+                if stats is not None:
+                    self.draw_multi_main_settings(box, stats, len(bodies))
+                else:
+                    # Collision shape property
+                    col = box.column(align=True)
+                    col.prop(obj.rigid_body, "collision_shape", text="Shape", icon='MESH_ICOSPHERE')
+                    
+                    # Add a small space between shape and animated properties
+                    box.separator(factor=0.5)
+                    
+                    # Animated property 
+                    anim_row = box.row()
+                    anim_row.prop(obj.rigid_body, "kinematic", text="Animated", icon='RENDER_ANIMATION', toggle=True)
                 
                 # Copy settings button
                 box.separator(factor=0.7)
@@ -103,7 +231,10 @@ class VIEW3D_PT_QuickRigid(bpy.types.Panel):
             
             if settings.show_mass:
                 col = box.column(align=True)
-                col.prop(obj.rigid_body, "mass", slider=True)
+                if stats is not None:
+                    self.draw_multi_numeric(col, stats, 'mass', "Mass")
+                else:
+                    col.prop(obj.rigid_body, "mass", slider=True)
                 col.operator("rigidbody.mass_calculate", text="Calculate Mass", icon='FILE_REFRESH')
 
             # Surface Response - collapsible
@@ -115,8 +246,12 @@ class VIEW3D_PT_QuickRigid(bpy.types.Panel):
             
             if settings.show_surface:
                 col = box.column(align=True)
-                col.prop(obj.rigid_body, "friction", slider=True)
-                col.prop(obj.rigid_body, "restitution", text="Bounciness", slider=True)
+                if stats is not None:
+                    self.draw_multi_numeric(col, stats, 'friction', "Friction")
+                    self.draw_multi_numeric(col, stats, 'restitution', "Bounciness")
+                else:
+                    col.prop(obj.rigid_body, "friction", slider=True)
+                    col.prop(obj.rigid_body, "restitution", text="Bounciness", slider=True)
 
             # Gravity and Simulation - collapsible
             box = layout.box()
@@ -202,14 +337,34 @@ class VIEW3D_PT_QuickRigid(bpy.types.Panel):
                 
                 # All bake options vertically stacked like in default Blender
                 bake_col.scale_y = 1.2
+                
+                # Non-blocking bake with live progress
+                job = bake.get_active_job()
+                if job is not None:
+                    self.draw_bake_progress(bake_col, job)
+                else:
+                    bake_col.operator("quick_rigid.bake", text="Quick Bake", icon='PLAY')
+                    if point_cache.is_baked:
+                        bake_col.operator("quick_rigid.incremental_rebake", text="Update Bake", icon='FILE_REFRESH')
+                    self.draw_settle_settings(bake_col, settings)
+                    bake_col.prop(settings, "use_bake_reuse", icon='FILE_CACHE')
+                bake_col.separator()
+                
                 bake_col.operator("rigidbody.bake_to_keyframes", text="Bake to Keyframes", icon='ACTION')
+                bake_col.operator_menu_enum("quick_rigid.freeze_state", "rest_action", text="Freeze as Initial State", icon='FREEZE')
+                bake_col.operator("quick_rigid.merge_settled_debris", text="Merge Settled Debris", icon='AUTOMERGE_ON')
                 bake_col.operator("ptcache.bake_all", text="Bake All Dynamics", icon='PHYSICS').bake=True
                 bake_col.operator("ptcache.bake", text="Calculate to Frame", icon='PREVIEW_RANGE')
                 
                 cache_op = bake_col.operator("ptcache.bake", text="Current Cache to Bake", icon='FILE_TICK')
                 cache_op.bake = True
                 
+                # Predicted cache footprint
+                bake_col.separator()
+                self.draw_cache_estimate(context, bake_box, settings)
+                
                 # Delete button with red color at the bottom
+                bake_col = bake_box.column(align=True)
                 bake_col.separator()
                 delete_row = bake_col.row(align=True)
                 delete_row.alert = True  # This makes the button red
@@ -217,6 +372,10 @@ class VIEW3D_PT_QuickRigid(bpy.types.Panel):
                 
                 bake_box.separator()
                 
+                # Preflight check - collapsible
+                self.draw_preflight(context, bake_box, settings)
+                self.draw_mesh_sources(bake_box, settings)
+                
                 # Frame range settings - collapsible
                 timeline_box = bake_box.box()
                 row = timeline_box.row()
@@ -245,11 +404,34 @@ class VIEW3D_PT_QuickRigid(bpy.types.Panel):
                 row.label(text="Simulation Settings:", icon='SETTINGS')
                 
                 if settings.show_sim_settings:
+                    # One-click quality tiers with their measured bake times
+                    bake_times = quality.get_bake_times(settings)
+                    tier_row = sim_box.row(align=True)
+                    for tier, label in (('DRAFT', "Draft"), ('PREVIEW', "Preview"), ('FINAL', "Final")):
+                        if tier in bake_times:
+                            label = f"{label} ({bake.format_duration(bake_times[tier])})"
+                        op = tier_row.operator("quick_rigid.set_quality_tier", text=label, 
+                                               depress=settings.quality_tier == tier)
+                        op.tier = tier
+                    
                     # Solver settings with better organization
                     col = sim_box.column(align=True)
                     col.prop(context.scene.rigidbody_world, "solver_iterations", text="Solver Iterations")
                     col.prop(context.scene.rigidbody_world, "use_split_impulse", text="Split Impulse")
                 
+                # Frames and regions that load the broadphase the most
+                self.draw_hotspots(bake_box, settings)
+                
+                # A/B comparison of two bakes
+                self.draw_compare(bake_box, settings)
+                
+                # Grid of settings baked in parallel background processes
+                self.draw_sweep(context, bake_box, settings)
+                
+                # Point cloud playback of the finished bake
+                if point_cache.is_baked and not settings.playback_state:
+                    bake_box.operator("quick_rigid.convert_to_playback", text="Convert to Playback", icon='OUTLINER_OB_POINTCLOUD')
+                
                 # Cache information - collapsible
                 cache_box = bake_box.box()
                 row = cache_box.row()
@@ -289,10 +471,471 @@ class VIEW3D_PT_QuickRigid(bpy.types.Panel):
                         disk_col.prop(point_cache, "compression", text="Compression")
                         disk_col.separator()
                         disk_col.prop(point_cache, "filepath", text="File Path")
+                        
+                        self.draw_disk_usage(cache_box, settings)
         
         # Always show settings box at the bottom
         self.draw_settings_box(context, layout, settings)
     
+    def draw_multi_main_settings(self, layout, stats, count):
+        """Draw shape and animated state of all selected bodies"""
+        shapes = stats['collision_shape']['values']
+        if stats['collision_shape']['mixed']:
+            shape_text = f"Mixed ({len(shapes)} shapes)"
+        else:
+            shape_text = next(iter(shapes)).replace('_', ' ').title()
+        col = layout.column(align=True)
+        col.operator_menu_enum("quick_rigid.set_selected_shape", "shape", text=f"Shape: {shape_text}", icon='MESH_ICOSPHERE')
+        
+        layout.separator(factor=0.5)
+        
+        animated = stats['kinematic']['count']
+        anim_row = layout.row(align=True)
+        anim_row.label(text=f"Animated: {animated} of {count}", icon='RENDER_ANIMATION')
+        op = anim_row.operator("quick_rigid.set_selected_animated", text="On", depress=animated == count)
+        op.animated = True
+        op = anim_row.operator("quick_rigid.set_selected_animated", text="Off", depress=animated == 0)
+        op.animated = False
+    
+    def draw_multi_numeric(self, layout, stats, attr, label):
+        """Draw the spread of a numeric setting with Set, Add and Multiply edits"""
+        values = stats[attr]
+        if values['mixed']:
+            text = f"{label}: Mixed {values['min']:.3g} - {values['max']:.3g} (mean {values['mean']:.3g})"
+        else:
+            text = f"{label}: {values['mean']:.3g}"
+        layout.label(text=text)
+        
+        edit_row = layout.row(align=True)
+        for mode, mode_label, _ in multi_edit.EDIT_MODES:
+            op = edit_row.operator("quick_rigid.edit_selected_bodies", text=mode_label)
+            op.attribute = attr
+            op.mode = mode
+    
+    def draw_inspector(self, context, layout, settings):
+        """Draw the list of every body in the world"""
+        rb_world = context.scene.rigidbody_world
+        if rb_world.collection is None:
+            return
+        box = layout.box()
+        row = box.row()
+        row.prop(settings, "show_inspector", icon="TRIA_DOWN" if settings.show_inspector else "TRIA_RIGHT", 
+                icon_only=True, emboss=False)
+        row.label(text="Inspector:", icon='VIEWZOOM')
+        
+        if not settings.show_inspector:
+            return
+        
+        box.template_list("VIEW3D_UL_QuickRigidBodies", "", rb_world.collection, "objects",
+                          settings, "inspector_index", rows=8)
+    
+    def draw_dashboard(self, context, layout, settings):
+        """Draw statistics of the whole rigid body world"""
+        box = layout.box()
+        row = box.row()
+        row.prop(settings, "show_dashboard", icon="TRIA_DOWN" if settings.show_dashboard else "TRIA_RIGHT", 
+                icon_only=True, emboss=False)
+        row.label(text="Dashboard:", icon='INFO')
+        
+        if not settings.show_dashboard:
+            return
+        
+        stats = dashboard.get_stats(context.scene)
+        col = box.column(align=True)
+        col.label(text=f"Bodies: {stats['bodies']}", icon='PHYSICS')
+        for body_type, count in sorted(stats['by_type'].items()):
+            if count:
+                col.label(text=f"    {body_type.title()}: {count}")
+        
+        col.separator()
+        col.label(text="Collision Shapes:", icon='MESH_ICOSPHERE')
+        for shape, count in sorted(stats['by_shape'].items(), key=lambda item: item[1], reverse=True):
+            col.label(text=f"    {shape.replace('_', ' ').title()}: {count}")
+        col.label(text=f"Mesh/Hull Vertices: {stats['mesh_vertices']:,}")
+        
+        col.separator()
+        col.label(text=f"Constraints: {stats['constraints']}", icon='CONSTRAINT')
+        
+        point_cache = context.scene.rigidbody_world.point_cache
+        if point_cache.is_baked:
+            cache_text, cache_icon = "Baked", 'CHECKMARK'
+        elif point_cache.is_baking:
+            cache_text, cache_icon = "Baking", 'TEMP'
+        elif point_cache.is_outdated:
+            cache_text, cache_icon = "Outdated", 'ERROR'
+        else:
+            cache_text, cache_icon = "Not Baked", 'X'
+        storage = "Disk" if point_cache.use_disk_cache else "Memory"
+        col.label(text=f"Cache: {cache_text} ({storage})", icon=cache_icon)
+    
+    def draw_spatial_select(self, layout, settings):
+        """Draw the spatial rigid body selection tools"""
+        box = layout.box()
+        row = box.row()
+        row.prop(settings, "show_spatial_select", icon="TRIA_DOWN" if settings.show_spatial_select else "TRIA_RIGHT", 
+                icon_only=True, emboss=False)
+        row.label(text="Select Bodies:", icon='RESTRICT_SELECT_OFF')
+        
+        if not settings.show_spatial_select:
+            return
+        
+        col = box.column(align=True)
+        col.prop(settings, "spatial_type", text="Type")
+        
+        radius_row = col.row(align=True)
+        radius_row.prop(settings, "spatial_radius", text="Radius")
+        op = radius_row.operator("quick_rigid.select_spatial", text="Around Cursor", icon='PIVOT_CURSOR')
+        op.mode = 'RADIUS'
+        op.radius = settings.spatial_radius
+        op.body_type = settings.spatial_type
+        
+        count_row = col.row(align=True)
+        count_row.prop(settings, "spatial_count", text="Count")
+        op = count_row.operator("quick_rigid.select_spatial", text="Nearest", icon='PIVOT_CURSOR')
+        op.mode = 'NEAREST'
+        op.count = settings.spatial_count
+        op.body_type = settings.spatial_type
+        
+        bounds_row = col.row(align=True)
+        op = bounds_row.operator("quick_rigid.select_spatial", text="Inside Active", icon='PIVOT_BOUNDBOX')
+        op.mode = 'BOUNDS'
+        op.body_type = settings.spatial_type
+        op = bounds_row.operator("quick_rigid.select_spatial", text="Below Active", icon='TRIA_DOWN_BAR')
+        op.mode = 'BELOW'
+        op.body_type = settings.spatial_type
+    
+    def draw_settle_settings(self, layout, settings):
+        """Draw settle detection options and the result of the last bake"""
+        layout.prop(settings, "use_settle_detection", icon='PAUSE')
+        if settings.use_settle_detection:
+            settle_col = layout.column(align=True)
+            settle_col.prop(settings, "settle_speed", text="Speed")
+            settle_col.prop(settings, "settle_energy", text="Energy")
+            settle_col.prop(settings, "settle_frames", text="Frames")
+        
+        result = bake.last_result
+        if result is not None and result['settled_frame'] is not None:
+            layout.label(text=f"Settled at frame {result['settled_frame']}, "
+                              f"saved {bake.format_duration(result['time_saved'])}", icon='CHECKMARK')
+    
+    def draw_bake_progress(self, layout, job):
+        """Draw progress, speed and timing of the running bake"""
+        layout.progress(factor=job.progress, type='BAR',
+                        text=f"Frame {job.frame} / {job.frame_end}")
+        
+        fps = f"{job.fps:.1f}" if job.fps is not None else "--"
+        info_col = layout.column(align=True)
+        info_col.label(text=f"Speed: {fps} fps", icon='TIME')
+        info_col.label(text=f"Elapsed: {bake.format_duration(job.elapsed)}")
+        info_col.label(text=f"Remaining: {bake.format_duration(job.eta)}")
+        if job.settle is not None and job.settle.moving is not None:
+            info_col.label(text=f"Moving: {job.settle.moving}, energy {job.settle.energy:.3g}")
+        
+        # Cancel button with red color
+        cancel_row = layout.row(align=True)
+        cancel_row.alert = True
+        cancel_row.operator("quick_rigid.cancel_bake", text="Cancel Bake", icon='CANCEL')
+    
+    def draw_preflight(self, context, layout, settings):
+        """Draw the preflight check and its ranked issues"""
+        from .preflight import ISSUE_KINDS
+        
+        preflight_box = layout.box()
+        row = preflight_box.row()
+        row.prop(settings, "show_preflight", icon="TRIA_DOWN" if settings.show_preflight else "TRIA_RIGHT", 
+                 icon_only=True, emboss=False)
+        row.label(text="Preflight Check:", icon='CHECKMARK')
+        
+        if not settings.show_preflight:
+            return
+        
+        preflight_box.operator("quick_rigid.preflight_check", text="Check Scene", icon='VIEWZOOM')
+        
+        issues = context.scene.quick_rigid_issues
+        if not issues:
+            return
+        
+        col = preflight_box.column(align=True)
+        for index, issue in enumerate(issues):
+            objects = issue.get_objects()
+            issue_row = col.row(align=True)
+            issue_row.label(text=f"{issue.name} ({len(objects)})", icon='ERROR')
+            issue_row.label(text=f"Cost {issue.cost:.1f}")
+            
+            select_op = issue_row.operator("quick_rigid.select_preflight_issue", text="", icon='RESTRICT_SELECT_OFF')
+            select_op.index = index
+            if issue.fix != 'SELECT':
+                fix_op = issue_row.operator("quick_rigid.fix_preflight_issue", text=ISSUE_KINDS[issue.kind][2])
+                fix_op.index = index
+            
+            if objects:
+                detail_row = col.row()
+                detail_row.enabled = False
+                detail_row.label(text=f"Worst: {objects[0]}")
+    
+    def draw_mesh_sources(self, layout, settings):
+        """Draw the mesh source optimizer and its candidates"""
+        source_box = layout.box()
+        row = source_box.row()
+        row.prop(settings, "show_mesh_sources", icon="TRIA_DOWN" if settings.show_mesh_sources else "TRIA_RIGHT", 
+                 icon_only=True, emboss=False)
+        row.label(text="Mesh Sources:", icon='MODIFIER')
+        
+        if not settings.show_mesh_sources:
+            return
+        
+        analyze_row = source_box.row(align=True)
+        analyze_row.prop(settings, "mesh_source_tolerance", text="Tolerance")
+        analyze_row.operator("quick_rigid.analyze_mesh_sources", text="Analyze", icon='VIEWZOOM')
+        source_box.operator("quick_rigid.dedupe_meshes", icon='LINKED')
+        
+        report = mesh_sources.last_report
+        if report is None:
+            return
+        
+        col = source_box.column(align=True)
+        col.label(text=f"{len(report['rows'])} of {report['checked']} modified bodies could use lighter geometry")
+        for row_data in report['rows'][:8]:
+            row = col.row()
+            row.label(text=f"{row_data['name']}: {row_data['final_vertices']:,} -> {row_data['vertices']:,} "
+                           f"({row_data['source'].title()}, {row_data['deviation'] * 100:.1f}%)",
+                      icon='CHECKMARK' if row_data['safe'] else 'ERROR')
+        
+        if report['safe']:
+            col.separator()
+            col.label(text=f"Collision vertices: -{report['reduction']:,} of {report['final_vertices']:,}")
+            source_box.operator("quick_rigid.apply_mesh_sources", icon='CHECKMARK')
+    
+    def draw_cache_estimate(self, context, layout, settings):
+        """Draw the predicted cache size against the memory budget"""
+        point_cache = context.scene.rigidbody_world.point_cache
+        estimate = cache_manager.estimate_cache_footprint(context.scene)
+        available = cache_manager.available_memory()
+        
+        col = layout.column(align=True)
+        col.label(text=f"Cache Estimate: {cache_manager.format_size(estimate['bytes'])}", icon='MEMORY')
+        col.label(text=f"{estimate['bodies']} bodies x {estimate['frames']} frames")
+        if available is not None:
+            col.label(text=f"Available Memory: {cache_manager.format_size(available)}")
+        
+        budget_row = col.row(align=True)
+        budget_row.prop(settings, "memory_budget", text="Budget (MB)")
+        budget_row.prop(settings, "auto_spill", text="", icon='DISK_DRIVE')
+        
+        # Reuse the numbers shown above, reading the system memory is not free
+        if not point_cache.use_disk_cache and cache_manager.over_budget(settings, estimate, available):
+            warn_row = col.row()
+            warn_row.alert = True
+            warn_row.label(text="Estimate exceeds memory budget", icon='ERROR')
+            
+            spill_row = col.row(align=True)
+            spill_row.prop(settings, "spill_compression", text="")
+            spill_row.operator("quick_rigid.spill_cache_to_disk", icon='DISK_DRIVE')
+    
+    def draw_playback(self, layout, settings):
+        """Draw the point cloud playback summary and the way back"""
+        state = playback.get_state(settings)
+        if state is None:
+            return
+        
+        box = layout.box()
+        col = box.column(align=True)
+        col.label(text="Point Cloud Playback", icon='OUTLINER_OB_POINTCLOUD')
+        col.label(text=f"{state['bodies']} bodies, {state['meshes']} meshes, {state['frames']} frames")
+        col.label(text=f"Frame update: {state['time_before'] * 1000:.1f} ms -> {state['time_after'] * 1000:.1f} ms")
+        box.operator("quick_rigid.restore_playback_bodies", icon='LOOP_BACK')
+    
+    def draw_hotspots(self, layout, settings):
+        """Draw the broadphase pair counts and the hottest objects and regions"""
+        hotspot_box = layout.box()
+        row = hotspot_box.row()
+        row.prop(settings, "show_hotspots", icon="TRIA_DOWN" if settings.show_hotspots else "TRIA_RIGHT", 
+                 icon_only=True, emboss=False)
+        row.label(text="Broadphase Hotspots:", icon='LIGHT_SUN')
+        
+        if not settings.show_hotspots:
+            return
+        
+        analyze_row = hotspot_box.row(align=True)
+        analyze_row.prop(settings, "hotspot_frame_step", text="Step")
+        op = analyze_row.operator("quick_rigid.analyze_hotspots", text="Analyze", icon='VIEWZOOM')
+        op.frame_step = settings.hotspot_frame_step
+        
+        result = hotspots.last_analysis
+        if result is None:
+            return
+        
+        col = hotspot_box.column(align=True)
+        col.label(text=f"Peak: {result['peak_pairs']} pairs at frame {result['peak_frame']}", icon='TIME')
+        col.label(text=f"Average: {result['mean_pairs']:.0f} pairs per frame")
+        
+        if result['objects']:
+            col.separator()
+            col.label(text="Hot Objects:")
+            for index, entry in enumerate(result['objects']):
+                object_row = col.row(align=True)
+                object_row.label(text=f"    {entry['name']}: {entry['pairs']} (peak {entry['peak']})")
+                op = object_row.operator("quick_rigid.select_hotspot_bodies", text="", icon='RESTRICT_SELECT_OFF')
+                op.index = index
+            op = hotspot_box.operator("quick_rigid.select_hotspot_bodies", text="Select All Hot Objects", icon='RESTRICT_SELECT_OFF')
+            op.index = -1
+        
+        if result['regions']:
+            col = hotspot_box.column(align=True)
+            col.label(text="Hot Regions:")
+            for index, region in enumerate(result['regions'][:5]):
+                x, y, z = region['center']
+                region_row = col.row(align=True)
+                region_row.label(text=f"    ({x:.1f}, {y:.1f}, {z:.1f}): {region['pairs']} pairs")
+                op = region_row.operator("quick_rigid.select_hotspot_bodies", text="", icon='SELECT_SET')
+                op.region = index
+    
+    def draw_sweep(self, context, layout, settings):
+        """Draw the parameter sweep grid, its progress and the results table"""
+        sweep_box = layout.box()
+        row = sweep_box.row()
+        row.prop(settings, "show_sweep", icon="TRIA_DOWN" if settings.show_sweep else "TRIA_RIGHT", 
+                 icon_only=True, emboss=False)
+        row.label(text="Parameter Sweep:", icon='NODE_COMPOSITING')
+        
+        if not settings.show_sweep:
+            return
+        
+        col = sweep_box.column(align=True)
+        for index, item in enumerate(context.scene.quick_rigid_sweep_parameters):
+            param_row = col.row(align=True)
+            param_row.prop(item, "parameter", text="")
+            param_row.prop(item, "values", text="")
+            param_row.operator("quick_rigid.remove_sweep_parameter", text="", icon='X').index = index
+        col.operator("quick_rigid.add_sweep_parameter", text="Add Parameter", icon='ADD')
+        
+        runner = sweep.get_runner()
+        if runner is not None:
+            progress_row = sweep_box.row(align=True)
+            progress_row.label(text=f"{runner.done}/{runner.total} runs, {len(runner.running)} running", icon='TEMP')
+            progress_row.operator("quick_rigid.cancel_parameter_sweep", text="", icon='CANCEL')
+        else:
+            sweep_box.operator("quick_rigid.run_parameter_sweep", text="Run Sweep", icon='PLAY')
+        
+        if not sweep.results:
+            return
+        
+        sweep_box.prop(settings, "sweep_sort")
+        col = sweep_box.column(align=True)
+        for result in sweep.sorted_results(settings.sweep_sort):
+            result_row = col.row(align=True)
+            if 'error' in result:
+                result_row.label(text=f"{sweep.format_params(result['params'])}: failed", icon='ERROR')
+                continue
+            settled_frame = result['settled_frame']
+            settle_text = f"settled {settled_frame}" if settled_frame is not None else "not settled"
+            result_row.label(text=f"{sweep.format_params(result['params'])}: {bake.format_duration(result['time'])}, "
+                                  f"{settle_text}, spread {result['spread']:.2f}, energy {result['energy']:.3f}")
+            result_row.operator("quick_rigid.apply_sweep_result", text="", icon='CHECKMARK').index = result['index']
+    
+    def draw_compare(self, layout, settings):
+        """Draw the A/B bake snapshots and the result of comparing them"""
+        compare_box = layout.box()
+        row = compare_box.row()
+        row.prop(settings, "show_compare", icon="TRIA_DOWN" if settings.show_compare else "TRIA_RIGHT", 
+                 icon_only=True, emboss=False)
+        row.label(text="Compare Bakes:", icon='ARROW_LEFTRIGHT')
+        
+        if not settings.show_compare:
+            return
+        
+        col = compare_box.column(align=True)
+        for slot in ('A', 'B'):
+            slot_row = col.row(align=True)
+            snapshot = compare.snapshots.get(slot)
+            text = f"{slot}: {snapshot['settings']}" if snapshot else f"{slot}: Not captured"
+            slot_row.label(text=text)
+            op = slot_row.operator("quick_rigid.capture_bake_snapshot", text="Capture", icon='IMAGE_REFERENCE')
+            op.slot = slot
+        
+        compare_row = compare_box.row(align=True)
+        compare_row.operator("quick_rigid.compare_bakes", icon='ARROW_LEFTRIGHT')
+        compare_row.operator("quick_rigid.clear_bake_snapshots", text="", icon='TRASH')
+        
+        result = compare.comparison
+        if result is None:
+            return
+        
+        col = compare_box.column(align=True)
+        col.label(text=f"Similarity: {result['score']:.1f} / 100", icon='CHECKMARK' if result['score'] > 90 else 'ERROR')
+        col.label(text=f"Position: mean {result['position_mean']:.3g} m, max {result['position_max']:.3g} m")
+        col.label(text=f"Rotation: mean {result['rotation_mean']:.2f}°, max {result['rotation_max']:.1f}°")
+        col.label(text=f"Worst frame: {result['worst_frame']}")
+        
+        if result['worst_objects']:
+            col.separator()
+            for entry in result['worst_objects'][:5]:
+                col.label(text=f"    {entry['name']}: {entry['position_max']:.3g} m, {entry['rotation_max']:.1f}°")
+            compare_box.operator("quick_rigid.select_divergent_bodies", icon='RESTRICT_SELECT_OFF')
+    
+    def draw_disk_usage(self, layout, settings):
+        """Draw cache sizes on disk and the compression benchmark"""
+        usage_box = layout.box()
+        row = usage_box.row()
+        row.prop(settings, "show_disk_usage", icon="TRIA_DOWN" if settings.show_disk_usage else "TRIA_RIGHT", 
+                 icon_only=True, emboss=False)
+        row.label(text="Disk Usage:", icon='FILE_CACHE')
+        
+        if not settings.show_disk_usage:
+            return
+        
+        scan_row = usage_box.row(align=True)
+        if cache_manager.is_scanning():
+            scan_row.label(text="Scanning...", icon='TEMP')
+        else:
+            scan_row.operator("quick_rigid.scan_disk_cache", text="Scan", icon='VIEWZOOM')
+        
+        result = cache_manager.scan_result
+        if result is not None and not cache_manager.is_scanning():
+            col = usage_box.column(align=True)
+            if not result['caches']:
+                col.label(text="No cache files found", icon='INFO')
+            for cache in result['caches']:
+                icon = 'ERROR' if cache['is_stale'] else ('PHYSICS' if cache['is_world'] else 'FILE')
+                col.label(text=f"{cache['label']}: {cache_manager.format_size(cache['size'])}, "
+                               f"{cache['frames']} frames", icon=icon)
+            col.separator()
+            col.label(text=f"Total: {cache_manager.format_size(result['total_size'])}")
+            
+            if result['stale_size'] > 0:
+                purge_row = usage_box.row()
+                purge_row.alert = True
+                purge_row.operator("quick_rigid.purge_stale_caches", 
+                                   text=f"Purge Stale ({cache_manager.format_size(result['stale_size'])})", 
+                                   icon='TRASH')
+        
+        # Compression benchmark
+        usage_box.separator()
+        bench_row = usage_box.row(align=True)
+        bench_row.prop(settings, "benchmark_frames", text="Frames")
+        bench_row.operator("quick_rigid.benchmark_cache_compression", text="Benchmark", icon='SORTTIME')
+        
+        if cache_manager.benchmark_results:
+            col = usage_box.column(align=True)
+            for entry in cache_manager.benchmark_results:
+                col.label(text=f"{entry['compression'].title()}: {cache_manager.format_size(entry['bytes'])}, "
+                               f"write {entry['write_time']:.2f}s, read {entry['read_time']:.2f}s")
+    
+    def draw_timings(self, layout, count=8):
+        """Draw the most recent operator timings"""
+        timings_col = layout.column(align=True)
+        recent = list(instrumentation.records)[-count:]
+        if not recent:
+            timings_col.label(text="No operators recorded yet")
+        for record in reversed(recent):
+            name = record['operator'].split(".")[-1].replace("_", " ").title()
+            timings_col.label(text=f"{name}: {record['wall_time'] * 1000:.0f} ms, "
+                                   f"peak {cache_manager.format_size(record['tracemalloc_peak'])}", icon='TIME')
+        
+        row = layout.row(align=True)
+        row.operator("quick_rigid.export_timings", text="Export", icon='EXPORT')
+        row.operator("quick_rigid.clear_timings", text="Clear", icon='TRASH')
+    
     def draw_settings_box(self, context, layout, settings):
         """Draw the addon settings box"""
         # Addon Settings - collapsible
@@ -338,6 +981,22 @@ class VIEW3D_PT_QuickRigid(bpy.types.Panel):
             
             col.separator()
             
+            # Bakes kept for reuse
+            count, size = bake_store.store_size()
+            store_row = col.row(align=True)
+            store_row.label(text=f"Stored Bakes: {count} ({cache_manager.format_size(size)})", icon='FILE_CACHE')
+            store_row.operator("quick_rigid.clear_bake_store", text="", icon='TRASH')
+            col.prop(settings, "bake_store_limit")
+            
+            col.separator()
+            
+            # Operator timings
+            col.prop(settings, "enable_instrumentation")
+            if settings.enable_instrumentation or instrumentation.records:
+                self.draw_timings(col)
+            
+            col.separator()
+            
             # Documentation link
             doc_row = col.row()
             doc_op = doc_row.operator("wm.url_open", text="Documentation", icon='HELP')
@@ -368,6 +1027,7 @@ class VIEW3D_PT_QuickRigid(bpy.types.Panel):
 
 # List of classes to register
 classes = [
+    VIEW3D_UL_QuickRigidBodies,
     VIEW3D_PT_QuickRigid
 ]
 
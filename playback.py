@@ -0,0 +1,267 @@
+import bpy
+import json
+import time
+import numpy as np
+
+from . import batch
+
+# Per-frame attributes on the playback points, '#' is replaced by the frame number
+LOCATION_ATTRIBUTE = "qr_loc_#"
+ROTATION_ATTRIBUTE = "qr_rot_#"
+SCALE_ATTRIBUTE = "qr_scale"
+SOURCE_ATTRIBUTE = "qr_source"
+
+# Custom property on archived bodies holding the collections they came from
+COLLECTIONS_PROPERTY = "quick_rigid_collections"
+
+# Frames sampled when measuring the cost of a frame change
+TIMING_FRAMES = 8
+
+def matrices_to_euler(rotation):
+    """XYZ Euler angles of scale free rotation matrices (n, 3, 3)"""
+    cos_y = np.hypot(rotation[:, 0, 0], rotation[:, 1, 0])
+    singular = cos_y < 1e-6
+    x = np.where(singular, np.arctan2(-rotation[:, 1, 2], rotation[:, 1, 1]),
+                 np.arctan2(rotation[:, 2, 1], rotation[:, 2, 2]))
+    y = np.arctan2(-rotation[:, 2, 0], cos_y)
+    z = np.where(singular, 0.0, np.arctan2(rotation[:, 1, 0], rotation[:, 0, 0]))
+    return np.stack([x, y, z], axis=1)
+
+def measure_frame_time(scene, frame_start, frame_end):
+    """Average seconds a frame change takes, sampled across the range"""
+    original_frame = scene.frame_current
+    frames = np.unique(np.linspace(frame_start, frame_end, TIMING_FRAMES).astype(int))
+    begin = time.perf_counter()
+    for frame in frames.tolist():
+        scene.frame_set(frame)
+    elapsed = time.perf_counter() - begin
+    scene.frame_set(original_frame)
+    return elapsed / len(frames)
+
+def get_state(settings):
+    """Conversion bookkeeping stored on the scene, or None"""
+    try:
+        return json.loads(settings.playback_state) if settings.playback_state else None
+    except ValueError:
+        return None
+
+def _attribute(mesh, name, data_type, values):
+    attribute = mesh.attributes.new(name, data_type, 'POINT')
+    attribute.data.foreach_set("value" if data_type == 'INT' else "vector", values.ravel())
+
+def _source_objects(objects, collection):
+    """One unlinked-mesh source object per unique mesh and object material combination"""
+    keys = []
+    sources = {}
+    for obj in objects:
+        materials = tuple(slot.material.name if slot.link == 'OBJECT' and slot.material else ""
+                          for slot in obj.material_slots)
+        key = (obj.data.name, materials)
+        if key not in sources:
+            # Collection Info lists children by name, keep the names in index order
+            source = bpy.data.objects.new(f"QR_Source_{len(sources):06d}", obj.data)
+            for index, slot in enumerate(obj.material_slots):
+                if slot.link == 'OBJECT':
+                    source.material_slots[index].link = 'OBJECT'
+                    source.material_slots[index].material = slot.material
+            collection.objects.link(source)
+            sources[key] = len(sources)
+        keys.append(sources[key])
+    return np.array(keys, dtype=np.int32)
+
+def build_node_tree(name, sources, frame_start, frame_end):
+    """Geometry Nodes tree that instances the sources on the points for the current frame"""
+    tree = bpy.data.node_groups.new(name, 'GeometryNodeTree')
+    tree.interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+    tree.interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+    nodes, links = tree.nodes, tree.links
+
+    group_in = nodes.new('NodeGroupInput')
+    group_out = nodes.new('NodeGroupOutput')
+
+    # Attribute names for the current frame, clamped to the baked range
+    scene_time = nodes.new('GeometryNodeInputSceneTime')
+    clamp_low = nodes.new('ShaderNodeMath')
+    clamp_low.operation = 'MAXIMUM'
+    clamp_low.inputs[1].default_value = frame_start
+    clamp_high = nodes.new('ShaderNodeMath')
+    clamp_high.operation = 'MINIMUM'
+    clamp_high.inputs[1].default_value = frame_end
+    frame_text = nodes.new('FunctionNodeValueToString')
+    frame_text.inputs["Decimals"].default_value = 0
+    links.new(scene_time.outputs["Frame"], clamp_low.inputs[0])
+    links.new(clamp_low.outputs[0], clamp_high.inputs[0])
+    links.new(clamp_high.outputs[0], frame_text.inputs["Value"])
+
+    def named_attribute(template, data_type):
+        attribute = nodes.new('GeometryNodeInputNamedAttribute')
+        attribute.data_type = data_type
+        if '#' in template:
+            replace = nodes.new('FunctionNodeReplaceString')
+            replace.inputs["String"].default_value = template
+            replace.inputs["Find"].default_value = "#"
+            links.new(frame_text.outputs["String"], replace.inputs["Replace"])
+            links.new(replace.outputs[0], attribute.inputs["Name"])
+        else:
+            attribute.inputs["Name"].default_value = template
+        return attribute.outputs["Attribute"]
+
+    set_position = nodes.new('GeometryNodeSetPosition')
+    links.new(group_in.outputs[0], set_position.inputs["Geometry"])
+    links.new(named_attribute(LOCATION_ATTRIBUTE, 'FLOAT_VECTOR'), set_position.inputs["Position"])
+
+    collection_info = nodes.new('GeometryNodeCollectionInfo')
+    collection_info.transform_space = 'ORIGINAL'
+    collection_info.inputs["Collection"].default_value = sources
+    collection_info.inputs["Separate Children"].default_value = True
+    collection_info.inputs["Reset Children"].default_value = True
+
+    instance = nodes.new('GeometryNodeInstanceOnPoints')
+    instance.inputs["Pick Instance"].default_value = True
+    links.new(set_position.outputs["Geometry"], instance.inputs["Points"])
+    links.new(collection_info.outputs[0], instance.inputs["Instance"])
+    links.new(named_attribute(SOURCE_ATTRIBUTE, 'INT'), instance.inputs["Instance Index"])
+    links.new(named_attribute(ROTATION_ATTRIBUTE, 'FLOAT_VECTOR'), instance.inputs["Rotation"])
+    links.new(named_attribute(SCALE_ATTRIBUTE, 'FLOAT_VECTOR'), instance.inputs["Scale"])
+    links.new(instance.outputs["Instances"], group_out.inputs[0])
+    return tree
+
+def _archive(scene, objects, archive):
+    """Move bodies into the excluded archive collection, remembering where they were"""
+    world_collection = scene.rigidbody_world.collection
+    for obj in objects:
+        # The world collection has to keep its objects or they lose their rigid body
+        collections = [c for c in obj.users_collection if c != world_collection]
+        obj[COLLECTIONS_PROPERTY] = json.dumps([c.name for c in collections])
+        archive.objects.link(obj)
+        for collection in collections:
+            collection.objects.unlink(obj)
+
+def convert_to_playback(context):
+    """Replace the baked bodies by one point cloud that instances their meshes"""
+    scene = context.scene
+    settings = scene.quick_rigid_settings
+    rbw = scene.rigidbody_world
+    collection = batch.world_bodies(scene)
+    if collection is None:
+        return None
+    is_mesh = np.array([obj.type == 'MESH' for obj in collection], dtype=bool)
+    objects = [obj for obj, mesh in zip(collection, is_mesh) if mesh]
+    if not objects:
+        return None
+
+    point_cache = rbw.point_cache
+    frame_start, frame_end = point_cache.frame_start, point_cache.frame_end
+    time_before = measure_frame_time(scene, frame_start, frame_end)
+    begin = time.perf_counter()
+
+    # Shared source meshes live in a collection that is never shown itself
+    sources = bpy.data.collections.new("QR Playback Sources")
+    source_index = _source_objects(objects, sources)
+
+    mesh = bpy.data.meshes.new("QR Playback")
+    mesh.vertices.add(len(objects))
+
+    # Read the baked transforms frame by frame straight into the point attributes
+    original_frame = scene.frame_current
+    try:
+        for frame in range(frame_start, frame_end + 1):
+            scene.frame_set(frame)
+            matrices = batch.gather_matrices(collection)[is_mesh]
+            scales = batch.world_scales(matrices)
+            rotation = matrices[:, :3, :3] / np.maximum(scales[:, None, :], 1e-12)
+            _attribute(mesh, LOCATION_ATTRIBUTE.replace("#", str(frame)), 'FLOAT_VECTOR',
+                       matrices[:, :3, 3].astype(np.float32))
+            _attribute(mesh, ROTATION_ATTRIBUTE.replace("#", str(frame)), 'FLOAT_VECTOR',
+                       matrices_to_euler(rotation).astype(np.float32))
+            if frame == frame_start:
+                mesh.vertices.foreach_set("co", matrices[:, :3, 3].astype(np.float32).ravel())
+                _attribute(mesh, SCALE_ATTRIBUTE, 'FLOAT_VECTOR', scales.astype(np.float32))
+    finally:
+        scene.frame_set(original_frame)
+
+    _attribute(mesh, SOURCE_ATTRIBUTE, 'INT', source_index)
+
+    playback = bpy.data.objects.new("QR Playback", mesh)
+    playback_collection = bpy.data.collections.new("QR Playback")
+    scene.collection.children.link(playback_collection)
+    playback_collection.objects.link(playback)
+    modifier = playback.modifiers.new("QR Playback", 'NODES')
+    modifier.node_group = build_node_tree("QR Playback", sources, frame_start, frame_end)
+
+    # Archive the originals and stop the world from reading its cache
+    archive = bpy.data.collections.new("QR Archived Bodies")
+    scene.collection.children.link(archive)
+    _archive(scene, objects, archive)
+    context.view_layer.layer_collection.children[archive.name].exclude = True
+    world_enabled = rbw.enabled
+    rbw.enabled = False
+
+    convert_time = time.perf_counter() - begin
+    time_after = measure_frame_time(scene, frame_start, frame_end)
+
+    state = {
+        'object': playback.name,
+        'collection': playback_collection.name,
+        'sources': sources.name,
+        'archive': archive.name,
+        'node_group': modifier.node_group.name,
+        'world_enabled': world_enabled,
+        'bodies': len(objects),
+        'meshes': len(sources.objects),
+        'frames': frame_end - frame_start + 1,
+        'convert_time': convert_time,
+        'time_before': time_before,
+        'time_after': time_after,
+    }
+    settings.playback_state = json.dumps(state)
+    return state
+
+def restore_bodies(context):
+    """Bring the original bodies back and remove the playback objects"""
+    scene = context.scene
+    settings = scene.quick_rigid_settings
+    state = get_state(settings)
+    if state is None:
+        return 0
+
+    archive = bpy.data.collections.get(state['archive'])
+    restored = 0
+    if archive is not None:
+        for obj in list(archive.objects):
+            names = json.loads(obj.get(COLLECTIONS_PROPERTY, "[]"))
+            targets = [bpy.data.collections.get(name) for name in names]
+            targets = [c for c in targets if c is not None] or [scene.collection]
+            for collection in targets:
+                if obj.name not in collection.objects:
+                    collection.objects.link(obj)
+            archive.objects.unlink(obj)
+            del obj[COLLECTIONS_PROPERTY]
+            restored += 1
+        bpy.data.collections.remove(archive)
+
+    playback = bpy.data.objects.get(state['object'])
+    if playback is not None:
+        mesh = playback.data
+        bpy.data.objects.remove(playback)
+        bpy.data.meshes.remove(mesh)
+
+    sources = bpy.data.collections.get(state['sources'])
+    if sources is not None:
+        # Source objects only borrow the meshes of the bodies
+        for obj in list(sources.objects):
+            bpy.data.objects.remove(obj)
+        bpy.data.collections.remove(sources)
+
+    collection = bpy.data.collections.get(state['collection'])
+    if collection is not None:
+        bpy.data.collections.remove(collection)
+
+    node_group = bpy.data.node_groups.get(state['node_group'])
+    if node_group is not None:
+        bpy.data.node_groups.remove(node_group)
+
+    if scene.rigidbody_world is not None:
+        scene.rigidbody_world.enabled = state['world_enabled']
+    settings.playback_state = ""
+    return restored
@@ -0,0 +1,197 @@
+import bpy
+import json
+import numpy as np
+from mathutils import Matrix
+
+from . import batch
+from . import mesh_analysis
+
+# Collision shapes that are built from the mesh itself
+MESH_SHAPES = {'MESH', 'CONVEX_HULL'}
+
+# Thresholds for the checks
+SCALE_TOLERANCE = 0.01
+NON_UNIFORM_RATIO = 1.05
+HEAVY_MESH_TRIANGLES = 10000
+MIN_SIZE = 0.05   # meters, below this the default collision margin dominates
+FLAT_SIZE = 1e-6  # axes thinner than this are flat (ground planes, wall slabs), not small
+MAX_SIZE = 100.0  # meters, above this Bullet loses precision
+MASS_RATIO_LIMIT = 50.0
+OVERLAP_FRACTION = 0.25
+
+# Estimated cost of each issue in "body equivalents": the amount of extra work
+# per frame compared to simulating one ordinary primitive body
+COST_UNAPPLIED_SCALE = 0.25
+COST_NON_UNIFORM_SCALE = 1.0
+COST_PER_MESH_TRIANGLE = 1.0 / 500.0
+COST_BAD_SIZE = 2.0
+COST_PER_MASS_RATIO_DECADE = 2.0
+COST_OVERLAP = 5.0
+
+# Human readable titles and the fix offered for every kind of issue
+ISSUE_KINDS = {
+    'NON_UNIFORM_SCALE': ("Non-uniform scale", 'APPLY_SCALE', "Apply Scale"),
+    'UNAPPLIED_SCALE': ("Unapplied scale", 'APPLY_SCALE', "Apply Scale"),
+    'HEAVY_MESH': ("Mesh shape on dense mesh", 'CONVEX_HULL', "Use Convex Hull"),
+    'TOO_SMALL': ("Too small for default margin", 'SHRINK_MARGIN', "Fit Margin"),
+    'TOO_LARGE': ("Too large for Bullet", 'SELECT', "Select"),
+    'MASS_RATIO': ("Extreme mass ratio in contact", 'CLAMP_MASS', "Clamp Mass"),
+    'OVERLAP': ("Overlapping start positions", 'SELECT', "Select"),
+}
+
+def scan_scene(scene):
+    """Check every rigid body for performance hazards, returns issues ranked by cost"""
+    objects = batch.world_bodies(scene)
+    if objects is None or len(objects) == 0:
+        return []
+
+    unit_scale = scene.unit_settings.scale_length
+    names = [obj.name for obj in objects]
+    is_mesh = np.array([obj.type == 'MESH' for obj in objects])
+    rb = batch.gather_rigid_body(objects, ("type", "collision_shape", "mass", "collision_margin"))
+    is_active = rb["type"] == 'ACTIVE'
+    uses_mesh = np.isin(rb["collision_shape"], list(MESH_SHAPES)) & is_mesh
+
+    # Triangle counts come from the shared mesh analysis, linked duplicates are read once
+    mesh_shaped = [obj for obj, shape in zip(objects, rb["collision_shape"]) if obj.type == 'MESH' and shape == 'MESH']
+    analysis = mesh_analysis.analyze_meshes([obj.data for obj in mesh_shaped])
+    triangles = np.array([analysis[obj.data.session_uid]['triangles']
+                          if obj.type == 'MESH' and obj.data.session_uid in analysis else 0
+                          for obj in objects])
+
+    matrices = batch.gather_matrices(objects)
+    scales = batch.gather_float(objects, "scale", 3)
+    mins, maxs = batch.world_aabbs(matrices, batch.gather_bound_boxes(objects))
+    dimensions = (maxs - mins) * unit_scale
+    world_scale = batch.world_scales(matrices)
+
+    issues = []
+
+    def add(kind, mask, cost_per_object, values=None):
+        indices = np.flatnonzero(mask)
+        if len(indices) == 0:
+            return
+        costs = np.broadcast_to(cost_per_object, mask.shape)[indices]
+        worst = indices[np.argsort(costs)[::-1]]
+        issues.append({
+            'kind': kind,
+            'objects': [names[i] for i in worst],
+            'values': [float(values[i]) for i in worst] if values is not None else [],
+            'cost': float(costs.sum()),
+        })
+
+    # Scale: non-uniform scale is costly for shapes built from the mesh
+    ratio = world_scale.max(axis=1) / np.maximum(world_scale.min(axis=1), 1e-9)
+    non_uniform = (ratio > NON_UNIFORM_RATIO) & uses_mesh
+    unapplied = np.any(np.abs(scales - 1.0) > SCALE_TOLERANCE, axis=1) & ~non_uniform
+    add('NON_UNIFORM_SCALE', non_uniform, COST_NON_UNIFORM_SCALE)
+    add('UNAPPLIED_SCALE', unapplied, COST_UNAPPLIED_SCALE)
+
+    # Dense triangle meshes used as MESH shapes
+    heavy = (rb["collision_shape"] == 'MESH') & (triangles > HEAVY_MESH_TRIANGLES)
+    add('HEAVY_MESH', heavy, triangles * COST_PER_MESH_TRIANGLE)
+
+    # Object sizes outside the range Bullet handles well
+    # Flat axes are skipped, the thinnest remaining extent is what the margin is fitted to
+    extents = maxs - mins
+    thinnest = np.where(extents > FLAT_SIZE, extents, np.inf).min(axis=1)
+    add('TOO_SMALL', thinnest * unit_scale < MIN_SIZE, COST_BAD_SIZE, thinnest)
+    add('TOO_LARGE', dimensions.max(axis=1) > MAX_SIZE, COST_BAD_SIZE)
+
+    # Pairs in contact (or about to be) at the start of the simulation
+    padding = np.maximum(rb["collision_margin"].astype(np.float32), 1e-4)[:, None]
+    pairs = batch.overlapping_pairs(mins - padding, maxs + padding)
+    if len(pairs):
+        a, b = pairs[:, 0], pairs[:, 1]
+        involves_active = is_active[a] | is_active[b]
+        pairs, a, b = pairs[involves_active], a[involves_active], b[involves_active]
+
+    if len(pairs):
+        # Extreme mass ratios between touching active bodies stall the solver
+        masses = rb["mass"].astype(np.float64)
+        both_active = is_active[a] & is_active[b]
+        pair_ratio = np.maximum(masses[a], masses[b]) / np.maximum(np.minimum(masses[a], masses[b]), 1e-9)
+        bad = both_active & (pair_ratio > MASS_RATIO_LIMIT)
+        mass_cost = np.zeros(len(objects))
+        light = np.where(masses[a] < masses[b], a, b)
+        np.add.at(mass_cost, light[bad], np.log10(pair_ratio[bad]) * COST_PER_MASS_RATIO_DECADE)
+
+        # Lightest mass each body can have against its heaviest contact
+        mass_floor = np.zeros(len(objects))
+        np.maximum.at(mass_floor, light[bad], np.maximum(masses[a], masses[b])[bad] / MASS_RATIO_LIMIT)
+        add('MASS_RATIO', mass_cost > 0, mass_cost, mass_floor)
+
+        # Interpenetrating start positions make bodies explode apart
+        inter = np.clip(np.minimum(maxs[a], maxs[b]) - np.maximum(mins[a], mins[b]), 0.0, None).prod(axis=1)
+        volumes = np.maximum((maxs - mins).prod(axis=1), 1e-12)
+        deep = inter / np.minimum(volumes[a], volumes[b]) > OVERLAP_FRACTION
+        overlap_cost = np.zeros(len(objects))
+        np.add.at(overlap_cost, a[deep], COST_OVERLAP / 2)
+        np.add.at(overlap_cost, b[deep], COST_OVERLAP / 2)
+        add('OVERLAP', overlap_cost > 0, overlap_cost)
+
+    issues.sort(key=lambda issue: issue['cost'], reverse=True)
+    return issues
+
+def store_issues(scene, issues):
+    """Store scan results in the scene so the panel can list them"""
+    scene.quick_rigid_issues.clear()
+    for issue in issues:
+        title, fix, _ = ISSUE_KINDS[issue['kind']]
+        item = scene.quick_rigid_issues.add()
+        item.name = title
+        item.kind = issue['kind']
+        item.fix = fix
+        item.cost = issue['cost']
+        item.objects_json = json.dumps(issue['objects'])
+        item.values_json = json.dumps(issue['values'])
+
+def fix_issue(scene, item):
+    """Apply the one-click fix of a stored issue, returns the number of objects changed"""
+    objects = [bpy.data.objects.get(name) for name in item.get_objects()]
+    objects = [obj for obj in objects if obj is not None and obj.rigid_body is not None]
+
+    if item.fix == 'APPLY_SCALE':
+        return apply_scale(objects)
+
+    if item.fix == 'CONVEX_HULL':
+        for obj in objects:
+            obj.rigid_body.collision_shape = 'CONVEX_HULL'
+        return len(objects)
+
+    if item.fix == 'SHRINK_MARGIN':
+        # Keep the margin at a tenth of the thinnest extent the scan measured
+        thinnest = dict(zip(item.get_objects(), item.get_values()))
+        changed = 0
+        for obj in objects:
+            size = thinnest.get(obj.name, 0.0)
+            if size <= 0.0:
+                continue
+            obj.rigid_body.use_margin = True
+            obj.rigid_body.collision_margin = min(obj.rigid_body.collision_margin, size * 0.1)
+            changed += 1
+        return changed
+
+    if item.fix == 'CLAMP_MASS':
+        floors = dict(zip(item.get_objects(), item.get_values()))
+        changed = 0
+        for obj in objects:
+            floor = floors.get(obj.name, 0.0)
+            if obj.rigid_body.mass < floor:
+                obj.rigid_body.mass = floor
+                changed += 1
+        return changed
+
+    return 0
+
+def apply_scale(objects):
+    """Bake object scale into single user meshes, returns the number of objects changed"""
+    changed = 0
+    for obj in objects:
+        # Shared meshes and parents would change other objects too
+        if obj.type != 'MESH' or obj.data.users > 1 or obj.children:
+            continue
+        obj.data.transform(Matrix.Diagonal(obj.scale).to_4x4())
+        obj.scale = (1.0, 1.0, 1.0)
+        changed += 1
+    return changed
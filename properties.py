@@ -1,8 +1,14 @@
 import bpy
-from bpy.props import StringProperty, CollectionProperty, BoolProperty, EnumProperty
+from bpy.props import StringProperty, CollectionProperty, BoolProperty, EnumProperty, IntProperty, FloatProperty
+
+from .sweep import PARAMETER_ITEMS
 
 class QuickRigidSettings(bpy.types.PropertyGroup):
     """Properties to store UI state for QuickRigid addon"""
+    show_dashboard: BoolProperty(
+        name="Show Dashboard",
+        default=False
+    )
     show_add_section: BoolProperty(
         name="Show Add Rigid Body Section",
         default=True
@@ -47,6 +53,206 @@ class QuickRigidSettings(bpy.types.PropertyGroup):
         name="Show Addon Settings",
         default=False
     )
+    show_spatial_select: BoolProperty(
+        name="Show Spatial Selection",
+        default=False
+    )
+    show_preflight: BoolProperty(
+        name="Show Preflight Check",
+        default=False
+    )
+    show_disk_usage: BoolProperty(
+        name="Show Disk Usage",
+        default=False
+    )
+    show_compare: BoolProperty(
+        name="Show Bake Comparison",
+        default=False
+    )
+    show_hotspots: BoolProperty(
+        name="Show Broadphase Hotspots",
+        default=False
+    )
+    show_mesh_sources: BoolProperty(
+        name="Show Mesh Source Optimizer",
+        default=False
+    )
+    show_sweep: BoolProperty(
+        name="Show Parameter Sweep",
+        default=False
+    )
+    show_inspector: BoolProperty(
+        name="Show Body Inspector",
+        default=False
+    )
+    
+    spatial_radius: FloatProperty(
+        name="Radius",
+        description="Search radius around the 3D cursor",
+        default=2.0,
+        min=0.0,
+        subtype='DISTANCE'
+    )
+    
+    spatial_count: IntProperty(
+        name="Count",
+        description="Number of nearest bodies to select",
+        default=10,
+        min=1
+    )
+    
+    spatial_type: EnumProperty(
+        name="Type",
+        description="Only select bodies of this type",
+        items=[
+            ('ANY', "Any", "Active and passive bodies"),
+            ('ACTIVE', "Active", "Only active bodies"),
+            ('PASSIVE', "Passive", "Only passive bodies"),
+        ],
+        default='ANY'
+    )
+    
+    use_settle_detection: BoolProperty(
+        name="Stop When Settled",
+        description="End Quick Bake once every body has come to rest and hold the final state",
+        default=False
+    )
+    
+    settle_speed: FloatProperty(
+        name="Speed Threshold",
+        description="Bodies slower than this (units per second) count as resting",
+        default=0.05,
+        min=0.0,
+        precision=3
+    )
+    
+    settle_energy: FloatProperty(
+        name="Energy Threshold",
+        description="Total kinetic energy below which the scene counts as resting",
+        default=0.01,
+        min=0.0,
+        precision=4
+    )
+    
+    settle_frames: IntProperty(
+        name="Settle Frames",
+        description="Number of resting frames in a row before the bake stops",
+        default=10,
+        min=1
+    )
+    
+    quality_tier: EnumProperty(
+        name="Quality Tier",
+        description="Current quality tier of the rigid body setup",
+        items=[
+            ('DRAFT', "Draft", "Fastest iteration, fewer substeps and iterations, simple shapes, fewer bodies"),
+            ('PREVIEW', "Preview", "Balanced speed and quality"),
+            ('FINAL', "Final", "Your original settings"),
+        ],
+        default='FINAL'
+    )
+    
+    # Final configuration saved while a lower tier is active, as a JSON string
+    tier_backup: StringProperty(
+        name="Tier Backup",
+        description="JSON snapshot of the Final configuration",
+        default=""
+    )
+    
+    # Bookkeeping of the point cloud playback conversion, as a JSON string
+    playback_state: StringProperty(
+        name="Playback State",
+        description="JSON description of the active point cloud playback",
+        default=""
+    )
+    
+    tier_bake_times: StringProperty(
+        name="Tier Bake Times",
+        description="JSON mapping of quality tier to the last measured bake time",
+        default="{}"
+    )
+    
+    use_bake_reuse: BoolProperty(
+        name="Reuse Identical Bakes",
+        description="Restore a stored bake instead of simulating when nothing that affects the simulation changed (needs disk cache)",
+        default=True
+    )
+    
+    bake_store_limit: IntProperty(
+        name="Bake Store Limit",
+        description="Largest size (in MB) of the stored bakes, the least recently used are deleted above it",
+        default=2048,
+        min=16
+    )
+    
+    memory_budget: IntProperty(
+        name="Memory Budget",
+        description="Largest in-memory point cache (in MB) before baking should use the disk cache",
+        default=4096,
+        min=64
+    )
+    
+    auto_spill: BoolProperty(
+        name="Auto Disk Cache",
+        description="Automatically switch to the disk cache when a bake is predicted to exceed the memory budget",
+        default=False
+    )
+    
+    spill_compression: EnumProperty(
+        name="Compression",
+        description="Compression used when switching a large bake to the disk cache",
+        items=[
+            ('NO', "No", "No compression"),
+            ('LIGHT', "Light", "Fast compression"),
+            ('HEAVY', "Heavy", "Slow but smaller compression"),
+        ],
+        default='LIGHT'
+    )
+    
+    mesh_source_tolerance: FloatProperty(
+        name="Tolerance",
+        description="Largest change of the collision shape, relative to its size, that still counts as safe",
+        default=0.05,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR'
+    )
+    
+    inspector_index: IntProperty(
+        name="Inspector Index",
+        description="Body selected in the inspector list",
+        default=-1,
+        update=lambda self, context: self.update_inspector_selection(context)
+    )
+    
+    sweep_sort: EnumProperty(
+        name="Sort By",
+        description="Order of the parameter sweep results",
+        items=[
+            ('index', "Grid Order", "Order in which the runs were defined"),
+            ('time', "Bake Time", "Fastest bake first"),
+            ('settled_frame', "Settle Frame", "Earliest settling run first"),
+            ('spread', "Spread", "Most compact final pile first"),
+            ('energy', "Final Energy", "Calmest final state first"),
+        ],
+        default='index'
+    )
+    
+    hotspot_frame_step: IntProperty(
+        name="Frame Step",
+        description="Analyze every Nth frame of the simulation range",
+        default=1,
+        min=1,
+        max=50
+    )
+    
+    benchmark_frames: IntProperty(
+        name="Benchmark Frames",
+        description="Number of frames simulated for each compression setting in the benchmark",
+        default=20,
+        min=2,
+        max=500
+    )
     
     enable_floating_menu: BoolProperty(
         name="Enable Floating Menu",
@@ -55,6 +261,12 @@ class QuickRigidSettings(bpy.types.PropertyGroup):
         update=lambda self, context: self.update_floating_menu_state()
     )
     
+    enable_instrumentation: BoolProperty(
+        name="Record Operator Timings",
+        description="Record wall time, object count and memory use of every Quick Rigid operator",
+        default=False
+    )
+    
     shortcut_key: EnumProperty(
         name="Key",
         description="Keyboard key for the shortcut",
@@ -107,6 +319,11 @@ class QuickRigidSettings(bpy.types.PropertyGroup):
         default=False
     )
     
+    def update_inspector_selection(self, context):
+        """Select the body clicked in the inspector list"""
+        from .inspector import select_body
+        select_body(context, self.inspector_index)
+    
     def update_floating_menu_state(self):
         """Update keyboard shortcuts when the floating menu is enabled/disabled"""
         from .menus import unregister_keymaps, register_keymaps
@@ -147,10 +364,76 @@ class RigidBodyPresetItem(bpy.types.PropertyGroup):
         import json
         self.settings_json = json.dumps(settings_dict)
 
+class RigidBodyIssueItem(bpy.types.PropertyGroup):
+    """Property group to store a performance issue found by the preflight check"""
+    name: StringProperty(
+        name="Issue",
+        description="Short description of the issue",
+        default=""
+    )
+    kind: StringProperty(
+        name="Kind",
+        description="Identifier of the check that found the issue",
+        default=""
+    )
+    fix: StringProperty(
+        name="Fix",
+        description="Identifier of the fix offered for the issue",
+        default=""
+    )
+    cost: FloatProperty(
+        name="Cost",
+        description="Estimated extra work per frame, in ordinary body equivalents",
+        default=0.0
+    )
+    # Store affected object names (and per object values) as JSON strings
+    objects_json: StringProperty(
+        name="Objects",
+        description="JSON list of the affected object names, worst first",
+        default="[]"
+    )
+    values_json: StringProperty(
+        name="Values",
+        description="JSON list of per object values used by the fix",
+        default="[]"
+    )
+    
+    def get_objects(self):
+        """Convert JSON string to a list of object names"""
+        try:
+            import json
+            return json.loads(self.objects_json)
+        except:
+            return []
+    
+    def get_values(self):
+        """Convert JSON string to a list of per object values"""
+        try:
+            import json
+            return json.loads(self.values_json)
+        except:
+            return []
+
+class RigidBodySweepParameter(bpy.types.PropertyGroup):
+    """Property group to store one row of the parameter sweep grid"""
+    parameter: EnumProperty(
+        name="Parameter",
+        description="Setting varied by the sweep",
+        items=PARAMETER_ITEMS,
+        default='friction'
+    )
+    values: StringProperty(
+        name="Values",
+        description="Comma separated values to try",
+        default="0.2, 0.5, 0.8"
+    )
+
 # List of classes to register
 classes = [
     QuickRigidSettings,
-    RigidBodyPresetItem
+    RigidBodyPresetItem,
+    RigidBodyIssueItem,
+    RigidBodySweepParameter
 ]
 
 def register():
@@ -162,10 +445,14 @@ def register():
     # Add properties to scene
     bpy.types.Scene.quick_rigid_settings = bpy.props.PointerProperty(type=QuickRigidSettings)
     bpy.types.Scene.rigid_body_presets = bpy.props.CollectionProperty(type=RigidBodyPresetItem)
+    bpy.types.Scene.quick_rigid_issues = bpy.props.CollectionProperty(type=RigidBodyIssueItem)
+    bpy.types.Scene.quick_rigid_sweep_parameters = bpy.props.CollectionProperty(type=RigidBodySweepParameter)
 
 def unregister():
     """Unregister property classes"""
     # Remove properties from scene
+    del bpy.types.Scene.quick_rigid_sweep_parameters
+    del bpy.types.Scene.quick_rigid_issues
     del bpy.types.Scene.rigid_body_presets
     del bpy.types.Scene.quick_rigid_settings
     
@@ -0,0 +1,125 @@
+import bpy
+import json
+import numpy as np
+
+from . import batch
+
+# Settings swapped in by each tier. FINAL means the user's own configuration.
+TIERS = {
+    'DRAFT': {
+        'substeps_per_frame': 2,
+        'solver_iterations': 4,
+        'shapes': {'MESH': 'CONVEX_HULL', 'CONVEX_HULL': 'BOX'},
+        # Fraction of the smallest active bodies taken out of the simulation
+        'disable_fraction': 0.5,
+    },
+    'PREVIEW': {
+        'substeps_per_frame': 5,
+        'solver_iterations': 8,
+        'shapes': {'MESH': 'CONVEX_HULL'},
+        'disable_fraction': 0.2,
+    },
+    'FINAL': None,
+}
+
+# Custom property holding a body's own collision shape while a tier replaced it
+SHAPE_PROPERTY = "quick_rigid_tier_shape"
+
+# Collection keeping the bodies a tier took out of the rigid body world
+PARKED_COLLECTION = "Quick Rigid Tier Parked"
+
+def capture_configuration(scene):
+    """Snapshot the world settings a tier can change"""
+    rbw = scene.rigidbody_world
+    return {
+        'substeps_per_frame': rbw.substeps_per_frame,
+        'solver_iterations': rbw.solver_iterations,
+    }
+
+def restore_configuration(scene, config):
+    """Put back the world settings and every body a tier changed"""
+    rbw = scene.rigidbody_world
+    rbw.substeps_per_frame = config['substeps_per_frame']
+    rbw.solver_iterations = config['solver_iterations']
+
+    # Shapes are stored on the objects themselves, so renames don't lose them
+    for obj in bpy.data.objects:
+        shape = obj.get(SHAPE_PROPERTY)
+        if shape is None:
+            continue
+        if obj.rigid_body is not None:
+            obj.rigid_body.collision_shape = shape
+        del obj[SHAPE_PROPERTY]
+
+    parked = bpy.data.collections.get(config.get('parked') or "")
+    if parked is not None:
+        if rbw.collection is not None:
+            for obj in parked.objects:
+                if rbw.collection.objects.get(obj.name) is None:
+                    rbw.collection.objects.link(obj)
+        bpy.data.collections.remove(parked)
+
+def apply_tier_settings(scene, tier):
+    """Swap in the settings of a Draft or Preview tier, returns the name of the parked collection"""
+    rbw = scene.rigidbody_world
+    rbw.substeps_per_frame = tier['substeps_per_frame']
+    rbw.solver_iterations = tier['solver_iterations']
+
+    objects = batch.world_bodies(scene)
+    if objects is None or len(objects) == 0:
+        return None
+    rb = batch.gather_rigid_body(objects, ("type", "collision_shape", "enabled"))
+
+    for obj, shape in zip(objects, rb["collision_shape"].tolist()):
+        replacement = tier['shapes'].get(shape)
+        if replacement is not None:
+            obj[SHAPE_PROPERTY] = shape
+            obj.rigid_body.collision_shape = replacement
+
+    # Take the smallest active bodies out of the world. A disabled body would
+    # still collide as a static body frozen at its start pose.
+    active = np.flatnonzero((rb["type"] == 'ACTIVE') & rb["enabled"].astype(bool))
+    count = int(len(active) * tier['disable_fraction'])
+    if count:
+        dimensions = batch.gather_float(objects, "dimensions", 3)[active]
+        smallest = active[np.argsort(dimensions.prod(axis=1))[:count]]
+        parked = bpy.data.collections.new(PARKED_COLLECTION)
+        # Not linked to any scene, the fake user keeps it through save and reload
+        parked.use_fake_user = True
+        removed = [objects[index] for index in smallest.tolist()]
+        for obj in removed:
+            parked.objects.link(obj)
+        for obj in removed:
+            rbw.collection.objects.unlink(obj)
+        return parked.name
+    return None
+
+def set_tier(scene, name):
+    """Switch the scene to a quality tier, keeping the Final configuration safe"""
+    settings = scene.quick_rigid_settings
+
+    # Always start from the Final configuration so tiers don't stack
+    if settings.tier_backup:
+        restore_configuration(scene, json.loads(settings.tier_backup))
+        settings.tier_backup = ""
+
+    if TIERS[name] is not None:
+        config = capture_configuration(scene)
+        config['parked'] = apply_tier_settings(scene, TIERS[name])
+        settings.tier_backup = json.dumps(config)
+
+    settings.quality_tier = name
+
+def get_bake_times(settings):
+    """Bake time measured for each tier on this scene"""
+    try:
+        return json.loads(settings.tier_bake_times)
+    except ValueError:
+        return {}
+
+def record_bake_time(scene, seconds):
+    """Remember how long a bake took at the current tier"""
+    settings = scene.quick_rigid_settings
+    times = get_bake_times(settings)
+    times[settings.quality_tier] = seconds
+    settings.tier_bake_times = json.dumps(times)
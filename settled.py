@@ -0,0 +1,167 @@
+import bmesh
+import bpy
+import numpy as np
+
+from . import batch
+from . import mesh_analysis
+from .bake import body_speeds
+
+def free_bake(scene):
+    """Free the rigid body cache so the next playback simulates again"""
+    rbw = scene.rigidbody_world
+    point_cache = rbw.point_cache
+    if point_cache.is_baked:
+        with bpy.context.temp_override(scene=scene, point_cache=point_cache):
+            bpy.ops.ptcache.free_bake()
+    else:
+        # Any world setting update resets the unbaked cache
+        rbw.solver_iterations = rbw.solver_iterations
+
+def freeze_state(scene, objects, rest_action='NONE', speed_threshold=0.05, angular_threshold=0.1):
+    """Make the simulated transforms at the current frame the new initial state of bodies"""
+    objects = [obj for obj in objects if obj.rigid_body is not None and not obj.rigid_body.kinematic]
+    if not objects:
+        return None
+
+    # A temporary collection lets all transforms be read and written in single calls
+    temp = bpy.data.collections.new("QR Freeze")
+    try:
+        for obj in objects:
+            temp.objects.link(obj)
+        bodies = temp.objects
+
+        frame = scene.frame_current
+        point_cache = scene.rigidbody_world.point_cache
+        current = batch.gather_matrices(bodies)
+
+        resting = np.zeros(len(bodies), dtype=bool)
+        if rest_action != 'NONE' and frame > point_cache.frame_start:
+            # Compare with the previous cached frame to find the bodies at rest
+            scene.frame_set(frame - 1)
+            previous = batch.gather_matrices(bodies)
+            scene.frame_set(frame)
+            fps = scene.render.fps / scene.render.fps_base
+            speed, angular_speed = body_speeds(previous.astype(np.float64), current.astype(np.float64), fps)
+            resting = (speed <= speed_threshold) & (angular_speed <= angular_threshold)
+
+        free_bake(scene)
+        # Setting the world matrices writes location, rotation and scale (parents included)
+        bodies.foreach_set("matrix_world", current.transpose(0, 2, 1).ravel())
+
+        for obj, rest in zip(bodies, resting.tolist()):
+            if not rest:
+                continue
+            if rest_action == 'PASSIVE':
+                obj.rigid_body.type = 'PASSIVE'
+            elif rest_action == 'DEACTIVATED':
+                obj.rigid_body.use_deactivation = True
+                obj.rigid_body.use_start_deactivated = True
+    finally:
+        bpy.data.collections.remove(temp)
+
+    # Show the new initial state
+    scene.frame_set(point_cache.frame_start)
+    return {'frozen': len(objects), 'resting': int(np.count_nonzero(resting))}
+
+# Faces of the 8 corners of a bounding box, in Blender's corner order
+BOX_FACES = [(0, 1, 2, 3), (4, 7, 6, 5), (0, 4, 5, 1), (1, 5, 6, 2), (2, 6, 7, 3), (3, 7, 4, 0)]
+
+def resting_bodies(scene, frames, speed_threshold=0.05, angular_threshold=0.1):
+    """Mask of active bodies that stayed at rest over the frames up to the current one"""
+    objects = batch.world_bodies(scene)
+    rb = batch.gather_rigid_body(objects, ("type", "kinematic", "enabled"))
+    simulated = (rb["type"] == 'ACTIVE') & ~rb["kinematic"].astype(bool) & rb["enabled"].astype(bool)
+
+    frame = scene.frame_current
+    first = max(frame - frames, scene.rigidbody_world.point_cache.frame_start)
+    fps = scene.render.fps / scene.render.fps_base
+
+    max_speed = np.zeros(len(objects))
+    max_angular = np.zeros(len(objects))
+    previous = None
+    try:
+        for step in range(first, frame + 1):
+            scene.frame_set(step)
+            current = batch.gather_matrices(objects).astype(np.float64)
+            if previous is not None:
+                speed, angular_speed = body_speeds(previous, current, fps)
+                np.maximum(max_speed, speed, out=max_speed)
+                np.maximum(max_angular, angular_speed, out=max_angular)
+            previous = current
+    finally:
+        scene.frame_set(frame)
+
+    if frame == first:
+        return np.zeros(len(objects), dtype=bool)
+    return simulated & (max_speed <= speed_threshold) & (max_angular <= angular_threshold)
+
+def combined_collider_mesh(name, objects, matrices, shape='CONVEX_HULL'):
+    """One mesh holding a simple collision shape of every body, in world space"""
+    bm = bmesh.new()
+    geometry = {}
+    try:
+        for obj, matrix in zip(objects, matrices):
+            if shape == 'BOX' or obj.type != 'MESH':
+                co = np.array(obj.bound_box, dtype=np.float64)
+            else:
+                # Linked duplicates are read once
+                if obj.data.name not in geometry:
+                    geometry[obj.data.name] = mesh_analysis.read_geometry(obj.data)[0].astype(np.float64)
+                co = geometry[obj.data.name]
+            world = co @ matrix[:3, :3].T + matrix[:3, 3]
+
+            verts = [bm.verts.new(point) for point in world.tolist()]
+            if shape == 'BOX' or obj.type != 'MESH':
+                for face in BOX_FACES:
+                    bm.faces.new([verts[i] for i in face])
+            elif len(verts) >= 4:
+                result = bmesh.ops.convex_hull(bm, input=verts)
+                bmesh.ops.delete(bm, geom=result['geom_interior'] + result['geom_unused'], context='VERTS')
+
+        mesh = bpy.data.meshes.new(name)
+        bm.to_mesh(mesh)
+        return mesh
+    finally:
+        bm.free()
+
+def merge_resting(context, frames, shape='CONVEX_HULL', speed_threshold=0.05, angular_threshold=0.1):
+    """Replace bodies that stay at rest by one passive collider, keeping them as visuals"""
+    scene = context.scene
+    world_objects = batch.world_bodies(scene)
+    if world_objects is None:
+        return None
+    bodies_before = len(world_objects)
+
+    resting = resting_bodies(scene, frames, speed_threshold, angular_threshold)
+    if np.count_nonzero(resting) < 2:
+        return None
+    objects = [obj for obj, rest in zip(world_objects, resting.tolist()) if rest]
+    matrices = batch.gather_matrices(world_objects)[resting].astype(np.float64)
+
+    mesh = combined_collider_mesh("Settled Collider", objects, matrices, shape)
+    collider = bpy.data.objects.new("Settled Collider", mesh)
+    scene.collection.objects.link(collider)
+    collider.display_type = 'WIRE'
+    collider.hide_render = True
+
+    # The pieces stay where they came to rest, but leave the simulation
+    free_bake(scene)
+    batch.remove_rigid_bodies(context, objects)
+    temp = bpy.data.collections.new("QR Merge")
+    try:
+        for obj in objects:
+            temp.objects.link(obj)
+        temp.objects.foreach_set("matrix_world", matrices.astype(np.float32).transpose(0, 2, 1).ravel())
+    finally:
+        bpy.data.collections.remove(temp)
+
+    batch.add_rigid_bodies(context, [collider], 'PASSIVE')
+    collider.rigid_body.collision_shape = 'MESH'
+
+    return {
+        'collider': collider,
+        'merged': len(objects),
+        'bodies_before': bodies_before,
+        'bodies_after': len(batch.world_bodies(scene)),
+        'vertices': len(mesh.vertices),
+    }
@@ -0,0 +1,125 @@
+import bpy
+import numpy as np
+from bpy.app.handlers import persistent
+from mathutils import kdtree
+
+from . import batch
+
+# Cached KD-tree of rigid body origins, rebuilt only when transforms change
+_tree = None
+_names = []
+_origins = None
+_types = None
+_scene_name = None
+_dirty = True
+
+def mark_dirty():
+    global _dirty
+    _dirty = True
+
+@persistent
+def on_depsgraph_update(scene, depsgraph):
+    """Invalidate the tree when an object moves or bodies are added or removed"""
+    if _dirty:
+        return
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object) and update.is_updated_transform:
+            mark_dirty()
+            return
+        if isinstance(update.id, bpy.types.Collection):
+            mark_dirty()
+            return
+
+@persistent
+def on_frame_change(scene, depsgraph=None):
+    # The simulation moves every body on frame change
+    mark_dirty()
+
+@persistent
+def on_load(dummy):
+    mark_dirty()
+
+def get_tree(scene):
+    """Return the KD-tree of rigid body origins, rebuilding it if needed"""
+    global _tree, _names, _origins, _types, _scene_name, _dirty
+
+    if _tree is not None and not _dirty and _scene_name == scene.name:
+        return _tree
+
+    objects = batch.world_bodies(scene)
+    count = len(objects) if objects is not None else 0
+    _tree = kdtree.KDTree(count)
+    if count:
+        _origins = batch.gather_matrices(objects)[:, :3, 3].copy()
+        _names = [obj.name for obj in objects]
+        _types = batch.gather_rigid_body(objects, ("type",))["type"]
+        for index, co in enumerate(_origins.tolist()):
+            _tree.insert(co, index)
+    else:
+        _origins = np.empty((0, 3), dtype=np.float32)
+        _names = []
+        _types = np.empty(0, dtype=str)
+    _tree.balance()
+
+    _scene_name = scene.name
+    _dirty = False
+    return _tree
+
+def _matches(index, body_type):
+    return body_type == 'ANY' or _types[index] == body_type
+
+def in_radius(scene, center, radius, body_type='ANY'):
+    """Names of bodies whose origin is within a radius of a point"""
+    tree = get_tree(scene)
+    return [_names[index] for _, index, _ in tree.find_range(center, radius) if _matches(index, body_type)]
+
+def nearest(scene, center, count, body_type='ANY'):
+    """Names of the bodies closest to a point"""
+    tree = get_tree(scene)
+    if body_type == 'ANY':
+        found = tree.find_n(center, count)
+    else:
+        # Widen the search until enough bodies of the wanted type are found
+        found = []
+        wanted = min(count, len(_names))
+        while wanted:
+            found = [hit for hit in tree.find_n(center, wanted) if _matches(hit[1], body_type)]
+            if len(found) >= count or wanted == len(_names):
+                break
+            wanted = min(wanted * 2, len(_names))
+    return [_names[index] for _, index, _ in found[:count]]
+
+def in_bounds(scene, bounds_min, bounds_max, body_type='ANY', below=False):
+    """Names of bodies inside a box, or below its top within its footprint"""
+    tree = get_tree(scene)
+    bounds_min = np.asarray(bounds_min, dtype=np.float32)
+    bounds_max = np.asarray(bounds_max, dtype=np.float32)
+
+    if below:
+        candidates = np.arange(len(_names))
+        lower = bounds_min.copy()
+        lower[2] = -np.inf
+    else:
+        # Only look at bodies within the box's circumscribed sphere
+        center = (bounds_min + bounds_max) / 2.0
+        radius = float(np.linalg.norm(bounds_max - bounds_min)) / 2.0
+        candidates = np.array([index for _, index, _ in tree.find_range(center.tolist(), radius)], dtype=np.int64)
+        lower = bounds_min
+
+    if len(candidates) == 0:
+        return []
+    points = _origins[candidates]
+    inside = np.all((points >= lower) & (points <= bounds_max), axis=1)
+    return [_names[index] for index in candidates[inside] if _matches(index, body_type)]
+
+def register():
+    bpy.app.handlers.depsgraph_update_post.append(on_depsgraph_update)
+    bpy.app.handlers.frame_change_post.append(on_frame_change)
+    bpy.app.handlers.load_post.append(on_load)
+
+def unregister():
+    for handlers, handler in ((bpy.app.handlers.depsgraph_update_post, on_depsgraph_update),
+                              (bpy.app.handlers.frame_change_post, on_frame_change),
+                              (bpy.app.handlers.load_post, on_load)):
+        if handler in handlers:
+            handlers.remove(handler)
@@ -0,0 +1,93 @@
+import bpy
+import numpy as np
+
+from . import batch
+
+def release_frames(count, frame_start, rate):
+    """Frame each pool body is released on, releasing `rate` bodies per frame"""
+    return frame_start + np.floor(np.arange(count) / rate).astype(np.int64)
+
+def spawn_positions(count, center, radius, height, seed=0):
+    """Random positions in a cylinder above the spawn center"""
+    rng = np.random.default_rng(seed)
+    distance = radius * np.sqrt(rng.random(count))
+    angle = rng.random(count) * 2.0 * np.pi
+    positions = np.empty((count, 3), dtype=np.float32)
+    positions[:, 0] = center[0] + distance * np.cos(angle)
+    positions[:, 1] = center[1] + distance * np.sin(angle)
+    positions[:, 2] = center[2] + rng.random(count) * height
+    return positions
+
+def parking_positions(count, hold_position, spacing):
+    """Grid of separate holding spots centered on the hold position, one per pool body"""
+    side = max(int(np.ceil(np.sqrt(count))), 1)
+    index = np.arange(count)
+    positions = np.empty((count, 3), dtype=np.float32)
+    positions[:, 0] = hold_position[0] + (index % side - (side - 1) / 2.0) * spacing
+    positions[:, 1] = hold_position[1] + (index // side - (side - 1) / 2.0) * spacing
+    positions[:, 2] = hold_position[2]
+    return positions
+
+def create_pool(context, templates, count):
+    """Create linked duplicates of the templates as rigid bodies in a new collection"""
+    collection = bpy.data.collections.new("Spawn Pool")
+    context.scene.collection.children.link(collection)
+
+    digits = len(str(count))
+    objects = []
+    for index in range(count):
+        template = templates[index % len(templates)]
+        # Linked duplicates share the template's mesh datablock
+        obj = bpy.data.objects.new(f"{template.name}_spawn_{index:0{digits}d}", template.data)
+        collection.objects.link(obj)
+        objects.append(obj)
+
+    batch.add_rigid_bodies(context, objects, 'ACTIVE')
+
+    # Copy rigid body settings from each template in one call per template
+    for template in templates:
+        if template.rigid_body is None:
+            continue
+        copies = [obj for obj in objects if obj.data == template.data]
+        with context.temp_override(active_object=template, object=template,
+                                   selected_objects=[template] + copies):
+            bpy.ops.rigidbody.object_settings_copy()
+
+    return collection, objects
+
+def key_release(collection, objects, frames, positions, hold_positions, mode):
+    """Hold the pool away from the scene and release each body at its frame"""
+    state = "kinematic" if mode == 'KINEMATIC' else "enabled"
+    state_path = f"rigid_body.{state}"
+    held, released = (1.0, 0.0) if mode == 'KINEMATIC' else (0.0, 1.0)
+
+    # Park everything in one call, each body on its own spot so held bodies never
+    # overlap in the broadphase
+    collection.objects.foreach_set("location", np.asarray(hold_positions, dtype=np.float32).ravel())
+
+    for obj, frame, position in zip(objects, frames.tolist(), positions.tolist()):
+        # The held keys create every F-Curve with the right flags, one insert per property
+        setattr(obj.rigid_body, state, bool(held))
+        obj.keyframe_insert("location", frame=frame - 2)
+        obj.keyframe_insert(state_path, frame=frame - 1)
+
+        # Jump to the spawn position on the frame before release
+        fcurves = batch.object_fcurves(obj)
+        for axis in range(3):
+            batch.append_keyframes(fcurves.find("location", index=axis), [frame - 1], [position[axis]])
+        batch.append_keyframes(fcurves.find(state_path), [frame], [released])
+
+def spawn(context, templates, count, frame_start, rate, center, radius, height,
+          hold_depth=1000.0, mode='KINEMATIC', seed=0):
+    """Build a pool of bodies that are released over time, returns the pool objects"""
+    collection, objects = create_pool(context, templates, count)
+    frames = release_frames(count, frame_start, rate)
+    positions = spawn_positions(count, center, radius, height, seed)
+    hold_position = (center[0], center[1], center[2] - hold_depth)
+    # Twice the largest template keeps neighbouring spots apart whatever their rotation.
+    # Pool bodies are unscaled, so the local bounds count as well as the dimensions.
+    spacing = max(max(max(template.dimensions), float(np.ptp(np.array(template.bound_box), axis=0).max()))
+                  for template in templates) * 2.0 or 1.0
+    hold_positions = parking_positions(count, hold_position, spacing)
+    key_release(collection, objects, frames, positions, hold_positions, mode)
+    return objects, int(frames[-1]) if count else frame_start
@@ -0,0 +1,294 @@
+import bpy
+import itertools
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+import numpy as np
+from bpy.app.handlers import persistent
+
+from . import api
+from . import batch
+from . import bake
+
+# Settings a sweep can vary, per body or on the rigid body world
+BODY_PARAMETERS = ('mass', 'friction', 'restitution', 'linear_damping', 'angular_damping', 'collision_margin')
+WORLD_PARAMETERS = ('substeps_per_frame', 'solver_iterations', 'time_scale')
+INT_PARAMETERS = {'substeps_per_frame', 'solver_iterations'}
+
+PARAMETER_ITEMS = [
+    ('friction', "Friction", "Friction of the swept bodies"),
+    ('restitution', "Bounciness", "Restitution of the swept bodies"),
+    ('mass', "Mass", "Mass of the swept bodies"),
+    ('linear_damping', "Linear Damping", "Linear damping of the swept bodies"),
+    ('angular_damping', "Angular Damping", "Angular damping of the swept bodies"),
+    ('collision_margin', "Margin", "Collision margin of the swept bodies"),
+    ('substeps_per_frame', "Substeps", "Substeps per frame of the rigid body world"),
+    ('solver_iterations', "Solver Iterations", "Solver iterations of the rigid body world"),
+    ('time_scale', "Speed", "Time scale of the rigid body world"),
+    ('preset', "Preset", "Rigid body preset applied to the swept bodies, values are preset names"),
+]
+
+# Sweeps above this many runs are refused, the grid grows quickly
+MAX_RUNS = 256
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.realpath(__file__)), "sweep_worker.py")
+
+# The sweep in progress and the results of the last one, shown in the Sweep box
+_runner = None
+results = []
+# Bodies the last sweep changed, applying a result changes the same ones
+last_targets = []
+
+def parse_values(parameter, text):
+    """Turn the comma separated values of a grid row into a list, raises ValueError"""
+    values = [value.strip() for value in text.split(",") if value.strip()]
+    if not values:
+        raise ValueError(f"No values given for {parameter}")
+    if parameter == 'preset':
+        return values
+    convert = int if parameter in INT_PARAMETERS else float
+    try:
+        return [convert(value) for value in values]
+    except ValueError:
+        raise ValueError(f"Invalid values for {parameter}: {text}")
+
+def build_grid(parameters):
+    """Every combination of the grid rows as a list of {parameter: value}"""
+    names = []
+    value_lists = []
+    for item in parameters:
+        if item.parameter in names:
+            raise ValueError(f"{item.parameter} is in the grid twice")
+        names.append(item.parameter)
+        value_lists.append(parse_values(item.parameter, item.values))
+
+    count = int(np.prod([len(values) for values in value_lists])) if value_lists else 0
+    if count > MAX_RUNS:
+        raise ValueError(f"The grid has {count} runs, the limit is {MAX_RUNS}")
+    return [dict(zip(names, combination)) for combination in itertools.product(*value_lists)]
+
+def sweep_targets(context):
+    """Names of the bodies a sweep changes: the selected bodies, or every active body"""
+    objects = batch.world_bodies(context.scene) or []
+    selected = [obj.name for obj in context.selected_objects if obj.rigid_body is not None and obj.name in objects]
+    if selected:
+        return selected
+    return [obj.name for obj in objects if obj.rigid_body.type == 'ACTIVE']
+
+def apply_parameters(scene, names, params):
+    """Apply one combination of sweep values to the scene"""
+    objects = [bpy.data.objects.get(name) for name in names]
+    objects = [obj for obj in objects if obj is not None and obj.rigid_body is not None]
+
+    # The preset goes first so explicit values in the same run override it
+    if 'preset' in params:
+        api.apply_preset(objects, params['preset'], scene)
+    api.set_settings(objects, **{name: value for name, value in params.items() if name in BODY_PARAMETERS})
+
+    rbw = scene.rigidbody_world
+    for parameter, value in params.items():
+        if parameter in WORLD_PARAMETERS:
+            setattr(rbw, parameter, value)
+
+def measure(scene, speed_threshold, energy_threshold, frames_required):
+    """Simulate the whole range and collect timing and outcome metrics"""
+    detector = bake.SettleDetector(scene, speed_threshold, energy_threshold, frames_required)
+    job = bake.BakeJob(scene)
+    job.start()
+    detector.update(job.frame)
+
+    # Keep simulating after settling, the spread and energy are measured at the end
+    settled_frame = None
+    peak_energy = 0.0
+    more = True
+    while more:
+        more = job.step()
+        if detector.update(job.frame) and settled_frame is None:
+            settled_frame = detector.settled_frame
+        peak_energy = max(peak_energy, detector.energy or 0.0)
+    job.end_time = time.perf_counter()
+
+    # Spread of the active bodies around their common center at the last frame
+    positions = batch.gather_matrices(detector.objects)[detector.active][:, :3, 3].astype(np.float64)
+    spread = float(np.sqrt(np.mean(np.sum((positions - positions.mean(axis=0)) ** 2, axis=1)))) if len(positions) else 0.0
+
+    return {
+        'time': job.elapsed,
+        'frames': job.frames_done,
+        'settled_frame': settled_frame,
+        'spread': spread,
+        'energy': detector.energy or 0.0,
+        'peak_energy': peak_energy,
+    }
+
+def run_job(job_path):
+    """Entry point of a background worker: apply one run's values and measure it"""
+    with open(job_path) as f:
+        job = json.load(f)
+
+    scene = bpy.context.scene
+    point_cache = scene.rigidbody_world.point_cache
+    # Workers share the directory of the copied file, keep their caches in memory
+    if point_cache.is_baked:
+        with bpy.context.temp_override(scene=scene, point_cache=point_cache):
+            bpy.ops.ptcache.free_bake()
+    point_cache.use_disk_cache = False
+    point_cache.use_external = False
+
+    try:
+        apply_parameters(scene, job['targets'], job['params'])
+        result = measure(scene, job['speed_threshold'], job['energy_threshold'], job['settle_frames'])
+    except Exception as e:
+        result = {'error': str(e)}
+
+    result['params'] = job['params']
+    with open(job['result_path'], "w") as f:
+        json.dump(result, f)
+
+class SweepRunner:
+    """Runs one background Blender process per grid combination, a few at a time"""
+
+    def __init__(self, blend_path, directory, runs, targets, settle, workers=None):
+        self.blend_path = blend_path
+        self.directory = directory
+        self.pending = list(enumerate(runs))
+        self.total = len(runs)
+        self.running = {}
+        self.results = []
+        # Half the cores so runs don't compete for them, their times stay comparable
+        self.workers = max(1, min(workers or (os.cpu_count() or 1) // 2, self.total))
+        self.targets = targets
+        self.settle = settle
+        self.cancelled = False
+        self.start_time = time.perf_counter()
+
+    @property
+    def done(self):
+        return len(self.results)
+
+    def _launch(self, index, params):
+        job_path = os.path.join(self.directory, f"job_{index:03d}.json")
+        result_path = os.path.join(self.directory, f"result_{index:03d}.json")
+        with open(job_path, "w") as f:
+            json.dump({
+                'params': params,
+                'targets': self.targets,
+                'result_path': result_path,
+                'speed_threshold': self.settle[0],
+                'energy_threshold': self.settle[1],
+                'settle_frames': self.settle[2],
+            }, f)
+
+        # Headless Blender without user settings, the worker loads this package itself
+        command = [bpy.app.binary_path, "--background", "--factory-startup", self.blend_path,
+                   "--python", WORKER_SCRIPT, "--", __package__, job_path]
+        process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.running[index] = (process, params, result_path)
+
+    def poll(self):
+        """Collect finished workers and start new ones, returns False once all runs are done"""
+        for index, (process, params, result_path) in list(self.running.items()):
+            if process.poll() is None:
+                continue
+            del self.running[index]
+            try:
+                with open(result_path) as f:
+                    result = json.load(f)
+            except (OSError, ValueError):
+                result = {'params': params, 'error': f"Worker exited with code {process.returncode}"}
+            result['index'] = index
+            self.results.append(result)
+
+        while not self.cancelled and self.pending and len(self.running) < self.workers:
+            self._launch(*self.pending.pop(0))
+        return bool(self.running or (self.pending and not self.cancelled))
+
+    def cancel(self):
+        """Stop every running worker and skip the runs that haven't started"""
+        self.cancelled = True
+        self.pending.clear()
+        for process, _, _ in self.running.values():
+            process.kill()
+
+def get_runner():
+    """Return the running sweep, or None"""
+    return _runner
+
+def start_sweep(context, runs):
+    """Save a copy of the file and start baking every run in the background"""
+    global _runner, results, last_targets
+    settings = context.scene.quick_rigid_settings
+    directory = tempfile.mkdtemp(prefix="quick_rigid_sweep_")
+    blend_path = os.path.join(directory, "sweep.blend")
+    bpy.ops.wm.save_as_mainfile(filepath=blend_path, copy=True)
+
+    settle = (settings.settle_speed, settings.settle_energy, settings.settle_frames)
+    results = []
+    last_targets = sweep_targets(context)
+    _runner = SweepRunner(blend_path, directory, runs, last_targets, settle)
+    _runner.poll()
+    bpy.app.timers.register(_poll_sweep, first_interval=0.5)
+    return _runner
+
+def _poll_sweep():
+    """Timer callback that keeps the process pool full and publishes results"""
+    global _runner, results
+    if _runner is None:
+        return None
+    more = _runner.poll()
+    results = sorted(_runner.results, key=lambda result: result['index'])
+    bake.redraw_ui(bpy.context)
+    if more:
+        return 0.5
+
+    shutil.rmtree(_runner.directory, ignore_errors=True)
+    _runner = None
+    return None
+
+def cancel_sweep():
+    """Stop the running sweep, results of finished runs are kept"""
+    if _runner is not None:
+        _runner.cancel()
+
+def stop_sweep():
+    """Kill the running sweep and its timer right away, used when the addon or file goes away"""
+    global _runner
+    if bpy.app.timers.is_registered(_poll_sweep):
+        bpy.app.timers.unregister(_poll_sweep)
+    if _runner is not None:
+        _runner.cancel()
+        for process, _, _ in _runner.running.values():
+            process.wait()
+        shutil.rmtree(_runner.directory, ignore_errors=True)
+        _runner = None
+
+@persistent
+def on_load(dummy):
+    """Results and targets belong to the file the sweep was started from"""
+    global results, last_targets
+    stop_sweep()
+    results = []
+    last_targets = []
+
+def sorted_results(key):
+    """Results ordered for the table, failed runs last"""
+    def sort_key(result):
+        value = result.get(key)
+        return (value is None, value if value is not None else 0.0)
+    return sorted(results, key=sort_key)
+
+def format_params(params):
+    """Short label of the values used by one run"""
+    return ", ".join(f"{name}={value:g}" if isinstance(value, (int, float)) else f"{name}={value}"
+                     for name, value in params.items())
+
+def register():
+    bpy.app.handlers.load_post.append(on_load)
+
+def unregister():
+    stop_sweep()
+    if on_load in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(on_load)
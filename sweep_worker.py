@@ -0,0 +1,19 @@
+# Run by background Blender processes started by a parameter sweep:
+#   blender --background file.blend --python sweep_worker.py -- <package> <job.json>
+import importlib
+import os
+import sys
+import types
+
+def main():
+    package, job_path = sys.argv[sys.argv.index("--") + 1:][:2]
+
+    # Load the add-on modules without registering anything
+    if package not in sys.modules:
+        module = types.ModuleType(package)
+        module.__path__ = [os.path.dirname(os.path.realpath(__file__))]
+        sys.modules[package] = module
+    sweep = importlib.import_module(package + ".sweep")
+    sweep.run_job(job_path)
+
+main()